@@ -2,8 +2,11 @@
 """
 ETL - Extracción de datos de BloomFitness a CSV
 
-Este script conecta directamente a la base de datos SQLite y exporta
-los datos a archivos CSV para análisis externo.
+Este script lee el snapshot de solo lectura para reportes
+(data/gym_access_reporting.db) y exporta los datos a archivos CSV para
+análisis externo. Si el snapshot no existe o es más viejo que la ventana
+de frescura (BLOOM_REPORTING_MAX_AGE), se publica uno nuevo antes de leer;
+la base en uso nunca se lee directamente.
 
 Uso:
     python etl/extract_to_csv.py
@@ -12,11 +15,17 @@ Los archivos CSV se generarán en la carpeta etl/output/
 """
 import csv
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 
+# Permitir importar src/ al ejecutar el script directamente
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import DATABASE_PATH as DB_PATH
+from src.db.database import ensure_reporting_snapshot
+
 # Configuración
-DB_PATH = Path(__file__).parent.parent / "data" / "gym_access.db"
 OUTPUT_DIR = Path(__file__).parent / "output"
 
 
@@ -27,10 +36,10 @@ def ensure_output_dir():
 
 def get_connection():
     """
-    Obtiene una conexión a la base de datos SQLite.
+    Obtiene una conexión de solo lectura al snapshot de reportes.
     
     Returns:
-        sqlite3.Connection: Conexión a la base de datos
+        sqlite3.Connection: Conexión al snapshot
     """
     if not DB_PATH.exists():
         raise FileNotFoundError(
@@ -38,7 +47,8 @@ def get_connection():
             "Asegúrese de haber ejecutado la aplicación al menos una vez."
         )
     
-    conn = sqlite3.connect(str(DB_PATH))
+    snapshot_path = ensure_reporting_snapshot()
+    conn = sqlite3.connect(f"file:{snapshot_path.as_posix()}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row  # Para acceder a columnas por nombre
     return conn
 
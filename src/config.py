@@ -26,6 +26,28 @@ DATA_DIR.mkdir(exist_ok=True)
 DATABASE_PATH = DATA_DIR / "gym_access.db"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
+# Snapshot de solo lectura para reportes y analítica (no bloquea la puerta)
+REPORTING_DB_PATH = DATA_DIR / "gym_access_reporting.db"
+# Antigüedad máxima del snapshot antes de volver a publicarlo (segundos)
+REPORTING_MAX_AGE = int(os.environ.get("BLOOM_REPORTING_MAX_AGE", "300"))
+
+# Mantenimiento de la base (optimize, ANALYZE, vacuum incremental, checkpoint WAL)
+MAINTENANCE_IDLE_MINUTES = 30    # Minutos sin lecturas de tarjeta para considerar el sistema ocioso
+MAINTENANCE_INTERVAL_HOURS = 24  # Tiempo mínimo entre dos mantenimientos completos
+
+# Consola de eventos de la vista RFID: líneas que se conservan en memoria y
+# copia opcional en un archivo rotativo (BLOOM_RFID_EVENT_LOG=1)
+RFID_EVENT_LOG_CAPACITY = 1000
+RFID_EVENT_LOG_PATH = DATA_DIR / "rfid_events.log" if os.environ.get("BLOOM_RFID_EVENT_LOG", "0") == "1" else None
+RFID_EVENT_LOG_MAX_BYTES = 1_000_000  # Tamaño de cada archivo antes de rotar
+RFID_EVENT_LOG_BACKUPS = 3            # Archivos anteriores que se conservan
+
+# Panel de recepción: últimos accesos que se muestran, permanencia estimada
+# de un socio para calcular la ocupación y días del aviso de vencimientos
+DASHBOARD_RECENT_ACCESSES = 15
+DASHBOARD_STAY_MINUTES = 90
+DASHBOARD_EXPIRING_DAYS = 7
+
 # Configuración del puerto serial para Arduino
 SERIAL_PORT = "COM3"  # Cambiar según el puerto donde está conectado el Arduino
 BAUDRATE = 9600
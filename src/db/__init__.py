@@ -1,6 +1,6 @@
 # Database module
-from src.db.database import get_db, init_db
+from src.db.database import get_db, get_reporting_db, init_db
 from src.db.models import User, AccessLog
 from src.db.repository import UserRepository, AccessLogRepository
 
-__all__ = ['get_db', 'init_db', 'User', 'AccessLog', 'UserRepository', 'AccessLogRepository']
+__all__ = ['get_db', 'get_reporting_db', 'init_db', 'User', 'AccessLog', 'UserRepository', 'AccessLogRepository']
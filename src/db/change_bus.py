@@ -0,0 +1,153 @@
+"""
+Bus de eventos de cambios en los datos.
+
+Los repositorios publican aquí después de cada commit y las vistas se
+enteran para actualizar solo las filas afectadas, en lugar de recargar.
+El bus no depende de Qt: acumula los cambios en lotes y avisa a un
+oyente con un callback común; la UI lo adapta a señales (ver
+src/services/change_notifier.py). Sin oyente (ETL, scripts) solo se
+incrementan las versiones de datos.
+"""
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from src.db.database import bump_data_version, get_data_version
+from src.db.models import User, AccessLog
+from src.db.rows import AccessRow
+
+
+# Tablas cuyas escrituras se publican
+CHANGE_TABLES = (User.__tablename__, AccessLog.__tablename__)
+
+# Con más socios modificados en un mismo lote se avisa un único cambio masivo
+MEMBER_EVENTS_MAX = 100
+
+_bus: Optional["ChangeBus"] = None
+
+
+def get_change_bus() -> "ChangeBus":
+    """Obtiene el bus de cambios compartido."""
+    global _bus
+    if _bus is None:
+        _bus = ChangeBus()
+    return _bus
+
+
+class ChangeBatch(NamedTuple):
+    """Cambios publicados desde el lote anterior."""
+    member_ids: List[int]           # Socios creados, modificados o eliminados, sin repetir
+    bulk: bool                      # Cambio masivo: conviene recargar
+    access_rows: List[AccessRow]    # Accesos registrados, en orden
+    versions: Dict[str, int]        # Versión de CHANGE_TABLES con el lote incluido
+
+
+class ChangeBus:
+    """
+    Publica los cambios confirmados en la base, agrupados por lote.
+    
+    Las publicaciones no se entregan en el momento: se acumulan hasta que
+    el oyente retira el lote con take_batch(). Al abrirse un lote (primera
+    publicación desde el último retiro) se llama al oyente, desde el hilo
+    que publica; el oyente no debe hacer trabajo pesado ahí, solo programar
+    el retiro. Varias escrituras de un mismo socio cuentan una sola vez, y
+    si en el lote cambiaron más de MEMBER_EVENTS_MAX socios se marca como
+    cambio masivo.
+    
+    Publicar también incrementa la versión de datos de las tablas escritas
+    (ver get_data_version), haya oyente o no.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listener: Optional[Callable[[], None]] = None
+        self._member_ids = {}      # dict como conjunto ordenado
+        self._bulk = False
+        self._access_rows = []
+        self._scheduled = False
+    
+    def set_listener(self, listener: Optional[Callable[[], None]]):
+        """
+        Registra quien retira los lotes (o lo quita con None).
+        
+        Solo se acumulan las publicaciones posteriores al registro.
+        """
+        with self._lock:
+            self._listener = listener
+            self._member_ids, self._bulk, self._access_rows = {}, False, []
+            self._scheduled = False
+    
+    # --- Publicación (repositorios, después del commit) ---
+    
+    def publish_member_changed(self, user_id: int, logs_changed: bool = False):
+        """
+        Publica el cambio de un socio.
+        
+        Args:
+            user_id: ID del socio creado, modificado o eliminado
+            logs_changed: También se modificaron sus registros de acceso
+        """
+        tables = (User.__tablename__,)
+        if logs_changed:
+            tables += (AccessLog.__tablename__,)
+        with self._lock:
+            bump_data_version(*tables)
+            if self._listener is None:
+                return
+            self._member_ids[user_id] = None
+            listener = self._open_batch()
+        if listener is not None:
+            listener()
+    
+    def publish_members_bulk_changed(self):
+        """Publica un cambio que afecta a muchos socios (actualización por lotes)."""
+        with self._lock:
+            bump_data_version(User.__tablename__)
+            if self._listener is None:
+                return
+            self._bulk = True
+            listener = self._open_batch()
+        if listener is not None:
+            listener()
+    
+    def publish_access_logged(self, row: AccessRow):
+        """
+        Publica un acceso registrado.
+        
+        Args:
+            row: Fila del acceso
+        """
+        with self._lock:
+            bump_data_version(AccessLog.__tablename__)
+            if self._listener is None:
+                return
+            self._access_rows.append(row)
+            listener = self._open_batch()
+        if listener is not None:
+            listener()
+    
+    # --- Retiro (oyente) ---
+    
+    def take_batch(self) -> Optional[ChangeBatch]:
+        """
+        Retira los cambios acumulados.
+        
+        Returns:
+            El lote, o None si no se publicó nada desde el último retiro
+        """
+        with self._lock:
+            if not self._scheduled:
+                return None
+            member_ids, self._member_ids = list(self._member_ids), {}
+            bulk = self._bulk or len(member_ids) > MEMBER_EVENTS_MAX
+            self._bulk = False
+            access_rows, self._access_rows = self._access_rows, []
+            self._scheduled = False
+            versions = dict(zip(CHANGE_TABLES, get_data_version(*CHANGE_TABLES)))
+        return ChangeBatch([] if bulk else member_ids, bulk, access_rows, versions)
+    
+    def _open_batch(self) -> Optional[Callable[[], None]]:
+        """Marca el lote como abierto; devuelve el oyente a avisar si recién se abrió (con el lock tomado)."""
+        if self._scheduled:
+            return None
+        self._scheduled = True
+        return self._listener
@@ -1,10 +1,20 @@
 """
 Configuración de conexión a la base de datos SQLite.
 """
-from sqlalchemy import create_engine
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateColumn, CreateIndex, CreateTable
 
-from src.config import DATABASE_URL
+from src.config import DATABASE_URL, REPORTING_DB_PATH, REPORTING_MAX_AGE
 from src.db.models import Base
 
 
@@ -12,6 +22,31 @@ from src.db.models import Base
 _engine = None
 _SessionLocal = None
 
+# Motor de solo lectura sobre el snapshot de reportes
+_reporting_engine = None
+_ReportingSessionLocal = None
+_reporting_lock = threading.Lock()
+
+# Versión de los datos por tabla: cada escritura confirmada la incrementa
+_data_versions = {}
+_data_versions_lock = threading.Lock()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Configura cada conexión nueva.
+    
+    WAL permite que las lecturas (vistas, reportes, backups) no bloqueen
+    las escrituras del control de acceso y viceversa. auto_vacuum solo tiene
+    efecto en una base nueva; las existentes se convierten en el
+    mantenimiento programado.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 
 def get_engine():
     """Obtiene o crea el motor de base de datos."""
@@ -22,6 +57,7 @@ def get_engine():
             echo=False,  # Cambiar a True para ver queries SQL
             connect_args={"check_same_thread": False}  # Necesario para SQLite con threads
         )
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
     return _engine
 
 
@@ -29,7 +65,14 @@ def get_session_factory():
     """Obtiene o crea la fábrica de sesiones."""
     global _SessionLocal
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+        # expire_on_commit=False: tras el commit los objetos conservan sus
+        # valores (incluido el id generado), sin un SELECT extra al leerlos.
+        _SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_engine()
+        )
     return _SessionLocal
 
 
@@ -51,20 +94,257 @@ def get_db() -> Session:
     return SessionLocal()
 
 
+def bump_data_version(*tables: str):
+    """
+    Marca como modificadas las tablas indicadas (llamar tras el commit).
+    
+    Args:
+        tables: Nombres de las tablas escritas
+    """
+    with _data_versions_lock:
+        for table in tables:
+            _data_versions[table] = _data_versions.get(table, 0) + 1
+
+
+def get_data_version(*tables: str) -> tuple:
+    """
+    Obtiene la versión actual de los datos de las tablas indicadas.
+    
+    Las vistas la guardan al cargar y la comparan antes de volver a
+    consultar: si no cambió, lo que muestran sigue vigente. Solo refleja
+    las escrituras hechas por esta aplicación.
+    
+    Args:
+        tables: Nombres de las tablas
+    
+    Returns:
+        Tupla con la versión de cada tabla, en el mismo orden
+    """
+    with _data_versions_lock:
+        return tuple(_data_versions.get(table, 0) for table in tables)
+
+
+def _schema_fingerprint(engine: Engine) -> int:
+    """
+    Calcula una huella del esquema declarado en los modelos.
+    
+    Se deriva del DDL de tablas e índices, así que cambia ante cualquier
+    modificación de los modelos. Se trunca a 28 bits para que entre en
+    PRAGMA user_version (entero de 32 bits con signo).
+    """
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=engine.dialect)))
+    digest = hashlib.sha1("\n".join(ddl).encode("utf-8")).hexdigest()
+    return int(digest[:7], 16)
+
+
+def _add_missing_columns(engine: Engine) -> set:
+    """
+    Agrega a las tablas existentes las columnas nuevas de los modelos.
+    
+    create_all no modifica tablas ya creadas, así que las columnas
+    agregadas a los modelos se incorporan con ALTER TABLE ADD COLUMN.
+    
+    Returns:
+        Conjunto de columnas agregadas como "tabla.columna"
+    """
+    added = set()
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {
+                row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table.name})")
+            }
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+                added.add(f"{table.name}.{column.name}")
+    return added
+
+
 def init_db():
     """
-    Inicializa la base de datos creando todas las tablas.
+    Inicializa la base de datos creando las tablas e índices faltantes.
     Debe llamarse al iniciar la aplicación.
+    
+    Si la huella guardada en PRAGMA user_version coincide con la del código,
+    el esquema ya está al día y se omite la reflexión de create_all.
     """
     engine = get_engine()
+    fingerprint = _schema_fingerprint(engine)
+    
+    with engine.connect() as conn:
+        stored = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    
+    if stored == fingerprint:
+        return
+    
     Base.metadata.create_all(bind=engine)
+    added_columns = _add_missing_columns(engine)
+    
+    # create_all no agrega índices nuevos a tablas que ya existían
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    
+    # Columnas de asistencia recién creadas: poblarlas desde el historial
+    if "users.total_accesos" in added_columns:
+        from src.db.repository import UserRepository
+        db = get_db()
+        try:
+            count = UserRepository(db).rebuild_access_stats()
+            print(f"Estadísticas de asistencia reconstruidas para {count} usuario(s).")
+        finally:
+            db.close()
+    
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {fingerprint}")
+    
     print(f"Base de datos inicializada en: {DATABASE_URL}")
 
 
+def backup_database(dest: Path):
+    """
+    Copia la base de datos en uso a `dest` de forma consistente.
+    
+    Usa la API de backup de SQLite, que incluye lo que todavía está en el
+    archivo WAL (una copia del archivo .db no lo haría). En modo WAL la
+    lectura no bloquea las escrituras del control de acceso. La copia queda
+    en modo de journal clásico: un único archivo, sin -wal ni -shm.
+    
+    Args:
+        dest: Ruta del archivo destino (se sobrescribe)
+    """
+    raw = get_engine().raw_connection()
+    try:
+        target = sqlite3.connect(str(dest))
+        try:
+            raw.driver_connection.backup(target)
+            target.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target.close()
+    finally:
+        raw.close()
+
+
+def publish_reporting_snapshot() -> Path:
+    """
+    Publica un snapshot consistente de la base en REPORTING_DB_PATH.
+    
+    Se escribe en un archivo temporal y luego se reemplaza el anterior,
+    así los lectores nunca ven un snapshot a medio copiar.
+    
+    Returns:
+        Ruta del snapshot publicado
+    
+    Raises:
+        OSError: si el snapshot anterior está abierto por otro programa
+            y no puede reemplazarse (Windows)
+    """
+    with _reporting_lock:
+        tmp_path = REPORTING_DB_PATH.with_name(REPORTING_DB_PATH.name + ".tmp")
+        backup_database(tmp_path)
+        os.replace(tmp_path, REPORTING_DB_PATH)
+    return REPORTING_DB_PATH
+
+
+def reporting_snapshot_time() -> float | None:
+    """
+    Momento de publicación del snapshot de reportes (None si no existe).
+    
+    Sirve como versión de los datos del snapshot: cambia con cada publicación.
+    """
+    try:
+        return REPORTING_DB_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def reporting_snapshot_age() -> float | None:
+    """Antigüedad del snapshot de reportes en segundos (None si no existe)."""
+    published = reporting_snapshot_time()
+    return None if published is None else time.time() - published
+
+
+def ensure_reporting_snapshot(max_age: float = None) -> Path:
+    """
+    Garantiza que el snapshot de reportes no sea más viejo que `max_age`.
+    
+    Args:
+        max_age: Antigüedad máxima en segundos (default REPORTING_MAX_AGE)
+    
+    Returns:
+        Ruta del snapshot
+    """
+    max_age = REPORTING_MAX_AGE if max_age is None else max_age
+    age = reporting_snapshot_age()
+    if age is None or age > max_age:
+        try:
+            publish_reporting_snapshot()
+        except OSError as e:
+            # Un programa externo tiene abierto el snapshot: se sigue usando el anterior
+            if age is None:
+                raise
+            print(f"No se pudo actualizar el snapshot de reportes: {e}")
+    return REPORTING_DB_PATH
+
+
+def get_reporting_engine():
+    """
+    Obtiene o crea el motor de solo lectura sobre el snapshot de reportes.
+    
+    Usa NullPool para no dejar conexiones abiertas sobre el archivo, que
+    se reemplaza en cada publicación.
+    """
+    global _reporting_engine
+    if _reporting_engine is None:
+        _reporting_engine = create_engine(
+            f"sqlite:///file:{REPORTING_DB_PATH.as_posix()}?mode=ro&uri=true",
+            echo=False,
+            poolclass=NullPool,
+            connect_args={"check_same_thread": False}
+        )
+    return _reporting_engine
+
+
+def get_reporting_db(max_age: float = None) -> Session:
+    """
+    Obtiene una sesión de solo lectura sobre el snapshot de reportes.
+    
+    Las consultas pesadas (estadísticas, exportaciones) deben usar esta
+    sesión para no competir con el registro de accesos en la base en uso.
+    
+    Args:
+        max_age: Antigüedad máxima aceptable del snapshot en segundos
+            (default REPORTING_MAX_AGE)
+    
+    Returns:
+        Session: Sesión de SQLAlchemy de solo lectura
+    """
+    global _ReportingSessionLocal
+    ensure_reporting_snapshot(max_age)
+    if _ReportingSessionLocal is None:
+        _ReportingSessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_reporting_engine()
+        )
+    return _ReportingSessionLocal()
+
+
 def close_db():
     """Cierra la conexión a la base de datos."""
-    global _engine, _SessionLocal
+    global _engine, _SessionLocal, _reporting_engine, _ReportingSessionLocal
     if _engine is not None:
         _engine.dispose()
         _engine = None
         _SessionLocal = None
+    if _reporting_engine is not None:
+        _reporting_engine.dispose()
+        _reporting_engine = None
+        _ReportingSessionLocal = None
@@ -4,7 +4,7 @@ Modelos de base de datos SQLAlchemy para BloomFitness.
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import String, Boolean, Date, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, Boolean, Integer, Date, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from src.utils.enums import PlanType, AccessResult, AccessReason, PaymentMethod
@@ -38,6 +38,10 @@ class User(Base):
     # Estado
     activo: Mapped[bool] = mapped_column(Boolean, default=True)
     
+    # Asistencia (desnormalizada, se mantiene con cada acceso permitido)
+    ultimo_acceso: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    total_accesos: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -64,9 +68,25 @@ class User(Base):
         return (self.fecha_fin_plan - date.today()).days
 
 
+# Búsqueda por prefijo de apellido/nombre (LIKE 'texto%'): el índice debe
+# usar NOCASE porque LIKE en SQLite no distingue mayúsculas
+Index("ix_users_apellido_nocase", User.apellido.collate("NOCASE"))
+Index("ix_users_nombre_nocase", User.nombre.collate("NOCASE"))
+
+
 class AccessLog(Base):
     """Modelo de registro de accesos."""
     __tablename__ = "access_logs"
+    __table_args__ = (
+        # Historial por usuario y reconstrucción de estadísticas de asistencia
+        Index("ix_access_logs_user_timestamp", "user_id", "timestamp"),
+        # Listado paginado por fecha (keyset sobre timestamp + id)
+        Index("ix_access_logs_timestamp", "timestamp"),
+        # Listado ordenado por tarjeta, resultado o motivo (ver ACCESS_SORT_KEYS)
+        Index("ix_access_logs_rfid_timestamp", "rfid_uid", "timestamp"),
+        Index("ix_access_logs_resultado_timestamp", "resultado", "timestamp"),
+        Index("ix_access_logs_motivo_timestamp", "motivo", "timestamp"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
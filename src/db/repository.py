@@ -2,17 +2,181 @@
 Repositorios para acceso a datos (patrón Repository).
 """
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import func
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import case, func, or_, tuple_, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.expression import UnaryExpression
+from sqlalchemy.sql.operators import custom_op
 
+from src.db.change_bus import get_change_bus
 from src.db.models import User, AccessLog
+from src.db.rows import MemberRow, CardRow, QuickSearchRow, AccessRow, MemberChange
 from src.utils.enums import PlanType, AccessResult, AccessReason, PaymentMethod
 from src.utils.dates import calcular_fecha_fin
 from src.utils.rfid import normalize_rfid_uid
 
 
+# Campos de las filas livianas de usuario (search_rows / get_row), en orden
+USER_ROW_FIELDS = MemberRow._fields
+USER_ROW_COLUMNS = tuple(getattr(User, name) for name in USER_ROW_FIELDS)
+
+# Campos de las filas de tarjetas asignadas (card_rows), en orden
+CARD_ROW_FIELDS = CardRow._fields
+CARD_ROW_COLUMNS = tuple(getattr(User, name) for name in CARD_ROW_FIELDS)
+
+# Campos del índice de búsqueda rápida (quick_search_rows), en orden
+QUICK_SEARCH_FIELDS = QuickSearchRow._fields
+QUICK_SEARCH_COLUMNS = tuple(getattr(User, name) for name in QUICK_SEARCH_FIELDS)
+
+# Unión de los campos anteriores (member_changes), sin repetir
+MEMBER_CHANGE_FIELDS = tuple(dict.fromkeys(USER_ROW_FIELDS + CARD_ROW_FIELDS + QUICK_SEARCH_FIELDS))
+MEMBER_CHANGE_COLUMNS = tuple(getattr(User, name) for name in MEMBER_CHANGE_FIELDS)
+
+# Filtros de texto de usuarios: nombre y apellido buscan por contenido o,
+# con el filtro prefijo, por comienzo (con los índices NOCASE); el resto
+# siempre por contenido
+USER_NAME_FILTERS = ("nombre", "apellido")
+USER_CONTAINS_FILTERS = ("email", "celular", "observaciones")
+
+
+def _prefix_pattern(text: str) -> str:
+    """Patrón LIKE 'texto%' con los comodines del texto escapados."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _unindexed(column):
+    """
+    Columna precedida por '+': SQLite no usa sus índices para ese filtro.
+    
+    Sirve para que el planificador no elija el índice único de rfid_uid
+    (que estima muy selectivo) cuando conviene recorrer otro índice.
+    """
+    return UnaryExpression(column, operator=custom_op("+"))
+
+
+def access_row(log: AccessLog, user: Optional[User] = None) -> AccessRow:
+    """
+    Arma una fila liviana a partir de un AccessLog.
+    
+    Args:
+        log: Registro de acceso
+        user: Usuario asociado, si se conoce
+    """
+    return AccessRow(
+        log.id, log.timestamp,
+        user.nombre if user else None,
+        user.apellido if user else None,
+        log.rfid_uid, log.resultado, log.motivo,
+        log.user_id
+    )
+
+
+def user_filters_refine(previous: dict, current: dict) -> bool:
+    """
+    Indica si los filtros `current` son un refinamiento de `previous`.
+    
+    Es decir, si todo usuario que cumple `current` también cumple
+    `previous` (por ejemplo, el apellido "gon" extendido a "gonz"). En ese
+    caso el resultado nuevo puede obtenerse filtrando en memoria el anterior.
+    
+    Args:
+        previous: Filtros de la búsqueda anterior (ver UserRepository.search)
+        current: Filtros de la búsqueda nueva
+    
+    Returns:
+        True si se puede refinar el resultado anterior
+    """
+    prefix_old, prefix_new = bool(previous.get("prefijo")), bool(current.get("prefijo"))
+    for key in (set(previous) | set(current)) - {"prefijo"}:
+        old, new = previous.get(key), current.get(key)
+        if not old:
+            continue
+        if not new:
+            return False
+        if key in USER_NAME_FILTERS:
+            # El comienzo es más restrictivo que el contenido, no al revés
+            if prefix_old:
+                if prefix_new and new.lower().startswith(old.lower()):
+                    continue
+            elif old.lower() in new.lower():
+                continue
+            return False
+        if new == old:
+            continue
+        if key in USER_CONTAINS_FILTERS and old.lower() in new.lower():
+            continue
+        return False
+    return True
+
+
+def user_row_filter(filters: dict):
+    """
+    Arma un predicado sobre filas livianas equivalente a los filtros SQL.
+    
+    Args:
+        filters: Filtros de búsqueda (ver UserRepository.search)
+    
+    Returns:
+        Función que recibe una fila (ver USER_ROW_FIELDS) y devuelve bool
+    """
+    position = {name: i for i, name in enumerate(USER_ROW_FIELDS)}
+    checks = []
+    
+    prefix = bool(filters.get("prefijo"))
+    for key, value in filters.items():
+        if not value or key == "prefijo":
+            continue
+        if key in USER_NAME_FILTERS and prefix:
+            i, text = position[key], value.lower()
+            checks.append(lambda row, i=i, text=text: row[i].lower().startswith(text))
+        elif key in USER_NAME_FILTERS or key in USER_CONTAINS_FILTERS:
+            i, text = position[key], value.lower()
+            checks.append(lambda row, i=i, text=text: text in (row[i] or "").lower())
+        elif key == "plan":
+            checks.append(lambda row, plan=value: row[position["plan"]] == plan)
+        elif key == "fecha_fin_desde":
+            checks.append(lambda row, d=value: row[position["fecha_fin_plan"]] >= d)
+        elif key == "fecha_fin_hasta":
+            checks.append(lambda row, d=value: row[position["fecha_fin_plan"]] <= d)
+        elif key == "solo_activos":
+            checks.append(lambda row: row[position["activo"]])
+        elif key == "solo_vigentes":
+            today = date.today()
+            checks.append(lambda row: row[position["fecha_fin_plan"]] >= today)
+        else:
+            raise ValueError(f"Filtro de usuario desconocido: {key}")
+    
+    if not checks:
+        return lambda row: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda row: all(check(row) for check in checks)
+
+
+# Campos de las filas livianas de acceso (search_page), en orden
+ACCESS_ROW_FIELDS = AccessRow._fields
+ACCESS_ROW_COLUMNS = tuple(
+    getattr(User if name in ("nombre", "apellido") else AccessLog, name)
+    for name in ACCESS_ROW_FIELDS
+)
+
+# Órdenes del registro de accesos (search_page): campos de la clave de
+# paginación de cada uno. Todos tienen un índice en AccessLog que SQLite
+# recorre ya ordenado (el id va implícito al final de cada índice), así
+# que ordenar no obliga a leer ni ordenar todos los registros.
+ACCESS_SORT_KEYS = {
+    "timestamp": ("timestamp", "id"),
+    "rfid_uid": ("rfid_uid", "timestamp", "id"),
+    "resultado": ("resultado", "timestamp", "id"),
+    "motivo": ("motivo", "timestamp", "id"),
+}
+
+
 class UserRepository:
     """Repositorio para operaciones CRUD de usuarios."""
     
@@ -35,7 +199,7 @@ class UserRepository:
         normalized = normalize_rfid_uid(rfid_uid)
         if not normalized:
             return self.db.query(User).filter(User.rfid_uid == rfid_uid).first()
-
+        
         compact = normalized.replace("-", "")
         normalized_db = func.replace(
             func.replace(
@@ -67,7 +231,8 @@ class UserRepository:
         fecha_fin_desde: date = None,
         fecha_fin_hasta: date = None,
         solo_activos: bool = False,
-        solo_vigentes: bool = False
+        solo_vigentes: bool = False,
+        prefijo: bool = False
     ) -> List[User]:
         """
         Busca usuarios con múltiples filtros.
@@ -83,17 +248,227 @@ class UserRepository:
             fecha_fin_hasta: Fecha fin del plan hasta
             solo_activos: Solo usuarios activos
             solo_vigentes: Solo usuarios con plan vigente
+            prefijo: Nombre y apellido buscan por comienzo, sin distinguir
+                     mayúsculas (usa los índices; búsqueda mientras se escribe)
         
         Returns:
             Lista de usuarios que coinciden con los filtros
         """
-        query = self.db.query(User)
+        query = self._apply_search_filters(
+            self.db.query(User),
+            nombre=nombre,
+            apellido=apellido,
+            email=email,
+            celular=celular,
+            plan=plan,
+            observaciones=observaciones,
+            fecha_fin_desde=fecha_fin_desde,
+            fecha_fin_hasta=fecha_fin_hasta,
+            solo_activos=solo_activos,
+            solo_vigentes=solo_vigentes,
+            prefijo=prefijo
+        )
+        return query.order_by(User.apellido, User.nombre).all()
+    
+    def search_rows(self, **filters) -> List[MemberRow]:
+        """
+        Igual que search() pero devuelve filas livianas en lugar de objetos ORM.
+        
+        Es la forma recomendada de cargar listados grandes (tablas de la UI):
+        cada fila ocupa un tercio de lo que ocupa un User desvinculado de la sesión.
+        
+        Args:
+            **filters: Los mismos filtros que search()
+        
+        Returns:
+            Lista de filas ordenada por apellido y nombre
+        """
+        query = self._apply_search_filters(self.db.query(*USER_ROW_COLUMNS), **filters)
+        return list(map(MemberRow._make, query.order_by(User.apellido, User.nombre)))
+    
+    def get_row(self, user_id: int) -> Optional[MemberRow]:
+        """Obtiene un usuario como fila liviana."""
+        row = self.db.query(*USER_ROW_COLUMNS).filter(User.id == user_id).first()
+        return MemberRow._make(row) if row else None
+    
+    def get_rows(self, user_ids: List[int]) -> List[MemberRow]:
+        """
+        Obtiene varios usuarios como filas livianas, en una sola consulta.
+        
+        Los IDs inexistentes (por ejemplo, usuarios eliminados) se omiten.
+        """
+        if not user_ids:
+            return []
+        query = self.db.query(*USER_ROW_COLUMNS).filter(User.id.in_(user_ids))
+        return list(map(MemberRow._make, query))
+    
+    def card_rows(self, user_ids: List[int] = None) -> List[CardRow]:
+        """
+        Obtiene los usuarios con tarjeta asignada como filas livianas.
         
-        if nombre:
-            query = query.filter(User.nombre.ilike(f"%{nombre}%"))
+        Solo trae las columnas que muestra la tabla de tarjetas, ordenadas
+        por apellido y nombre.
         
-        if apellido:
-            query = query.filter(User.apellido.ilike(f"%{apellido}%"))
+        Args:
+            user_ids: Limitar a estos usuarios (opcional)
+        """
+        query = self.db.query(*CARD_ROW_COLUMNS).filter(User.rfid_uid.isnot(None))
+        if user_ids is not None:
+            if not user_ids:
+                return []
+            query = query.filter(User.id.in_(user_ids))
+        query = query.order_by(User.apellido, User.nombre, User.id)
+        return list(map(CardRow._make, query))
+    
+    def quick_search_rows(self, user_ids: List[int] = None) -> List[QuickSearchRow]:
+        """
+        Obtiene los datos del índice de búsqueda rápida como filas livianas.
+        
+        Args:
+            user_ids: Limitar a estos usuarios (opcional)
+        """
+        query = self.db.query(*QUICK_SEARCH_COLUMNS)
+        if user_ids is not None:
+            if not user_ids:
+                return []
+            query = query.filter(User.id.in_(user_ids))
+        return list(map(QuickSearchRow._make, query))
+    
+    def member_changes(self, user_ids: List[int]) -> Dict[int, MemberChange]:
+        """
+        Relee varios usuarios con las filas de todas las vistas, en una sola consulta.
+        
+        Los IDs inexistentes (por ejemplo, usuarios eliminados) se omiten.
+        
+        Returns:
+            Diccionario {user_id: MemberChange}
+        """
+        if not user_ids:
+            return {}
+        changes = {}
+        for values in self.db.query(*MEMBER_CHANGE_COLUMNS).filter(User.id.in_(user_ids)):
+            row = dict(zip(MEMBER_CHANGE_FIELDS, values))
+            changes[row["id"]] = MemberChange(
+                member=MemberRow(*(row[name] for name in USER_ROW_FIELDS)),
+                quick=QuickSearchRow(*(row[name] for name in QUICK_SEARCH_FIELDS)),
+                card=CardRow(*(row[name] for name in CARD_ROW_FIELDS)) if row["rfid_uid"] else None
+            )
+        return changes
+    
+    def plan_end_dates(self, since: date) -> List[tuple]:
+        """
+        Obtiene la fecha de fin de plan de los usuarios activos que vencen desde una fecha.
+        
+        Returns:
+            Tuplas (id, fecha_fin_plan)
+        """
+        return (
+            self.db.query(User.id, User.fecha_fin_plan)
+            .filter(User.activo == True)
+            .filter(User.fecha_fin_plan >= since)
+            .all()
+        )
+    
+    def new_members_per_month(self, fecha_desde: datetime, fecha_hasta: datetime) -> List[tuple]:
+        """
+        Cuenta los usuarios dados de alta en un período, por mes.
+        
+        Returns:
+            Tuplas ("YYYY-MM", cantidad)
+        """
+        mes = func.strftime("%Y-%m", User.created_at)
+        return (
+            self.db.query(mes, func.count(User.id))
+            .filter(User.created_at >= fecha_desde)
+            .filter(User.created_at <= fecha_hasta)
+            .group_by(mes)
+            .all()
+        )
+    
+    def plan_mix(self) -> List[tuple]:
+        """Cantidad de usuarios activos por plan: tuplas (plan, cantidad)."""
+        return (
+            self.db.query(User.plan, func.count(User.id))
+            .filter(User.activo == True)
+            .group_by(User.plan)
+            .all()
+        )
+    
+    def payment_mix(self) -> List[tuple]:
+        """Cantidad de usuarios activos por método de pago: tuplas (metodo_pago, cantidad)."""
+        return (
+            self.db.query(User.metodo_pago, func.count(User.id))
+            .filter(User.activo == True)
+            .group_by(User.metodo_pago)
+            .all()
+        )
+    
+    def without_card_rows(self, texto: str = "", limit: Optional[int] = None) -> List[tuple]:
+        """
+        Obtiene los usuarios activos sin tarjeta como tuplas (id, apellido, nombre).
+        
+        El texto se busca por prefijo en el apellido o el nombre; con más
+        de una palabra también como "apellido nombre" o "nombre apellido".
+        Se resuelve con los índices NOCASE de apellido y nombre, en orden
+        alfabético, así que con limit solo se leen las primeras coincidencias.
+        
+        Args:
+            texto: Prefijo a buscar (vacío = todos)
+            limit: Cantidad máxima de filas (opcional)
+        """
+        query = (
+            self.db.query(User.id, User.apellido, User.nombre)
+            .filter(_unindexed(User.rfid_uid).is_(None))
+            .filter(User.activo == True)
+        )
+        
+        texto = " ".join(texto.split())
+        if texto:
+            pattern = _prefix_pattern(texto)
+            conditions = [
+                User.apellido.like(pattern, escape="\\"),
+                User.nombre.like(pattern, escape="\\"),
+            ]
+            first, _, rest = texto.partition(" ")
+            if rest:
+                first, rest = _prefix_pattern(first), _prefix_pattern(rest)
+                conditions += [
+                    User.apellido.like(first, escape="\\") & User.nombre.like(rest, escape="\\"),
+                    User.nombre.like(first, escape="\\") & User.apellido.like(rest, escape="\\"),
+                ]
+            query = query.filter(or_(*conditions))
+        
+        query = query.order_by(
+            User.apellido.collate("NOCASE"), User.nombre.collate("NOCASE"), User.id
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return [tuple(row) for row in query]
+    
+    def _apply_search_filters(
+        self,
+        query,
+        nombre: str = None,
+        apellido: str = None,
+        email: str = None,
+        celular: str = None,
+        plan: PlanType = None,
+        observaciones: str = None,
+        fecha_fin_desde: date = None,
+        fecha_fin_hasta: date = None,
+        solo_activos: bool = False,
+        solo_vigentes: bool = False,
+        prefijo: bool = False
+    ):
+        """Aplica los filtros de búsqueda de usuarios a una consulta."""
+        # Por comienzo, nombre y apellido usan los índices NOCASE
+        for column, text in ((User.nombre, nombre), (User.apellido, apellido)):
+            if not text:
+                continue
+            if prefijo:
+                query = query.filter(column.like(_prefix_pattern(text), escape="\\"))
+            else:
+                query = query.filter(column.ilike(f"%{text}%"))
         
         if email:
             query = query.filter(User.email.ilike(f"%{email}%"))
@@ -119,7 +494,7 @@ class UserRepository:
         if solo_vigentes:
             query = query.filter(User.fecha_fin_plan >= date.today())
         
-        return query.order_by(User.apellido, User.nombre).all()
+        return query
     
     def create(
         self,
@@ -132,7 +507,8 @@ class UserRepository:
         observaciones: str = None,
         rfid_uid: str = None,
         activo: bool = True,
-        metodo_pago: PaymentMethod = PaymentMethod.EFECTIVO
+        metodo_pago: PaymentMethod = PaymentMethod.EFECTIVO,
+        refresh: bool = False
     ) -> User:
         """
         Crea un nuevo usuario.
@@ -148,9 +524,10 @@ class UserRepository:
             rfid_uid: UID de tarjeta RFID (opcional)
             activo: Estado activo (default True)
             metodo_pago: Método de pago (default Efectivo)
+            refresh: Releer el registro desde la base tras el commit (default False)
         
         Returns:
-            Usuario creado
+            Usuario creado (con su id ya asignado)
         """
         fecha_fin_plan = calcular_fecha_fin(fecha_inicio_plan, plan)
         
@@ -170,7 +547,9 @@ class UserRepository:
         
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
+        get_change_bus().publish_member_changed(user.id)
+        if refresh:
+            self.db.refresh(user)
         return user
     
     def update(
@@ -185,7 +564,8 @@ class UserRepository:
         fecha_inicio_plan: date = None,
         rfid_uid: str = None,
         activo: bool = None,
-        metodo_pago: PaymentMethod = None
+        metodo_pago: PaymentMethod = None,
+        refresh: bool = False
     ) -> Optional[User]:
         """
         Actualiza un usuario existente.
@@ -202,6 +582,7 @@ class UserRepository:
             rfid_uid: Nuevo UID RFID (opcional)
             activo: Nuevo estado activo (opcional)
             metodo_pago: Nuevo método de pago (opcional)
+            refresh: Releer el registro desde la base tras el commit (default False)
         
         Returns:
             Usuario actualizado o None si no existe
@@ -237,7 +618,9 @@ class UserRepository:
         
         user.updated_at = datetime.now()
         self.db.commit()
-        self.db.refresh(user)
+        get_change_bus().publish_member_changed(user.id)
+        if refresh:
+            self.db.refresh(user)
         return user
     
     def delete(self, user_id: int) -> bool:
@@ -256,6 +639,8 @@ class UserRepository:
         
         self.db.delete(user)
         self.db.commit()
+        # Los accesos del usuario quedan sin usuario asociado (user_id nulo)
+        get_change_bus().publish_member_changed(user_id, logs_changed=True)
         return True
     
     def assign_rfid(self, user_id: int, rfid_uid: str) -> Optional[User]:
@@ -273,7 +658,7 @@ class UserRepository:
         normalized_uid = normalize_rfid_uid(rfid_uid)
         if not normalized_uid:
             return None
-
+        
         existing = self.get_by_rfid(normalized_uid)
         if existing and existing.id != user_id:
             return None
@@ -284,6 +669,86 @@ class UserRepository:
         """Remueve la tarjeta RFID de un usuario."""
         return self.update(user_id, rfid_uid="")
     
+    def renew_plans(
+        self,
+        user_ids: List[int],
+        plan: PlanType,
+        fecha_inicio_plan: Optional[date] = None
+    ) -> Dict[date, int]:
+        """
+        Renueva el plan de varios usuarios en una sola transacción.
+        
+        Con fecha de inicio, todos comienzan ese día. Sin ella, cada plan
+        nuevo comienza al vencer el actual, o hoy si ya venció. La fecha de
+        fin se calcula una vez por fecha de inicio distinta y se aplica con
+        un único UPDATE. Quedan activos los usuarios cuyo plan nuevo está
+        vigente (renovar con un inicio pasado no reactiva un plan vencido).
+        
+        Si otro puesto modificó el vencimiento de un usuario entre la lectura
+        y el UPDATE (o lo eliminó), ese usuario no se renueva; el resumen y
+        los avisos salen de las filas que devuelve el UPDATE (RETURNING).
+        
+        Args:
+            user_ids: IDs de los usuarios a renovar
+            plan: Plan nuevo
+            fecha_inicio_plan: Fecha de inicio común (None = extender desde el vencimiento actual)
+        
+        Returns:
+            Cantidad de usuarios renovados por fecha de fin nueva
+        """
+        if not user_ids:
+            return {}
+        
+        # Vencimiento actual de los usuarios que existen
+        current_ends = dict(
+            self.db.query(User.id, User.fecha_fin_plan)
+            .filter(User.id.in_(user_ids))
+            .all()
+        )
+        if not current_ends:
+            return {}
+        
+        today = date.today()
+        if fecha_inicio_plan is not None:
+            fecha_fin = calcular_fecha_fin(fecha_inicio_plan, plan)
+            new_ends = {end: fecha_fin for end in set(current_ends.values())}
+            values = dict(fecha_inicio_plan=fecha_inicio_plan, fecha_fin_plan=fecha_fin)
+            query = update(User).where(User.id.in_(list(current_ends)))
+            if fecha_fin >= today:
+                values["activo"] = True
+        else:
+            starts = {end: max(end, today) for end in set(current_ends.values())}
+            start_ends = {start: calcular_fecha_fin(start, plan) for start in set(starts.values())}
+            new_ends = {end: start_ends[start] for end, start in starts.items()}
+            # SET evalúa con los valores anteriores: ambos CASE usan el vencimiento previo
+            values = dict(
+                fecha_inicio_plan=case(starts, value=User.fecha_fin_plan),
+                fecha_fin_plan=case(new_ends, value=User.fecha_fin_plan),
+                activo=True
+            )
+            query = (
+                update(User)
+                .where(User.id.in_(list(current_ends)))
+                .where(User.fecha_fin_plan.in_(list(new_ends)))
+            )
+        
+        renewed = self.db.execute(
+            query.values(plan=plan, updated_at=datetime.now(), **values)
+            .returning(User.id, User.fecha_fin_plan),
+            execution_options={"synchronize_session": False}
+        ).all()
+        self.db.commit()
+        
+        # El bus agrupa los avisos: si son muchos llega uno solo masivo
+        bus = get_change_bus()
+        for user_id, _ in renewed:
+            bus.publish_member_changed(user_id)
+        
+        summary: Dict[date, int] = {}
+        for _, fecha_fin in renewed:
+            summary[fecha_fin] = summary.get(fecha_fin, 0) + 1
+        return summary
+    
     def deactivate_expired_plans(self) -> int:
         """
         Desactiva usuarios cuyos planes han vencido.
@@ -307,8 +772,55 @@ class UserRepository:
         
         if count > 0:
             self.db.commit()
+            # El bus agrupa los avisos: si son muchos llega uno solo masivo
+            bus = get_change_bus()
+            for user in expired_users:
+                bus.publish_member_changed(user.id)
         
         return count
+    
+    def rebuild_access_stats(self) -> int:
+        """
+        Recalcula ultimo_acceso y total_accesos de todos los usuarios
+        a partir del historial de accesos permitidos.
+        
+        Pensado para ejecutarse una vez (al crear las columnas) o para
+        corregir los valores si el historial se modificó por fuera de la app.
+        
+        Returns:
+            Cantidad de usuarios con al menos un acceso
+        """
+        stats = (
+            self.db.query(
+                AccessLog.user_id.label("user_id"),
+                func.count(AccessLog.id).label("total"),
+                func.max(AccessLog.timestamp).label("ultimo")
+            )
+            .filter(AccessLog.user_id.isnot(None))
+            .filter(AccessLog.resultado == AccessResult.PERMITIDO)
+            .group_by(AccessLog.user_id)
+            .subquery()
+        )
+        
+        # Conservar updated_at: la asistencia no es una modificación del usuario
+        self.db.execute(
+            update(User)
+            .values(total_accesos=0, ultimo_acceso=None, updated_at=User.updated_at),
+            execution_options={"synchronize_session": False}
+        )
+        result = self.db.execute(
+            update(User)
+            .where(User.id == stats.c.user_id)
+            .values(
+                total_accesos=stats.c.total,
+                ultimo_acceso=stats.c.ultimo,
+                updated_at=User.updated_at
+            ),
+            execution_options={"synchronize_session": False}
+        )
+        self.db.commit()
+        get_change_bus().publish_members_bulk_changed()
+        return result.rowcount
 
 
 class AccessLogRepository:
@@ -336,6 +848,106 @@ class AccessLogRepository:
             .all()
         )
     
+    def monthly_visits(self, user_id: int, months: int = 12) -> List[tuple]:
+        """
+        Cuenta los accesos de un usuario por mes, con una consulta de agregación.
+        
+        Recorre solo el tramo del índice (user_id, timestamp) de esos meses,
+        sin traer los registros.
+        
+        Args:
+            user_id: ID del usuario
+            months: Cantidad de meses, contando el actual
+        
+        Returns:
+            Tuplas ("YYYY-MM", permitidos, denegados) del mes actual hacia
+            atrás, incluidos los meses sin accesos
+        """
+        first_month = date.today().replace(day=1) - relativedelta(months=months - 1)
+        mes = func.strftime("%Y-%m", AccessLog.timestamp)
+        permitidos = func.sum(case((AccessLog.resultado == AccessResult.PERMITIDO, 1), else_=0))
+        query = (
+            self.db.query(mes, permitidos, func.count(AccessLog.id) - permitidos)
+            .filter(AccessLog.user_id == user_id)
+            .filter(AccessLog.timestamp >= datetime.combine(first_month, datetime.min.time()))
+            .group_by(mes)
+        )
+        counts = {row[0]: (row[1], row[2]) for row in query}
+        
+        result = []
+        for offset in range(months):
+            key = (first_month + relativedelta(months=months - 1 - offset)).strftime("%Y-%m")
+            result.append((key,) + counts.get(key, (0, 0)))
+        return result
+    
+    def hourly_counts(self, fecha_desde: datetime, fecha_hasta: datetime) -> List[tuple]:
+        """
+        Cuenta los accesos de un período por hora y resultado.
+        
+        Es el resumen del que salen los accesos por día, por hora y por día
+        de la semana: un solo recorrido del índice de timestamp en lugar de
+        una consulta por gráfico.
+        
+        Args:
+            fecha_desde: Fecha/hora desde
+            fecha_hasta: Fecha/hora hasta
+        
+        Returns:
+            Tuplas ("YYYY-MM-DD HH", resultado, cantidad)
+        """
+        hora = func.strftime("%Y-%m-%d %H", AccessLog.timestamp)
+        return (
+            self.db.query(hora, AccessLog.resultado, func.count(AccessLog.id))
+            .filter(AccessLog.timestamp >= fecha_desde)
+            .filter(AccessLog.timestamp <= fecha_hasta)
+            .group_by(hora, AccessLog.resultado)
+            .all()
+        )
+    
+    def last_id(self) -> int:
+        """ID del último registro de acceso (0 si no hay ninguno)."""
+        return self.db.query(func.max(AccessLog.id)).scalar() or 0
+    
+    def counts_since(self, since: datetime, max_id: int) -> List[tuple]:
+        """
+        Cuenta los accesos desde un momento por resultado y motivo.
+        
+        Args:
+            since: Fecha/hora desde
+            max_id: Contar solo hasta este registro (los posteriores se
+                reciben por el bus de cambios)
+        
+        Returns:
+            Tuplas (resultado, motivo, cantidad)
+        """
+        return (
+            self.db.query(AccessLog.resultado, AccessLog.motivo, func.count(AccessLog.id))
+            .filter(AccessLog.timestamp >= since)
+            .filter(AccessLog.id <= max_id)
+            .group_by(AccessLog.resultado, AccessLog.motivo)
+            .all()
+        )
+    
+    def entries_since(self, since: datetime, max_id: int) -> List[tuple]:
+        """
+        Obtiene los ingresos permitidos desde un momento.
+        
+        Args:
+            since: Fecha/hora desde
+            max_id: Solo hasta este registro
+        
+        Returns:
+            Tuplas (id, timestamp, user_id), de la más antigua a la más reciente
+        """
+        return (
+            self.db.query(AccessLog.id, AccessLog.timestamp, AccessLog.user_id)
+            .filter(AccessLog.timestamp >= since)
+            .filter(AccessLog.id <= max_id)
+            .filter(AccessLog.resultado == AccessResult.PERMITIDO)
+            .order_by(AccessLog.timestamp)
+            .all()
+        )
+    
     def get_by_rfid(self, rfid_uid: str, limit: int = 50) -> List[AccessLog]:
         """Obtiene los registros de acceso por UID de tarjeta."""
         return (
@@ -369,8 +981,93 @@ class AccessLogRepository:
         Returns:
             Lista de registros de acceso
         """
-        query = self.db.query(AccessLog)
+        query = self._apply_search_filters(
+            self.db.query(AccessLog),
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+            resultado=resultado,
+            user_id=user_id,
+            rfid_uid=rfid_uid
+        )
+        return query.order_by(AccessLog.timestamp.desc()).limit(limit).all()
+    
+    def search_page(
+        self,
+        fecha_desde: datetime = None,
+        fecha_hasta: datetime = None,
+        resultado: AccessResult = None,
+        user_id: int = None,
+        rfid_uid: str = None,
+        sort: str = "timestamp",
+        descending: bool = True,
+        following: tuple = None,
+        preceding: tuple = None,
+        limit: int = 200
+    ) -> List[AccessRow]:
+        """
+        Obtiene una página de registros como filas livianas.
+        
+        El orden lo resuelve la base con el índice de la columna elegida, y
+        la paginación es por clave (keyset) sobre los campos de
+        ACCESS_SORT_KEYS en lugar de OFFSET: cada página cuesta lo mismo sin
+        importar cuán lejos esté del principio ni cuántos registros haya.
+        
+        Args:
+            fecha_desde: Fecha/hora desde
+            fecha_hasta: Fecha/hora hasta
+            resultado: Filtrar por resultado (permitido/denegado)
+            user_id: Filtrar por usuario
+            rfid_uid: Filtrar por UID RFID
+            sort: Campo por el que se ordena (clave de ACCESS_SORT_KEYS)
+            descending: Orden descendente (por defecto, del más reciente al más antiguo)
+            following: Clave de la última fila cargada; trae las que le siguen
+            preceding: Clave de la primera fila cargada; trae las que la preceden
+            limit: Tamaño de la página
         
+        Returns:
+            Lista de filas, siempre en el orden pedido
+        """
+        query = self._apply_search_filters(
+            self.db.query(*ACCESS_ROW_COLUMNS).outerjoin(User, AccessLog.user_id == User.id),
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+            resultado=resultado,
+            user_id=user_id,
+            rfid_uid=rfid_uid
+        )
+        columns = [getattr(AccessLog, field) for field in ACCESS_SORT_KEYS[sort]]
+        # Las filas que preceden a la clave se buscan recorriendo el orden
+        # al revés desde ella, y después se invierten
+        backwards = preceding is not None
+        ascending = descending if backwards else not descending
+        cursor = preceding if backwards else following
+        
+        # Ordenar por el resultado filtrando por él: la primera columna es
+        # constante y se pagina por el resto (si no, el planificador
+        # recorre el índice de fechas descartando los otros resultados)
+        if sort == "resultado" and resultado:
+            columns = columns[1:]
+            cursor = cursor[1:] if cursor is not None else None
+        key = tuple_(*columns)
+        
+        if cursor is not None:
+            # Tupla común (no tuple_): así cada valor toma el tipo de su
+            # columna, y los enums se comparan por su nombre guardado
+            query = query.filter(key > tuple(cursor) if ascending else key < tuple(cursor))
+        query = query.order_by(*(column.asc() if ascending else column.desc() for column in columns))
+        rows = list(map(AccessRow._make, query.limit(limit)))
+        return rows[::-1] if backwards else rows
+    
+    def _apply_search_filters(
+        self,
+        query,
+        fecha_desde: datetime = None,
+        fecha_hasta: datetime = None,
+        resultado: AccessResult = None,
+        user_id: int = None,
+        rfid_uid: str = None
+    ):
+        """Aplica los filtros de búsqueda de registros a una consulta."""
         if fecha_desde:
             query = query.filter(AccessLog.timestamp >= fecha_desde)
         
@@ -386,23 +1083,28 @@ class AccessLogRepository:
         if rfid_uid:
             query = query.filter(AccessLog.rfid_uid.ilike(f"%{rfid_uid}%"))
         
-        return query.order_by(AccessLog.timestamp.desc()).limit(limit).all()
+        return query
     
     def create(
         self,
         rfid_uid: str,
         resultado: AccessResult,
         motivo: AccessReason,
-        user_id: int = None
+        user_id: int = None,
+        refresh: bool = False
     ) -> AccessLog:
         """
         Crea un nuevo registro de acceso.
         
+        El id generado se obtiene del propio INSERT (lastrowid), por lo que
+        el registro devuelto ya es utilizable sin releerlo de la base.
+        
         Args:
             rfid_uid: UID de la tarjeta RFID
             resultado: Resultado del acceso
             motivo: Motivo del resultado
             user_id: ID del usuario (opcional)
+            refresh: Releer el registro desde la base tras el commit (default False)
         
         Returns:
             Registro de acceso creado
@@ -416,22 +1118,72 @@ class AccessLogRepository:
         )
         
         self.db.add(log)
+        if user_id is not None and resultado == AccessResult.PERMITIDO:
+            self._register_visit(user_id, log.timestamp)
         self.db.commit()
-        self.db.refresh(log)
+        # La asistencia del usuario viaja con el acceso (no como cambio del socio)
+        # (get() usa el usuario ya cargado en la sesión, sin consultar)
+        user = self.db.get(User, user_id) if user_id is not None else None
+        get_change_bus().publish_access_logged(access_row(log, user))
+        if refresh:
+            self.db.refresh(log)
         return log
     
-    def get_stats(self, fecha_desde: date = None, fecha_hasta: date = None) -> dict:
+    def _register_visit(self, user_id: int, timestamp: datetime):
+        """
+        Actualiza la asistencia del usuario en la misma transacción del acceso.
+        
+        El incremento se hace en SQL para que sea atómico; si el usuario ya
+        está cargado en la sesión se sincroniza en memoria sin releerlo.
+        """
+        self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                ultimo_acceso=timestamp,
+                total_accesos=User.total_accesos + 1,
+                updated_at=User.updated_at
+            ),
+            execution_options={"synchronize_session": False}
+        )
+        
+        user = self.db.identity_map.get(identity_key(User, user_id))
+        if user is not None:
+            set_committed_value(user, "ultimo_acceso", timestamp)
+            set_committed_value(user, "total_accesos", (user.total_accesos or 0) + 1)
+    
+    def get_stats(
+        self,
+        fecha_desde: date = None,
+        fecha_hasta: date = None,
+        resultado: AccessResult = None,
+        rfid_uid: str = None,
+        max_id: int = None
+    ) -> dict:
         """
         Obtiene estadísticas de acceso.
         
+        Se calculan con una única consulta de agregación, sin cargar los
+        registros en memoria.
+        
         Args:
             fecha_desde: Fecha desde
             fecha_hasta: Fecha hasta
+            resultado: Filtrar por resultado (opcional)
+            rfid_uid: Filtrar por UID RFID (contiene, opcional)
+            max_id: Contar solo hasta este registro (opcional; los posteriores
+                se reciben por el bus de cambios)
         
         Returns:
             Diccionario con estadísticas
         """
-        query = self.db.query(AccessLog)
+        query = self.db.query(
+            func.count(AccessLog.id),
+            func.coalesce(
+                func.sum(case((AccessLog.resultado == AccessResult.PERMITIDO, 1), else_=0)),
+                0
+            )
+        )
         
         if fecha_desde:
             query = query.filter(AccessLog.timestamp >= datetime.combine(fecha_desde, datetime.min.time()))
@@ -439,10 +1191,16 @@ class AccessLogRepository:
         if fecha_hasta:
             query = query.filter(AccessLog.timestamp <= datetime.combine(fecha_hasta, datetime.max.time()))
         
-        logs = query.all()
+        if resultado:
+            query = query.filter(AccessLog.resultado == resultado)
+        
+        if rfid_uid:
+            query = query.filter(AccessLog.rfid_uid.ilike(f"%{rfid_uid}%"))
+        
+        if max_id is not None:
+            query = query.filter(AccessLog.id <= max_id)
         
-        total = len(logs)
-        permitidos = sum(1 for log in logs if log.resultado == AccessResult.PERMITIDO)
+        total, permitidos = query.one()
         denegados = total - permitidos
         
         return {
@@ -0,0 +1,72 @@
+"""
+Filas livianas de solo lectura para las vistas y las exportaciones.
+
+Son tuplas con nombre: ocupan lo mismo que una tupla común (sin
+diccionario por instancia ni estado de SQLAlchemy), no se pueden
+modificar y se leen tanto por posición, como hacen los modelos de tabla
+en las celdas, como por nombre. Los repositorios las arman directamente
+desde las columnas consultadas, sin pasar por objetos ORM.
+"""
+from datetime import date, datetime
+from typing import NamedTuple, Optional
+
+from src.utils.enums import PlanType, AccessResult, AccessReason
+
+
+class MemberRow(NamedTuple):
+    """Usuario en la tabla de usuarios (UserRepository.search_rows / get_rows)."""
+    id: int
+    apellido: str
+    nombre: str
+    email: Optional[str]
+    celular: Optional[str]
+    plan: PlanType
+    observaciones: Optional[str]
+    fecha_fin_plan: date
+    ultimo_acceso: Optional[datetime]
+    total_accesos: int
+    activo: bool
+
+
+class CardRow(NamedTuple):
+    """Usuario con tarjeta asignada (UserRepository.card_rows)."""
+    id: int
+    apellido: str
+    nombre: str
+    rfid_uid: str
+    plan: PlanType
+    activo: bool
+    fecha_fin_plan: date
+
+
+class QuickSearchRow(NamedTuple):
+    """Usuario en el índice de búsqueda rápida (UserRepository.quick_search_rows)."""
+    id: int
+    apellido: str
+    nombre: str
+    email: Optional[str]
+    celular: Optional[str]
+    rfid_uid: Optional[str]
+    activo: bool
+
+
+class AccessRow(NamedTuple):
+    """Registro de acceso con el nombre del usuario (AccessLogRepository.search_page)."""
+    id: int
+    timestamp: datetime
+    nombre: Optional[str]      # None si la tarjeta no está registrada
+    apellido: Optional[str]
+    rfid_uid: str
+    resultado: AccessResult
+    motivo: AccessReason
+    user_id: Optional[int]
+
+
+class MemberChange(NamedTuple):
+    """
+    Socio modificado, releído una sola vez para todas las vistas
+    (UserRepository.member_changes).
+    """
+    member: MemberRow
+    quick: QuickSearchRow
+    card: Optional[CardRow]    # None si no tiene tarjeta asignada
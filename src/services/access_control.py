@@ -7,7 +7,7 @@ from typing import Optional
 
 from src.db.database import get_db
 from src.db.repository import UserRepository, AccessLogRepository
-from src.db.models import User
+from src.db.models import User, AccessLog
 from src.utils.enums import AccessResult, AccessReason
 from src.utils.rfid import normalize_rfid_uid
 
@@ -19,6 +19,7 @@ class AccessCheckResult:
     motivo: AccessReason
     user: Optional[User] = None
     message: str = ""
+    log: Optional[AccessLog] = None  # Registro creado (None si solo se verificó)
 
 
 class AccessControlService:
@@ -46,7 +47,7 @@ class AccessControlService:
                     motivo=AccessReason.NO_EXISTE,
                     message=f"UID invalido recibido: {rfid_uid}"
                 )
-                access_repo.create(
+                result.log = access_repo.create(
                     rfid_uid=str(rfid_uid),
                     resultado=result.resultado,
                     motivo=result.motivo,
@@ -87,7 +88,7 @@ class AccessControlService:
                 )
             
             # Registrar en log
-            access_repo.create(
+            result.log = access_repo.create(
                 rfid_uid=normalized_uid,
                 resultado=result.resultado,
                 motivo=result.motivo,
@@ -168,7 +169,7 @@ class AccessControlService:
             access_repo = AccessLogRepository(db)
             
             # Registrar acceso manual con UID especial
-            access_repo.create(
+            log = access_repo.create(
                 rfid_uid=f"MANUAL-{note[:20]}",
                 resultado=AccessResult.PERMITIDO,
                 motivo=AccessReason.MANUAL,
@@ -178,7 +179,8 @@ class AccessControlService:
             return AccessCheckResult(
                 resultado=AccessResult.PERMITIDO,
                 motivo=AccessReason.MANUAL,
-                message=f"Acceso manual: {note}"
+                message=f"Acceso manual: {note}",
+                log=log
             )
             
         finally:
@@ -0,0 +1,143 @@
+"""
+Consultas de la vista de analítica, con caché por período y versión del snapshot.
+"""
+import threading
+from collections import Counter, OrderedDict
+from datetime import date, datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+from src.config import REPORTING_MAX_AGE
+from src.db.database import get_reporting_db, reporting_snapshot_time, reporting_snapshot_age
+from src.db.repository import UserRepository, AccessLogRepository
+from src.utils.enums import AccessResult
+
+
+# Informes que se conservan (cada uno es de unos pocos KB)
+ANALYTICS_CACHE_SIZE = 8
+
+
+class AnalyticsReport(NamedTuple):
+    """Datos de todos los gráficos de un período."""
+    fecha_desde: date
+    fecha_hasta: date
+    snapshot_time: float        # Publicación del snapshot consultado
+    per_day: List[tuple]        # (fecha, permitidos, denegados), todos los días del período
+    per_hour: List[int]         # Ingresos permitidos por hora (0 a 23)
+    per_weekday: List[int]      # Ingresos permitidos por día (0 = lunes)
+    new_members: List[tuple]    # ("YYYY-MM", cantidad), todos los meses del período
+    plan_mix: List[tuple]       # (PlanType, cantidad) de los socios activos
+    payment_mix: List[tuple]    # (PaymentMethod o None, cantidad) de los socios activos
+
+
+def build_report(fecha_desde: date, fecha_hasta: date) -> AnalyticsReport:
+    """
+    Consulta los datos de los gráficos de un período en el snapshot de reportes.
+    
+    Los tres gráficos de accesos salen de un único resumen por hora
+    (AccessLogRepository.hourly_counts). Se ejecuta en un hilo de carga:
+    el snapshot es un archivo aparte, así que no compite con el registro
+    de accesos en la puerta.
+    """
+    desde = datetime.combine(fecha_desde, datetime.min.time())
+    hasta = datetime.combine(fecha_hasta, datetime.max.time())
+    
+    db = get_reporting_db()
+    try:
+        snapshot_time = reporting_snapshot_time()
+        hourly = AccessLogRepository(db).hourly_counts(desde, hasta)
+        user_repo = UserRepository(db)
+        new_members = dict(user_repo.new_members_per_month(desde, hasta))
+        plan_mix = user_repo.plan_mix()
+        payment_mix = user_repo.payment_mix()
+    finally:
+        db.close()
+    
+    permitidos, denegados = Counter(), Counter()
+    per_hour = [0] * 24
+    per_weekday = [0] * 7
+    for hora, resultado, cantidad in hourly:
+        day = date.fromisoformat(hora[:10])
+        if resultado == AccessResult.PERMITIDO:
+            permitidos[day] += cantidad
+            per_hour[int(hora[11:13])] += cantidad
+            per_weekday[day.weekday()] += cantidad
+        else:
+            denegados[day] += cantidad
+    
+    days = (fecha_hasta - fecha_desde).days + 1
+    per_day = [
+        (day, permitidos[day], denegados[day])
+        for day in (fecha_desde + timedelta(days=offset) for offset in range(days))
+    ]
+    
+    months = []
+    month = fecha_desde.replace(day=1)
+    while month <= fecha_hasta:
+        key = month.strftime("%Y-%m")
+        months.append((key, new_members.get(key, 0)))
+        month = (month + timedelta(days=32)).replace(day=1)
+    
+    return AnalyticsReport(
+        fecha_desde=fecha_desde,
+        fecha_hasta=fecha_hasta,
+        snapshot_time=snapshot_time,
+        per_day=per_day,
+        per_hour=per_hour,
+        per_weekday=per_weekday,
+        new_members=months,
+        plan_mix=sorted(plan_mix, key=lambda item: item[0].months),
+        payment_mix=sorted(payment_mix, key=lambda item: -item[1]),
+    )
+
+
+class AnalyticsCache:
+    """
+    Informes ya calculados, por período y versión del snapshot.
+    
+    La versión es el momento de publicación del snapshot de reportes:
+    mientras no se publique otro, los datos de un período no cambian y el
+    informe se reutiliza sin consultar. Se conservan los últimos
+    ANALYTICS_CACHE_SIZE informes. Es seguro usarlo desde el hilo de carga
+    y desde el de la UI.
+    """
+    
+    def __init__(self, size: int = ANALYTICS_CACHE_SIZE):
+        self._size = size
+        self._reports = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def peek(self, fecha_desde: date, fecha_hasta: date) -> Optional[AnalyticsReport]:
+        """
+        Informe en caché si el snapshot actual está vigente (no consulta la base).
+        
+        Returns:
+            El informe, o None si hay que calcularlo con get()
+        """
+        age = reporting_snapshot_age()
+        if age is None or age > REPORTING_MAX_AGE:
+            return None
+        return self._lookup((fecha_desde, fecha_hasta, reporting_snapshot_time()))
+    
+    def get(self, fecha_desde: date, fecha_hasta: date) -> AnalyticsReport:
+        """
+        Informe de un período, desde la caché o consultándolo (hilo de carga).
+        
+        Si el snapshot está vencido se publica uno nuevo antes de consultar.
+        """
+        report = self.peek(fecha_desde, fecha_hasta)
+        if report is not None:
+            return report
+        
+        report = build_report(fecha_desde, fecha_hasta)
+        with self._lock:
+            self._reports[(fecha_desde, fecha_hasta, report.snapshot_time)] = report
+            while len(self._reports) > self._size:
+                self._reports.popitem(last=False)
+        return report
+    
+    def _lookup(self, key: tuple) -> Optional[AnalyticsReport]:
+        with self._lock:
+            report = self._reports.get(key)
+            if report is not None:
+                self._reports.move_to_end(key)
+            return report
@@ -0,0 +1,132 @@
+"""
+Carga asíncrona de datos para las vistas.
+"""
+from typing import Any, Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+# Hilos del pool de carga: SQLite en modo WAL admite lectores concurrentes,
+# pero más de dos consultas grandes a la vez solo compiten por el disco
+LOADER_MAX_THREADS = 2
+
+# Pool compartido por las vistas
+DEFAULT_POOL = "default"
+
+_pools: Dict[str, QThreadPool] = {}
+
+
+def get_loader_pool(name: str = DEFAULT_POOL) -> QThreadPool:
+    """
+    Obtiene un pool de hilos de carga.
+    
+    Args:
+        name: Pool compartido (por defecto) o uno propio de un hilo, para
+              cargas cortas que no deben esperar detrás de las de las vistas
+    """
+    pool = _pools.get(name)
+    if pool is None:
+        pool = _pools[name] = QThreadPool()
+        pool.setMaxThreadCount(LOADER_MAX_THREADS if name == DEFAULT_POOL else 1)
+    return pool
+
+
+def wait_for_loaders():
+    """Espera a que terminen las cargas en curso (al cerrar la aplicación)."""
+    for pool in _pools.values():
+        pool.clear()
+        pool.waitForDone()
+
+
+class _LoadTask(QRunnable):
+    """Ejecuta una función de carga en un hilo del pool."""
+    
+    def __init__(self, loader: "AsyncLoader", generation: int, fn: Callable[[], Any]):
+        super().__init__()
+        self._loader = loader
+        self._generation = generation
+        self._fn = fn
+    
+    def run(self):
+        # Si ya hay un pedido más nuevo, ni siquiera se consulta
+        if not self._loader.is_current(self._generation):
+            return
+        
+        try:
+            result, error = self._fn(), None
+        except Exception as e:
+            result, error = None, e
+        self._loader._finished.emit(self._generation, result, error)
+
+
+class AsyncLoader(QObject):
+    """
+    Ejecuta las consultas de una vista fuera del hilo de la UI.
+    
+    Cada llamada a load() invalida las anteriores (token de generación):
+    los pedidos que todavía no empezaron se descartan sin consultar y los
+    resultados que llegan tarde se ignoran, de modo que a la vista solo
+    se le aplica el último pedido. La función de carga se ejecuta en otro
+    hilo, por lo que debe abrir su propia sesión y no tocar widgets.
+    """
+    
+    # True al empezar una carga, False al aplicarla o cancelarla
+    loading_changed = Signal(bool)
+    
+    # Uso interno: (generación, resultado, error) desde el hilo de trabajo
+    _finished = Signal(int, object, object)
+    
+    def __init__(self, parent=None, pool: str = DEFAULT_POOL):
+        super().__init__(parent)
+        self._pool = pool
+        self._generation = 0
+        self._on_done: Optional[Callable[[Any], None]] = None
+        self._loading = False
+        self._finished.connect(self._on_finished)
+    
+    @property
+    def is_loading(self) -> bool:
+        """Indica si hay una carga pendiente."""
+        return self._loading
+    
+    def load(self, fn: Callable[[], Any], on_done: Callable[[Any], None]):
+        """
+        Ejecuta fn en el pool y entrega su resultado a on_done en el hilo de la UI.
+        
+        Args:
+            fn: Función de carga (se ejecuta en otro hilo)
+            on_done: Recibe el resultado, solo si este sigue siendo el último pedido
+        """
+        self._generation += 1
+        self._on_done = on_done
+        self._set_loading(True)
+        get_loader_pool(self._pool).start(_LoadTask(self, self._generation, fn))
+    
+    def cancel(self):
+        """Descarta el pedido en curso."""
+        self._generation += 1
+        self._on_done = None
+        self._set_loading(False)
+    
+    def is_current(self, generation: int) -> bool:
+        """Indica si la generación corresponde al último pedido."""
+        return generation == self._generation
+    
+    def _on_finished(self, generation: int, result, error):
+        """Aplica el resultado en el hilo de la UI si no quedó obsoleto."""
+        if generation != self._generation:
+            return
+        
+        on_done, self._on_done = self._on_done, None
+        self._set_loading(False)
+        
+        if error is not None:
+            print(f"Error cargando datos: {error}")
+            return
+        if on_done is not None:
+            on_done(result)
+    
+    def _set_loading(self, loading: bool):
+        if loading != self._loading:
+            self._loading = loading
+            self.loading_changed.emit(loading)
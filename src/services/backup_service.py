@@ -1,12 +1,13 @@
 """
 Servicio de backup diario para la base de datos SQLite.
 """
-import shutil
+import sqlite3
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
 from src.config import DATA_DIR, DATABASE_PATH
+from src.db.database import backup_database
 
 
 @dataclass
@@ -21,6 +22,7 @@ def create_daily_backup() -> BackupResult:
 
     Destino: DATA_DIR / yyyy-mm-dd / gym_access.db
     Si ya existe un archivo en esa ruta, se sobrescribe.
+    Se usa la API de backup de SQLite para incluir los cambios aún en el WAL.
     """
     if not DATABASE_PATH.exists():
         return BackupResult(
@@ -34,8 +36,8 @@ def create_daily_backup() -> BackupResult:
 
     dest = today_folder / DATABASE_PATH.name
     try:
-        shutil.copy2(DATABASE_PATH, dest)
-    except OSError as exc:
+        backup_database(dest)
+    except (OSError, sqlite3.Error) as exc:
         return BackupResult(ok=False, path=None, message=f"Error al copiar:\n{exc}")
 
     return BackupResult(ok=True, path=dest, message=f"Backup guardado en:\n{dest}")
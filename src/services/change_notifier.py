@@ -0,0 +1,138 @@
+"""
+Señales Qt de los cambios publicados en el bus de la base.
+
+Adapta el bus de cambios (src/db/change_bus.py, sin Qt) a señales en el
+hilo de la UI: retira cada lote, relee una sola vez en segundo plano los
+socios modificados y lo entrega a todas las vistas.
+"""
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+from src.db.change_bus import CHANGE_TABLES, ChangeBatch, get_change_bus
+from src.db.database import get_db, get_data_version
+from src.db.repository import UserRepository
+from src.db.rows import MemberChange
+from src.services.async_loader import AsyncLoader
+from src.utils.enums import AccessResult
+
+
+# Pool propio (un hilo) para releer socios: no espera detrás de las cargas de las vistas
+NOTIFIER_POOL = "change_notifier"
+
+_notifier: Optional["ChangeNotifier"] = None
+
+
+def get_change_notifier() -> "ChangeNotifier":
+    """Obtiene el notificador de cambios compartido (se crea en el hilo de la UI)."""
+    global _notifier
+    if _notifier is None:
+        _notifier = ChangeNotifier()
+    return _notifier
+
+
+class ChangeNotifier(QObject):
+    """
+    Entrega los lotes del bus de cambios como señales.
+    
+    Cada lote se retira en la siguiente vuelta del bucle de eventos. Si
+    cambiaron socios se releen todos juntos, en una sola consulta fuera
+    del hilo de la UI, y el lote completo se entrega al terminar:
+    access_logged por cada acceso, members_changed con las filas nuevas
+    (o members_bulk_changed si fue un cambio masivo) y por último flushed.
+    Los lotes se entregan de a uno y en orden.
+    
+    batch_versions() indica las versiones de datos antes y después del
+    lote que se está entregando.
+    """
+    
+    # Socios creados, modificados o eliminados: {user_id: MemberChange, o None si se eliminó}
+    members_changed = Signal(object)
+    
+    # Cambiaron muchos socios a la vez: conviene recargar
+    members_bulk_changed = Signal()
+    
+    # Se registró un acceso (fila AccessRow)
+    access_logged = Signal(object)
+    
+    # Se terminó de entregar un lote
+    flushed = Signal()
+    
+    # Uso interno: programa el retiro del lote en el hilo de la UI
+    _flush_requested = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.loader = AsyncLoader(self, pool=NOTIFIER_POOL)
+        self._flush_requested.connect(self._flush, Qt.QueuedConnection)
+        
+        # Versiones ya entregadas a los suscriptores y las previas al lote actual
+        # (antes de escuchar: lo publicado desde ahora llega en un lote)
+        self._delivered = dict(zip(CHANGE_TABLES, get_data_version(*CHANGE_TABLES)))
+        self._before = self._delivered
+        get_change_bus().set_listener(self._flush_requested.emit)
+    
+    # --- Versiones ---
+    
+    def batch_versions(self, *tables: str) -> tuple:
+        """
+        Versiones de las tablas antes y después del último lote entregado.
+        
+        Una vista que estaba al día antes del lote y aplicó todos sus
+        eventos queda al día con la versión posterior.
+        
+        Returns:
+            (versión anterior, versión posterior), cada una como tupla
+        """
+        return tuple(self._before[t] for t in tables), tuple(self._delivered[t] for t in tables)
+    
+    def delivered_version(self, *tables: str) -> tuple:
+        """Versión de las tablas cuyos cambios ya se entregaron a los suscriptores."""
+        return tuple(self._delivered[t] for t in tables)
+    
+    # --- Entrega ---
+    
+    @Slot()
+    def _flush(self):
+        """Retira el lote pendiente y relee sus socios (si hay uno en curso, sigue al terminar)."""
+        if self.loader.is_loading:
+            return
+        batch = get_change_bus().take_batch()
+        if batch is None:
+            return
+        
+        # Un acceso permitido también modifica al socio (último acceso y visitas)
+        user_ids = list(dict.fromkeys(batch.member_ids + [
+            row.user_id for row in batch.access_rows
+            if row.user_id is not None and row.resultado == AccessResult.PERMITIDO
+        ]))
+        if batch.bulk or not user_ids:
+            self._deliver(batch, user_ids, {})
+            return
+        
+        def fetch() -> Optional[Dict[int, MemberChange]]:
+            try:
+                db = get_db()
+                try:
+                    return UserRepository(db).member_changes(user_ids)
+                finally:
+                    db.close()
+            except Exception as e:
+                print(f"Error releyendo socios modificados: {e}")
+                return None   # Se entrega como cambio masivo
+        
+        self.loader.load(fetch, lambda changes: self._deliver(batch, user_ids, changes))
+    
+    def _deliver(self, batch: ChangeBatch, user_ids: List[int], changes: Optional[Dict[int, MemberChange]]):
+        """Emite las señales del lote y retira el siguiente, si se publicó alguno."""
+        self._before, self._delivered = self._delivered, batch.versions
+        
+        for row in batch.access_rows:
+            self.access_logged.emit(row)
+        if batch.bulk or changes is None:
+            self.members_bulk_changed.emit()
+        elif user_ids:
+            self.members_changed.emit({user_id: changes.get(user_id) for user_id in user_ids})
+        self.flushed.emit()
+        
+        self._flush()
@@ -0,0 +1,283 @@
+"""
+Indicadores del panel de recepción, mantenidos en memoria.
+"""
+from collections import Counter, deque
+from datetime import date, datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from src.config import DASHBOARD_RECENT_ACCESSES, DASHBOARD_STAY_MINUTES, DASHBOARD_EXPIRING_DAYS
+from src.db.database import get_db
+from src.db.repository import UserRepository, AccessLogRepository
+from src.db.rows import AccessRow, MemberChange
+from src.services.async_loader import AsyncLoader
+from src.services.change_notifier import get_change_notifier
+from src.utils.enums import AccessResult, AccessReason
+
+
+# Cada cuánto se descartan de la ocupación los ingresos que ya cumplieron
+# la permanencia estimada (solo memoria, no consulta la base)
+OCCUPANCY_TICK_MS = 60_000
+
+
+class DashboardSeed(NamedTuple):
+    """Estado inicial de los indicadores, consultado en segundo plano."""
+    today: date
+    max_id: int                 # Último acceso contado; los siguientes llegan por el bus
+    counts: List[tuple]         # (resultado, motivo, cantidad) de hoy
+    entries: List[tuple]        # (id, timestamp, user_id) dentro de la permanencia
+    recent: List[AccessRow]     # Últimos accesos, del más reciente al más antiguo
+    plan_ends: List[tuple]      # (id, fecha_fin_plan) de los socios activos vigentes
+
+
+def _occupancy_key(log_id: int, user_id) -> object:
+    """Un socio cuenta una vez aunque vuelva a pasar; cada visitante, por separado."""
+    return user_id if user_id is not None else ("registro", log_id)
+
+
+class DashboardStats(QObject):
+    """
+    Indicadores del panel de recepción: ingresos y denegaciones del día,
+    ocupación estimada, socios que vencen esta semana y últimos accesos.
+    
+    Se calculan una vez al arrancar con consultas de agregación (load) y
+    después se actualizan en memoria con lo que publica el bus de cambios:
+    cada acceso registrado suma a los contadores y los socios modificados
+    se releen de a uno al entregarse el lote. No hay consultas periódicas;
+    el temporizador interno solo descarta ingresos vencidos de la ocupación
+    y reinicia los contadores al cambiar el día.
+    
+    La ocupación es una estimación: no se registran salidas, así que se
+    cuentan los socios que ingresaron en los últimos DASHBOARD_STAY_MINUTES.
+    """
+    
+    # Cambió algún indicador (se emite como máximo una vez por lote del bus)
+    changed = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ready = False
+        self._today = date.today()
+        self._max_id = 0
+        
+        self._entries = 0
+        self._denials = Counter()
+        self._inside: Dict[object, datetime] = {}   # clave de ocupación -> último ingreso
+        self._recent = deque(maxlen=DASHBOARD_RECENT_ACCESSES)
+        self._plan_ends: Dict[int, date] = {}
+        self._ends_per_day = Counter()
+        
+        # Eventos recibidos mientras se carga (se aplican al terminar)
+        self._pending_access: List[AccessRow] = []
+        self._pending_members: Dict[int, Optional[MemberChange]] = {}
+        self._dirty = False
+        
+        self.loader = AsyncLoader(self)
+        
+        self._tick = QTimer(self)
+        self._tick.setInterval(OCCUPANCY_TICK_MS)
+        self._tick.timeout.connect(self._on_tick)
+        
+        notifier = get_change_notifier()
+        notifier.access_logged.connect(self._on_access_logged)
+        notifier.members_changed.connect(self._on_members_changed)
+        notifier.members_bulk_changed.connect(self._on_members_bulk_changed)
+        notifier.flushed.connect(self._on_changes_flushed)
+    
+    # --- Indicadores ---
+    
+    @property
+    def is_ready(self) -> bool:
+        """Indica si los indicadores ya se cargaron."""
+        return self._ready
+    
+    @property
+    def entries_today(self) -> int:
+        """Ingresos permitidos de hoy."""
+        return self._entries
+    
+    @property
+    def denials_today(self) -> Dict[AccessReason, int]:
+        """Accesos denegados de hoy por motivo."""
+        return dict(self._denials)
+    
+    @property
+    def occupancy(self) -> int:
+        """Personas que se estima que están en el gimnasio."""
+        return len(self._inside)
+    
+    @property
+    def expiring_this_week(self) -> int:
+        """Socios activos cuyo plan vence entre hoy y los próximos DASHBOARD_EXPIRING_DAYS días."""
+        return sum(
+            self._ends_per_day[self._today + timedelta(days=offset)]
+            for offset in range(DASHBOARD_EXPIRING_DAYS + 1)
+        )
+    
+    @property
+    def recent_accesses(self) -> List[AccessRow]:
+        """Últimos accesos, del más reciente al más antiguo."""
+        return list(self._recent)
+    
+    # --- Carga ---
+    
+    def load(self):
+        """Consulta el estado inicial en segundo plano."""
+        self._pending_access = []
+        self._pending_members.clear()
+        
+        def seed() -> DashboardSeed:
+            today = date.today()
+            db = get_db()
+            try:
+                access_repo = AccessLogRepository(db)
+                max_id = access_repo.last_id()
+                stay_start = datetime.now() - timedelta(minutes=DASHBOARD_STAY_MINUTES)
+                return DashboardSeed(
+                    today=today,
+                    max_id=max_id,
+                    counts=access_repo.counts_since(datetime.combine(today, datetime.min.time()), max_id),
+                    entries=access_repo.entries_since(stay_start, max_id),
+                    recent=[
+                        row for row in access_repo.search_page(limit=DASHBOARD_RECENT_ACCESSES)
+                        if row.id <= max_id
+                    ],
+                    plan_ends=UserRepository(db).plan_end_dates(today),
+                )
+            finally:
+                db.close()
+        
+        self.loader.load(seed, self._apply_seed)
+    
+    def _apply_seed(self, seed: DashboardSeed):
+        """Adopta el estado inicial y aplica los eventos llegados mientras tanto."""
+        self._today = seed.today
+        self._max_id = seed.max_id
+        
+        self._entries = 0
+        self._denials = Counter()
+        for resultado, motivo, count in seed.counts:
+            if resultado == AccessResult.PERMITIDO:
+                self._entries += count
+            else:
+                self._denials[motivo] += count
+        
+        self._inside = {
+            _occupancy_key(log_id, user_id): timestamp
+            for log_id, timestamp, user_id in seed.entries
+        }
+        self._recent = deque(seed.recent, maxlen=DASHBOARD_RECENT_ACCESSES)
+        
+        self._plan_ends = dict(seed.plan_ends)
+        self._ends_per_day = Counter(self._plan_ends.values())
+        
+        self._ready = True
+        pending, self._pending_access = self._pending_access, []
+        for row in pending:
+            self._count_access(row)
+        self._patch_members()
+        self._prune_occupancy()
+        
+        self._tick.start()
+        self._dirty = False
+        self.changed.emit()
+    
+    # --- Eventos ---
+    
+    @Slot(object)
+    def _on_access_logged(self, row: AccessRow):
+        if not self._ready or self.loader.is_loading:
+            self._pending_access.append(row)
+            return
+        self._count_access(row)
+    
+    @Slot(object)
+    def _on_members_changed(self, changes: Dict[int, Optional[MemberChange]]):
+        self._pending_members.update(changes)
+    
+    @Slot()
+    def _on_members_bulk_changed(self):
+        """Ante un cambio masivo se vuelven a calcular (si ya se habían cargado o se están cargando)."""
+        if self._ready or self.loader.is_loading:
+            self.load()
+    
+    @Slot()
+    def _on_changes_flushed(self):
+        if not self._ready or self.loader.is_loading:
+            return
+        self._patch_members()
+        if self._dirty:
+            self._dirty = False
+            self.changed.emit()
+    
+    @Slot()
+    def _on_tick(self):
+        """Cambio de día y ocupación vencida (sin consultar la base)."""
+        changed = self._roll_day(date.today())
+        changed = self._prune_occupancy() or changed
+        if changed:
+            self.changed.emit()
+    
+    # --- Internos ---
+    
+    def _count_access(self, row: AccessRow):
+        """Suma un acceso registrado a los indicadores."""
+        if row.id <= self._max_id:
+            return   # Ya incluido en la carga inicial
+        self._max_id = row.id
+        self._roll_day(row.timestamp.date())
+        
+        if row.resultado == AccessResult.PERMITIDO:
+            self._entries += 1
+            self._inside[_occupancy_key(row.id, row.user_id)] = row.timestamp
+        else:
+            self._denials[row.motivo] += 1
+        self._recent.appendleft(row)
+        self._dirty = True
+    
+    def _roll_day(self, today: date) -> bool:
+        """Reinicia los contadores del día si cambió la fecha."""
+        if today <= self._today:
+            return False
+        self._today = today
+        self._entries = 0
+        self._denials = Counter()
+        self._dirty = True
+        return True
+    
+    def _prune_occupancy(self) -> bool:
+        """Descarta de la ocupación los ingresos anteriores a la permanencia estimada."""
+        stay_start = datetime.now() - timedelta(minutes=DASHBOARD_STAY_MINUTES)
+        expired = [key for key, timestamp in self._inside.items() if timestamp < stay_start]
+        for key in expired:
+            del self._inside[key]
+        return bool(expired)
+    
+    def _patch_members(self):
+        """Aplica los socios modificados: vencimiento y nombre en los últimos accesos."""
+        changes, self._pending_members = self._pending_members, {}
+        if not changes:
+            return
+        
+        rows = {user_id: change.member for user_id, change in changes.items() if change is not None}
+        user_ids = changes.keys()
+        for user_id in user_ids:
+            old_end = self._plan_ends.pop(user_id, None)
+            if old_end is not None:
+                self._ends_per_day[old_end] -= 1
+            row = rows.get(user_id)
+            if row is not None and row.activo and row.fecha_fin_plan >= self._today:
+                self._plan_ends[user_id] = row.fecha_fin_plan
+                self._ends_per_day[row.fecha_fin_plan] += 1
+        
+        # Un socio eliminado deja sus accesos sin usuario asociado
+        for i, access in enumerate(self._recent):
+            if access.user_id in user_ids:
+                row = rows.get(access.user_id)
+                self._recent[i] = access._replace(
+                    nombre=row.nombre if row else None,
+                    apellido=row.apellido if row else None,
+                    user_id=access.user_id if row else None
+                )
+        self._dirty = True
@@ -0,0 +1,226 @@
+"""
+Servicio de mantenimiento programado de la base de datos SQLite.
+"""
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QObject, QThreadPool, QTimer
+
+from src.config import DATABASE_PATH, MAINTENANCE_IDLE_MINUTES, MAINTENANCE_INTERVAL_HOURS
+from src.db.database import get_engine
+
+
+# Páginas liberadas por cada paso de incremental_vacuum (entre pasos se
+# verifica si hay que ceder la base al control de acceso)
+VACUUM_STEP_PAGES = 256
+
+# Fracción de cambio en la cantidad de filas que justifica un nuevo ANALYZE
+ANALYZE_CHANGE_RATIO = 0.10
+
+
+@dataclass
+class MaintenanceResult:
+    ok: bool
+    cancelled: bool = False
+    duration: float = 0.0
+    reclaimed_bytes: int = 0
+    analyzed: list = field(default_factory=list)
+    message: str = ""
+
+
+def _database_size() -> int:
+    """Tamaño en disco de la base, incluyendo el archivo WAL."""
+    size = 0
+    for path in (DATABASE_PATH, DATABASE_PATH.with_name(DATABASE_PATH.name + "-wal")):
+        try:
+            size += path.stat().st_size
+        except FileNotFoundError:
+            pass
+    return size
+
+
+class MaintenanceJob:
+    """
+    Una ejecución del mantenimiento.
+    
+    Corre en un hilo del pool. cancel() puede llamarse desde el hilo de la UI:
+    interrumpe la sentencia SQLite en curso y el trabajo termina sin empezar
+    el paso siguiente.
+    """
+    
+    def __init__(self):
+        self._cancel = threading.Event()
+        self._conn = None
+        self._conn_lock = threading.Lock()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+    
+    def cancel(self):
+        """Cede la base de inmediato (se llama al leerse una tarjeta)."""
+        self._cancel.set()
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.interrupt()
+    
+    def run(self) -> MaintenanceResult:
+        """Ejecuta optimize, ANALYZE, vacuum incremental y checkpoint del WAL."""
+        started = time.perf_counter()
+        size_before = _database_size()
+        result = MaintenanceResult(ok=True)
+        
+        raw = get_engine().raw_connection()
+        with self._conn_lock:
+            self._conn = raw.driver_connection
+        try:
+            steps = (
+                self._optimize,
+                self._analyze_changed_tables,
+                self._incremental_vacuum,
+                self._checkpoint,
+            )
+            for step in steps:
+                if self.cancelled:
+                    break
+                step(self._conn, result)
+        except sqlite3.OperationalError as e:
+            # "interrupted" si se canceló; cualquier otro error se informa
+            if not self.cancelled:
+                result.ok = False
+                result.message = str(e)
+        finally:
+            with self._conn_lock:
+                self._conn = None
+            raw.close()
+        
+        result.cancelled = self.cancelled
+        result.duration = time.perf_counter() - started
+        result.reclaimed_bytes = max(size_before - _database_size(), 0)
+        return result
+    
+    def _optimize(self, conn: sqlite3.Connection, result: MaintenanceResult):
+        conn.execute("PRAGMA optimize")
+    
+    def _analyze_changed_tables(self, conn: sqlite3.Connection, result: MaintenanceResult):
+        """ANALYZE solo de las tablas cuya cantidad de filas cambió respecto de sqlite_stat1."""
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        analyzed_rows = {}
+        if has_stats:
+            # El primer número de "stat" es la cantidad de filas al momento del ANALYZE
+            analyzed_rows = dict(conn.execute(
+                "SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 GROUP BY tbl"
+            ).fetchall())
+        
+        tables = [
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+        for table in tables:
+            if self.cancelled:
+                return
+            rows = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            previous = analyzed_rows.get(table)
+            if previous is not None and abs(rows - previous) <= previous * ANALYZE_CHANGE_RATIO:
+                continue
+            conn.execute(f'ANALYZE "{table}"')
+            result.analyzed.append(table)
+    
+    def _incremental_vacuum(self, conn: sqlite3.Connection, result: MaintenanceResult):
+        """
+        Libera páginas vacías de a VACUUM_STEP_PAGES.
+        
+        Una base creada antes de activar auto_vacuum=INCREMENTAL se convierte
+        una única vez con VACUUM completo (interrumpible; si se cancela, la
+        base queda como estaba y se reintenta en el próximo mantenimiento).
+        """
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            return
+        
+        while not self.cancelled:
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if free_pages == 0:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES})").fetchall()
+    
+    def _checkpoint(self, conn: sqlite3.Connection, result: MaintenanceResult):
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+
+class DatabaseMaintenance(QObject):
+    """
+    Programa el mantenimiento de la base en horarios ociosos.
+    
+    Se considera ocioso cuando no hubo lecturas de tarjeta durante
+    MAINTENANCE_IDLE_MINUTES. Como máximo se completa un mantenimiento cada
+    MAINTENANCE_INTERVAL_HOURS; uno cancelado por una lectura se reintenta
+    en el próximo período ocioso.
+    """
+    
+    def __init__(self, idle_minutes: int = None, interval_hours: int = None, parent=None):
+        super().__init__(parent)
+        self.idle_seconds = (idle_minutes or MAINTENANCE_IDLE_MINUTES) * 60
+        self.interval_seconds = (interval_hours or MAINTENANCE_INTERVAL_HOURS) * 3600
+        
+        self._last_activity = time.monotonic()
+        self._last_completed = None
+        self._job = None
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(60 * 1000)
+        self._timer.timeout.connect(self._on_tick)
+    
+    def start(self):
+        """Activa la verificación periódica de inactividad."""
+        self._timer.start()
+    
+    def stop(self):
+        """Detiene la programación y cancela un mantenimiento en curso."""
+        self._timer.stop()
+        self.notify_activity()
+    
+    def notify_activity(self):
+        """Registra actividad en la puerta y cancela el mantenimiento en curso."""
+        self._last_activity = time.monotonic()
+        if self._job is not None:
+            self._job.cancel()
+    
+    def _on_tick(self):
+        """Inicia el mantenimiento si el sistema está ocioso y corresponde."""
+        if self._job is not None:
+            return
+        now = time.monotonic()
+        if now - self._last_activity < self.idle_seconds:
+            return
+        if self._last_completed is not None and now - self._last_completed < self.interval_seconds:
+            return
+        
+        self._job = MaintenanceJob()
+        QThreadPool.globalInstance().start(self._run_job)
+    
+    def _run_job(self):
+        """Ejecuta el trabajo (fuera del hilo de la UI) y registra el resultado."""
+        job = self._job
+        try:
+            result = job.run()
+        finally:
+            self._job = None
+        
+        if result.cancelled:
+            print(f"Mantenimiento de base cancelado por actividad ({result.duration:.2f} s).")
+        elif not result.ok:
+            print(f"Error en mantenimiento de base: {result.message}")
+        else:
+            self._last_completed = time.monotonic()
+            analyzed = ", ".join(result.analyzed) or "ninguna"
+            print(
+                f"Mantenimiento de base completado en {result.duration:.2f} s: "
+                f"{result.reclaimed_bytes / 1024:.0f} KB liberados, ANALYZE en: {analyzed}."
+            )
@@ -0,0 +1,288 @@
+"""
+Índice en memoria para la búsqueda rápida de socios (Ctrl+K).
+"""
+import sys
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Union
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from src.db.database import get_db
+from src.db.repository import UserRepository, QUICK_SEARCH_FIELDS
+from src.db.rows import QuickSearchRow, MemberChange
+from src.services.async_loader import AsyncLoader
+from src.services.change_notifier import get_change_notifier
+
+
+# Posiciones de los campos en las filas (ver QUICK_SEARCH_FIELDS)
+(
+    F_ID, F_APELLIDO, F_NOMBRE, F_EMAIL, F_CELULAR, F_RFID, F_ACTIVO
+) = range(len(QUICK_SEARCH_FIELDS))
+
+# Separadores que se ignoran en teléfonos y UIDs ("AB-CD-EF" -> "abcdef")
+_SEPARATORS = str.maketrans("", "", "-:. ()/+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Texto en minúsculas y sin acentos, para comparar."""
+    if not text:
+        return ""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _compact(text: Optional[str]) -> str:
+    """Texto normalizado y sin separadores (teléfonos, UIDs)."""
+    return normalize_text(text).translate(_SEPARATORS)
+
+
+def member_keys(row: QuickSearchRow) -> tuple:
+    """
+    Claves de búsqueda de un socio: cada palabra del apellido y del nombre,
+    el email, el celular y el UID de la tarjeta (estos dos sin separadores).
+    """
+    keys = normalize_text(row[F_APELLIDO]).split() + normalize_text(row[F_NOMBRE]).split()
+    for key in (normalize_text(row[F_EMAIL]), _compact(row[F_CELULAR]), _compact(row[F_RFID])):
+        if key:
+            keys.append(key)
+    # Las claves repetidas entre socios ("juan") comparten el mismo objeto
+    return tuple(sys.intern(key) for key in dict.fromkeys(keys))
+
+
+class PrefixIndex:
+    """
+    Índice de prefijos sobre las claves de los socios.
+    
+    Las claves distintas se guardan en una lista ordenada; las que empiezan
+    con un prefijo forman un tramo contiguo que se ubica por bisección.
+    Cada clave apunta a los socios que la tienen: el ID directamente si es
+    uno solo (email, celular y UID casi siempre lo son) o una lista si son
+    varios, lo que ahorra una lista por clave. No depende de Qt ni de la
+    base, así que se puede construir en un hilo de carga.
+    """
+    
+    def __init__(self, rows: Iterable[QuickSearchRow] = ()):
+        self._records: Dict[int, QuickSearchRow] = {}
+        self._keys_of: Dict[int, tuple] = {}
+        self._postings: Dict[str, Union[int, List[int]]] = {}
+        
+        for row in rows:
+            keys = member_keys(row)
+            self._records[row[F_ID]] = row
+            self._keys_of[row[F_ID]] = keys
+            for key in keys:
+                self._add_posting(key, row[F_ID], keep_sorted=False)
+        self._sorted_keys: List[str] = sorted(self._postings)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def upsert(self, row: QuickSearchRow):
+        """Agrega o reemplaza un socio."""
+        user_id = row[F_ID]
+        old_keys = self._keys_of.get(user_id, ())
+        keys = member_keys(row)
+        
+        for key in old_keys:
+            if key not in keys:
+                self._remove_posting(key, user_id)
+        for key in keys:
+            if key not in old_keys:
+                self._add_posting(key, user_id)
+        
+        self._records[user_id] = row
+        self._keys_of[user_id] = keys
+    
+    def remove(self, user_id: int):
+        """Quita un socio (si estaba)."""
+        for key in self._keys_of.pop(user_id, ()):
+            self._remove_posting(key, user_id)
+        self._records.pop(user_id, None)
+    
+    def search(self, text: str, limit: int) -> List[QuickSearchRow]:
+        """
+        Socios cuyas claves empiezan con cada palabra del texto.
+        
+        Se recorre el tramo del índice de la palabra más selectiva y las
+        demás se verifican contra las claves de cada candidato.
+        
+        Args:
+            text: Texto ingresado (nombre, email, celular o UID)
+            limit: Cantidad máxima de resultados
+        
+        Returns:
+            Filas de los socios, en orden de clave
+        """
+        words = [self._variants(word) for word in normalize_text(text).split()]
+        if not words:
+            return []
+        
+        ranges = [[self._key_range(variant) for variant in variants] for variants in words]
+        narrowest = min(range(len(words)), key=lambda i: sum(hi - lo for lo, hi in ranges[i]))
+        others = words[:narrowest] + words[narrowest + 1:]
+        
+        results = []
+        seen = set()
+        for lo, hi in ranges[narrowest]:
+            for position in range(lo, hi):
+                ids = self._postings[self._sorted_keys[position]]
+                for user_id in (ids,) if isinstance(ids, int) else ids:
+                    if user_id in seen:
+                        continue
+                    seen.add(user_id)
+                    if others and not self._matches(self._keys_of[user_id], others):
+                        continue
+                    results.append(self._records[user_id])
+                    if len(results) >= limit:
+                        return results
+        return results
+    
+    def footprint(self) -> int:
+        """Memoria aproximada del índice en bytes (estructuras, claves y filas)."""
+        size = sum(sys.getsizeof(c) for c in (self._records, self._keys_of, self._postings, self._sorted_keys))
+        size += sum(sys.getsizeof(key) for key in self._sorted_keys)
+        size += sum(sys.getsizeof(ids) for ids in self._postings.values() if isinstance(ids, list))
+        size += sum(sys.getsizeof(keys) for keys in self._keys_of.values())
+        for row in self._records.values():
+            size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row if isinstance(value, str))
+        return size
+    
+    # --- Internos ---
+    
+    @staticmethod
+    def _variants(word: str) -> tuple:
+        """La palabra tal cual y, si cambia, sin separadores (celular, UID)."""
+        compact = word.translate(_SEPARATORS)
+        return (word, compact) if compact and compact != word else (word,)
+    
+    def _key_range(self, prefix: str) -> tuple:
+        """Tramo [lo, hi) de claves que empiezan con el prefijo."""
+        lo = bisect_left(self._sorted_keys, prefix)
+        hi = bisect_left(self._sorted_keys, prefix + "\U0010ffff", lo)
+        return lo, hi
+    
+    @staticmethod
+    def _matches(keys: tuple, words: list) -> bool:
+        """Cada palabra (en alguna de sus variantes) es prefijo de alguna clave."""
+        return all(
+            any(key.startswith(variant) for variant in variants for key in keys)
+            for variants in words
+        )
+    
+    def _add_posting(self, key: str, user_id: int, keep_sorted: bool = True):
+        ids = self._postings.get(key)
+        if ids is None:
+            self._postings[key] = user_id
+            if keep_sorted:
+                insort(self._sorted_keys, key)
+        elif isinstance(ids, int):
+            self._postings[key] = [ids, user_id]
+        else:
+            ids.append(user_id)
+    
+    def _remove_posting(self, key: str, user_id: int):
+        ids = self._postings.get(key)
+        if ids == user_id:
+            del self._postings[key]
+            del self._sorted_keys[bisect_left(self._sorted_keys, key)]
+        elif isinstance(ids, list) and user_id in ids:
+            ids.remove(user_id)
+            if len(ids) == 1:
+                self._postings[key] = ids[0]
+
+
+class MemberIndex(QObject):
+    """
+    Índice de búsqueda rápida de socios, mantenido al día con el bus de cambios.
+    
+    Se construye en segundo plano (load) y después se actualiza socio por
+    socio con lo que publican los repositorios; un cambio masivo lo vuelve
+    a construir. Las búsquedas no consultan la base.
+    """
+    
+    # El índice se cargó o se reconstruyó
+    ready = Signal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index: Optional[PrefixIndex] = None
+        self._pending_members: Dict[int, Optional[MemberChange]] = {}
+        self.loader = AsyncLoader(self)
+        
+        notifier = get_change_notifier()
+        notifier.members_changed.connect(self._on_members_changed)
+        notifier.members_bulk_changed.connect(self._on_members_bulk_changed)
+        notifier.flushed.connect(self._on_changes_flushed)
+    
+    @property
+    def is_ready(self) -> bool:
+        """Indica si el índice ya se cargó."""
+        return self._index is not None
+    
+    def load(self):
+        """Construye el índice en segundo plano."""
+        self._pending_members.clear()
+        
+        def build():
+            db = get_db()
+            try:
+                rows = UserRepository(db).quick_search_rows()
+            finally:
+                db.close()
+            return PrefixIndex(rows)
+        
+        self.loader.load(build, self._apply_index)
+    
+    def search(self, text: str, limit: int) -> List[QuickSearchRow]:
+        """
+        Busca socios por prefijo de nombre, apellido, email, celular o UID.
+        
+        Returns:
+            Filas de los socios; vacío si el
+            índice todavía no se cargó
+        """
+        if self._index is None:
+            return []
+        return self._index.search(text, limit)
+    
+    def footprint(self) -> int:
+        """Memoria aproximada del índice en bytes."""
+        return self._index.footprint() if self._index is not None else 0
+    
+    def _apply_index(self, index: PrefixIndex):
+        """Adopta el índice construido y aplica los cambios llegados mientras tanto."""
+        self._index = index
+        self._patch_members()
+        print(f"Índice de búsqueda rápida: {len(index)} socio(s), {index.footprint() / 2**20:.1f} MB")
+        self.ready.emit()
+    
+    @Slot(object)
+    def _on_members_changed(self, changes: Dict[int, Optional[MemberChange]]):
+        self._pending_members.update(changes)
+    
+    @Slot()
+    def _on_members_bulk_changed(self):
+        """Ante un cambio masivo se reconstruye (si ya se había cargado o se está cargando)."""
+        if self._index is not None or self.loader.is_loading:
+            self.load()
+    
+    @Slot()
+    def _on_changes_flushed(self):
+        if self.loader.is_loading:
+            return
+        self._patch_members()
+    
+    def _patch_members(self):
+        """Actualiza en el índice los socios modificados."""
+        changes, self._pending_members = self._pending_members, {}
+        if self._index is None:
+            return
+        
+        for user_id, change in changes.items():
+            if change is None:
+                self._index.remove(user_id)
+            else:
+                self._index.upsert(change.quick)
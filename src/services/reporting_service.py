@@ -0,0 +1,53 @@
+"""
+Servicio de publicación periódica del snapshot de reportes.
+"""
+import sqlite3
+
+from PySide6.QtCore import QObject, QThreadPool, QTimer
+
+from src.config import REPORTING_MAX_AGE
+from src.db.database import publish_reporting_snapshot
+
+
+class ReportingSnapshotPublisher(QObject):
+    """
+    Publica el snapshot de solo lectura para reportes en segundo plano.
+    
+    Se publica cada REPORTING_MAX_AGE / 2 segundos, de modo que los lectores
+    (estadísticas, ETL, herramientas externas) casi nunca encuentran el
+    snapshot vencido y no necesitan copiarlo ellos mismos.
+    """
+    
+    def __init__(self, interval_seconds: int = None, parent=None):
+        super().__init__(parent)
+        interval = interval_seconds or max(REPORTING_MAX_AGE // 2, 1)
+        
+        self._busy = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval * 1000)
+        self._timer.timeout.connect(self.publish_async)
+    
+    def start(self):
+        """Publica un snapshot inicial y activa la publicación periódica."""
+        self.publish_async()
+        self._timer.start()
+    
+    def stop(self):
+        """Detiene la publicación periódica."""
+        self._timer.stop()
+    
+    def publish_async(self):
+        """Publica un snapshot en un hilo del pool (se omite si ya hay uno en curso)."""
+        if self._busy:
+            return
+        self._busy = True
+        QThreadPool.globalInstance().start(self._publish)
+    
+    def _publish(self):
+        """Copia la base al snapshot (se ejecuta fuera del hilo de la UI)."""
+        try:
+            publish_reporting_snapshot()
+        except (OSError, sqlite3.Error) as e:
+            print(f"No se pudo publicar el snapshot de reportes: {e}")
+        finally:
+            self._busy = False
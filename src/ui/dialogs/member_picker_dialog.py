@@ -0,0 +1,144 @@
+"""
+Diálogo para elegir un usuario sin tarjeta RFID escribiendo su nombre.
+"""
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QDialogButtonBox
+)
+from PySide6.QtCore import Qt, QTimer, Slot, QEvent
+
+from src.db.database import get_db
+from src.db.repository import UserRepository
+
+
+# Coincidencias que se muestran (el resto se alcanza escribiendo más)
+PICKER_MAX_RESULTS = 20
+
+# Espera tras la última tecla antes de consultar
+PICKER_DEBOUNCE_MS = 150
+
+
+class MemberPickerDialog(QDialog):
+    """
+    Selector de usuario con búsqueda mientras se escribe.
+    
+    Cada búsqueda consulta solo las primeras PICKER_MAX_RESULTS
+    coincidencias por prefijo de apellido o nombre (ver
+    UserRepository.without_card_rows), nunca la lista completa.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self.setWindowTitle("Seleccionar Usuario")
+        self.setMinimumWidth(380)
+        self.setModal(True)
+        
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(PICKER_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._search)
+        
+        self._setup_ui()
+        self._search()
+    
+    def _setup_ui(self):
+        """Configura la interfaz del diálogo."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+        
+        lbl = QLabel("Escriba el apellido o nombre del usuario al que desea asignar la tarjeta RFID:")
+        lbl.setWordWrap(True)
+        layout.addWidget(lbl)
+        
+        self.txt_search = QLineEdit()
+        self.txt_search.setPlaceholderText("Apellido o nombre")
+        self.txt_search.textEdited.connect(self._debounce.start)
+        self.txt_search.installEventFilter(self)
+        layout.addWidget(self.txt_search)
+        
+        self.lst_results = QListWidget()
+        self.lst_results.itemDoubleClicked.connect(self.accept)
+        self.lst_results.currentRowChanged.connect(self._update_ok_button)
+        layout.addWidget(self.lst_results)
+        
+        self.lbl_hint = QLabel("")
+        self.lbl_hint.setStyleSheet("color: #888888;")
+        layout.addWidget(self.lbl_hint)
+        
+        self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+        layout.addWidget(self.buttons)
+        
+        self.txt_search.setFocus()
+    
+    @property
+    def selected_user_id(self) -> Optional[int]:
+        """ID del usuario seleccionado, o None."""
+        item = self.lst_results.currentItem()
+        return item.data(Qt.UserRole) if item else None
+    
+    @Slot()
+    def _search(self):
+        """Muestra las primeras coincidencias del texto ingresado."""
+        self._debounce.stop()
+        db = get_db()
+        try:
+            # Una fila de más indica que hay otras coincidencias sin mostrar
+            rows = UserRepository(db).without_card_rows(
+                self.txt_search.text(), limit=PICKER_MAX_RESULTS + 1
+            )
+        finally:
+            db.close()
+        
+        self.lst_results.clear()
+        for user_id, apellido, nombre in rows[:PICKER_MAX_RESULTS]:
+            item = QListWidgetItem(f"{apellido}, {nombre}")
+            item.setData(Qt.UserRole, user_id)
+            self.lst_results.addItem(item)
+        if rows:
+            self.lst_results.setCurrentRow(0)
+        
+        if not rows:
+            self.lbl_hint.setText("Sin coincidencias.")
+        elif len(rows) > PICKER_MAX_RESULTS:
+            self.lbl_hint.setText(
+                f"Se muestran las primeras {PICKER_MAX_RESULTS} coincidencias; "
+                "siga escribiendo para acotar."
+            )
+        else:
+            self.lbl_hint.setText("")
+        self._update_ok_button()
+    
+    def _on_return(self):
+        """Enter en la búsqueda: aplica la consulta pendiente o confirma la selección."""
+        if self._debounce.isActive():
+            self._search()
+            return
+        if self.selected_user_id is not None:
+            self.accept()
+    
+    @Slot()
+    def _update_ok_button(self):
+        self.buttons.button(QDialogButtonBox.Ok).setEnabled(self.selected_user_id is not None)
+    
+    def eventFilter(self, obj, event):
+        """
+        Teclado de la búsqueda: las flechas mueven la selección de la lista
+        y Enter se atiende acá (si no, el diálogo aceptaría con la selección
+        de la consulta anterior).
+        """
+        if obj is self.txt_search and event.type() == QEvent.KeyPress:
+            if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+                self._on_return()
+                return True
+            if event.key() in (Qt.Key_Down, Qt.Key_Up):
+                step = 1 if event.key() == Qt.Key_Down else -1
+                row = self.lst_results.currentRow() + step
+                if 0 <= row < self.lst_results.count():
+                    self.lst_results.setCurrentRow(row)
+                return True
+        return super().eventFilter(obj, event)
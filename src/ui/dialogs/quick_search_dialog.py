@@ -0,0 +1,132 @@
+"""
+Paleta de búsqueda rápida de socios (Ctrl+K).
+"""
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem
+)
+from PySide6.QtCore import Qt, Slot, QEvent
+
+from src.db.rows import QuickSearchRow
+from src.services.member_index import MemberIndex
+
+
+# Coincidencias que se muestran (el resto se alcanza escribiendo más)
+QUICK_SEARCH_MAX_RESULTS = 12
+
+
+class QuickSearchDialog(QDialog):
+    """
+    Salto a un socio por nombre, email, celular o UID de tarjeta.
+    
+    Busca en el índice en memoria (MemberIndex) en cada tecla, sin espera
+    ni consultas a la base: una búsqueda tarda bastante menos que un
+    cuadro, así que los resultados aparecen mientras se escribe.
+    """
+    
+    def __init__(self, index: MemberIndex, parent=None):
+        super().__init__(parent)
+        self.index = index
+        
+        self.setWindowTitle("Buscar Socio")
+        self.setMinimumWidth(520)
+        self.setModal(True)
+        
+        self._setup_ui()
+        self.index.ready.connect(self._search)
+        self._search()
+    
+    def _setup_ui(self):
+        """Configura la interfaz del diálogo."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        self.txt_search = QLineEdit()
+        self.txt_search.setPlaceholderText("Nombre, email, celular o UID de tarjeta")
+        self.txt_search.textEdited.connect(self._search)
+        self.txt_search.installEventFilter(self)
+        layout.addWidget(self.txt_search)
+        
+        self.lst_results = QListWidget()
+        self.lst_results.itemActivated.connect(self.accept)
+        layout.addWidget(self.lst_results)
+        
+        self.lbl_hint = QLabel("")
+        self.lbl_hint.setStyleSheet("color: #888888;")
+        layout.addWidget(self.lbl_hint)
+        
+        self.txt_search.setFocus()
+    
+    @property
+    def selected_user_id(self) -> Optional[int]:
+        """ID del socio seleccionado, o None."""
+        item = self.lst_results.currentItem()
+        return item.data(Qt.UserRole) if item else None
+    
+    @Slot()
+    def _search(self):
+        """Muestra las primeras coincidencias del texto ingresado."""
+        self.lst_results.clear()
+        
+        if not self.index.is_ready:
+            self.lbl_hint.setText("Cargando índice de socios...")
+            return
+        
+        text = self.txt_search.text()
+        if not text.strip():
+            self.lbl_hint.setText("Escriba para buscar.")
+            return
+        
+        # Una fila de más indica que hay otras coincidencias sin mostrar
+        rows = self.index.search(text, QUICK_SEARCH_MAX_RESULTS + 1)
+        for row in rows[:QUICK_SEARCH_MAX_RESULTS]:
+            item = QListWidgetItem(self._format_row(row))
+            item.setData(Qt.UserRole, row.id)
+            self.lst_results.addItem(item)
+        if rows:
+            self.lst_results.setCurrentRow(0)
+        
+        if not rows:
+            self.lbl_hint.setText("Sin coincidencias.")
+        elif len(rows) > QUICK_SEARCH_MAX_RESULTS:
+            self.lbl_hint.setText(
+                f"Se muestran las primeras {QUICK_SEARCH_MAX_RESULTS} coincidencias; "
+                "siga escribiendo para acotar."
+            )
+        else:
+            self.lbl_hint.setText("")
+    
+    @staticmethod
+    def _format_row(row: QuickSearchRow) -> str:
+        """Texto de un resultado: nombre y, si hay, email, celular y UID."""
+        details = " · ".join(value for value in (row.email, row.celular, row.rfid_uid) if value)
+        text = f"{row.apellido}, {row.nombre}"
+        if details:
+            text += f"  —  {details}"
+        if not row.activo:
+            text += "  (inactivo)"
+        return text
+    
+    def done(self, result: int):
+        """Deja de escuchar al índice al cerrarse."""
+        self.index.ready.disconnect(self._search)
+        super().done(result)
+    
+    def eventFilter(self, obj, event):
+        """
+        Teclado de la búsqueda: las flechas mueven la selección de la lista
+        y Enter abre el socio seleccionado.
+        """
+        if obj is self.txt_search and event.type() == QEvent.KeyPress:
+            if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+                if self.selected_user_id is not None:
+                    self.accept()
+                return True
+            if event.key() in (Qt.Key_Down, Qt.Key_Up):
+                step = 1 if event.key() == Qt.Key_Down else -1
+                row = self.lst_results.currentRow() + step
+                if 0 <= row < self.lst_results.count():
+                    self.lst_results.setCurrentRow(row)
+                return True
+        return super().eventFilter(obj, event)
@@ -0,0 +1,122 @@
+"""
+Diálogo para renovar el plan de varios usuarios a la vez.
+"""
+from datetime import date
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QComboBox, QDateEdit,
+    QRadioButton, QPushButton, QLabel, QGroupBox
+)
+from PySide6.QtCore import QDate
+from PySide6.QtGui import QFont
+
+from src.services.plan_calculator import PlanCalculator
+from src.utils.enums import PlanType
+from src.utils.dates import formato_fecha
+
+
+class RenewDialog(QDialog):
+    """
+    Elige el plan y el inicio de una renovación masiva.
+    
+    Solo recoge los datos: la renovación la aplica quien lo abre, con
+    UserRepository.renew_plans.
+    """
+    
+    def __init__(self, count: int, parent=None):
+        super().__init__(parent)
+        
+        self.count = count
+        
+        self.setWindowTitle("Renovar Planes")
+        self.setMinimumWidth(420)
+        self.setModal(True)
+        
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        """Configura la interfaz del diálogo."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+        
+        # Título
+        title = QLabel(f"Renovar {self.count} Usuario(s)")
+        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setStyleSheet("color: #f0c020;")
+        layout.addWidget(title)
+        
+        plan_group = QGroupBox("Membresía")
+        plan_layout = QFormLayout(plan_group)
+        
+        self.cmb_plan = QComboBox()
+        for plan in PlanType:
+            self.cmb_plan.addItem(plan.display_name, plan)
+        self.cmb_plan.currentIndexChanged.connect(self._update_fecha_fin)
+        plan_layout.addRow("Plan:", self.cmb_plan)
+        
+        self.rb_fecha = QRadioButton("Desde la fecha:")
+        self.rb_fecha.setChecked(True)
+        self.rb_fecha.toggled.connect(self._on_mode_changed)
+        
+        self.date_inicio = QDateEdit()
+        self.date_inicio.setCalendarPopup(True)
+        self.date_inicio.setDate(QDate.currentDate())
+        self.date_inicio.setDisplayFormat("yyyy-MM-dd")
+        self.date_inicio.dateChanged.connect(self._update_fecha_fin)
+        plan_layout.addRow(self.rb_fecha, self.date_inicio)
+        
+        self.rb_extender = QRadioButton("Extender desde el vencimiento actual de cada usuario (hoy si ya venció)")
+        plan_layout.addRow(self.rb_extender)
+        
+        self.lbl_fecha_fin = QLabel("")
+        plan_layout.addRow("Fecha Fin:", self.lbl_fecha_fin)
+        
+        layout.addWidget(plan_group)
+        
+        lbl_note = QLabel("Los usuarios renovados con el plan vigente quedan activos.")
+        lbl_note.setStyleSheet("color: #888888;")
+        layout.addWidget(lbl_note)
+        
+        # Botones de acción
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        
+        self.btn_cancel = QPushButton("Cancelar")
+        self.btn_cancel.setObjectName("secondaryButton")
+        self.btn_cancel.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.btn_cancel)
+        
+        self.btn_renew = QPushButton("Renovar")
+        self.btn_renew.clicked.connect(self.accept)
+        buttons_layout.addWidget(self.btn_renew)
+        
+        layout.addLayout(buttons_layout)
+        
+        self._update_fecha_fin()
+    
+    @property
+    def plan(self) -> PlanType:
+        """Plan elegido."""
+        return self.cmb_plan.currentData()
+    
+    @property
+    def fecha_inicio(self) -> Optional[date]:
+        """Fecha de inicio común, o None para extender desde el vencimiento actual."""
+        if self.rb_extender.isChecked():
+            return None
+        return self.date_inicio.date().toPython()
+    
+    def _on_mode_changed(self, checked: bool):
+        """Habilita la fecha de inicio solo si se renueva desde una fecha."""
+        self.date_inicio.setEnabled(checked)
+        self._update_fecha_fin()
+    
+    def _update_fecha_fin(self):
+        """Muestra la fecha de fin que resulta de los datos elegidos."""
+        fecha_inicio = self.fecha_inicio
+        if fecha_inicio is None:
+            self.lbl_fecha_fin.setText(f"Vencimiento actual (u hoy) + {self.plan.months} mes(es)")
+        else:
+            fecha_fin = PlanCalculator.calculate_end_date(fecha_inicio, self.plan)
+            self.lbl_fecha_fin.setText(formato_fecha(fecha_fin))
@@ -18,6 +18,7 @@ from src.db.models import User
 from src.utils.enums import PlanType, PaymentMethod
 from src.services.plan_calculator import PlanCalculator
 from src.utils.rfid import normalize_rfid_uid
+from src.ui.widgets.access_history_panel import AccessHistoryPanel
 
 
 class UserDialog(QDialog):
@@ -36,6 +37,7 @@ class UserDialog(QDialog):
         self.is_editing = user is not None
         self.view_only = view_only
         self.scanned_rfid = None
+        self.history_panel: Optional[AccessHistoryPanel] = None
         
         if view_only:
             self.setWindowTitle("Ver Usuario")
@@ -147,6 +149,12 @@ class UserDialog(QDialog):
         
         layout.addWidget(rfid_group)
         
+        # Historial de accesos (solo para usuarios existentes)
+        if self.is_editing:
+            self.history_panel = AccessHistoryPanel(self.user.id)
+            layout.addWidget(self.history_panel)
+            self.setMinimumWidth(640)
+        
         # Botones de acción
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
@@ -165,6 +173,12 @@ class UserDialog(QDialog):
         # Calcular fecha fin inicial
         self._update_fecha_fin()
     
+    def done(self, result: int):
+        """Cierra el diálogo descartando la carga del historial en curso."""
+        if self.history_panel is not None:
+            self.history_panel.cancel()
+        super().done(result)
+    
     def _load_user_data(self):
         """Carga los datos del usuario en el formulario."""
         if not self.user:
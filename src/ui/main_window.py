@@ -1,29 +1,44 @@
 """
 Ventana principal de la aplicación BloomFitness.
 """
+from collections import deque
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QStackedWidget,
     QMessageBox, QApplication
 )
-from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QCloseEvent
+from PySide6.QtCore import Qt, Slot, QTimer, QThreadPool
+from PySide6.QtGui import QCloseEvent, QShowEvent, QKeySequence, QShortcut
 
 from src.config import APP_NAME, APP_VERSION, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
 
 VIEW_USUARIOS = 0
 VIEW_TARJETAS = 1
 VIEW_ACCESOS = 2
+VIEW_PANEL = 3
+VIEW_ANALITICA = 4
+
+# Lecturas RFID que se guardan para mostrarlas cuando se cree la vista de tarjetas
+PENDING_READS_MAX = 50
 from src.db.database import init_db, get_db, close_db
 from src.db.repository import UserRepository
 from src.ui.widgets.sidebar import Sidebar
 from src.ui.views.users_view import UsersView
 from src.ui.views.rfid_view import RFIDView
 from src.ui.views.access_log_view import AccessLogView
+from src.ui.views.dashboard_view import DashboardView
+from src.ui.views.analytics_view import AnalyticsView
+from src.ui.dialogs.quick_search_dialog import QuickSearchDialog
 from src.services.rfid_listener import RFIDListener
 from src.services.access_control import AccessControlService
 from src.services.backup_service import create_daily_backup
+from src.services.reporting_service import ReportingSnapshotPublisher
+from src.services.async_loader import wait_for_loaders
+from src.services.maintenance_service import DatabaseMaintenance
+from src.services.member_index import MemberIndex
+from src.services.dashboard_stats import DashboardStats
 
 
 class MainWindow(QMainWindow):
@@ -32,11 +47,15 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Inicializar base de datos
+        # Inicializar base de datos (rápido si el esquema ya está al día)
         init_db()
         
-        # Verificar y desactivar planes vencidos al iniciar
-        self._check_expired_plans()
+        # Tareas diferidas hasta después del primer pintado
+        self._startup_done = False
+        
+        # Vistas: se construyen recién la primera vez que se navega a ellas
+        self._views = {}
+        self._pending_reads = deque(maxlen=PENDING_READS_MAX)
         
         # Configurar ventana
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
@@ -48,6 +67,10 @@ class MainWindow(QMainWindow):
         # Servicios
         self.rfid_listener = RFIDListener()
         self.access_control = AccessControlService()
+        self.reporting_publisher = ReportingSnapshotPublisher(parent=self)
+        self.db_maintenance = DatabaseMaintenance(parent=self)
+        self.member_index = MemberIndex(parent=self)
+        self.dashboard_stats = DashboardStats(parent=self)
         
         # Conectar señales de RFID
         self.rfid_listener.uid_received.connect(self._on_rfid_received)
@@ -55,17 +78,53 @@ class MainWindow(QMainWindow):
         # Configurar UI
         self._setup_ui()
         
+        # Búsqueda rápida de socios
+        self.quick_search_shortcut = QShortcut(QKeySequence("Ctrl+K"), self)
+        self.quick_search_shortcut.activated.connect(self._on_quick_search)
+    
+    def showEvent(self, event: QShowEvent):
+        """Programa las tareas de arranque diferidas al mostrarse por primera vez."""
+        super().showEvent(event)
+        if not self._startup_done:
+            self._startup_done = True
+            QTimer.singleShot(0, self._on_first_show)
+    
+    @Slot()
+    def _on_first_show(self):
+        """Tareas de arranque que no son necesarias para el primer pintado."""
+        # Verificar y desactivar planes vencidos (las vistas se enteran por el bus)
+        self._check_expired_plans()
+        
         # Iniciar listener RFID
         self.rfid_listener.start()
+        
+        # Publicación periódica del snapshot de reportes
+        self.reporting_publisher.start()
+        
+        # Mantenimiento de la base en horarios sin actividad
+        self.db_maintenance.start()
+        
+        # Índice de la búsqueda rápida (Ctrl+K), en segundo plano
+        self.member_index.load()
+        
+        # Indicadores del panel de recepción: se consultan una vez y después
+        # se mantienen en memoria con el bus de cambios
+        self.dashboard_stats.load()
     
-    def _check_expired_plans(self):
-        """Verifica y desactiva usuarios con planes vencidos."""
+    def _check_expired_plans(self) -> int:
+        """
+        Verifica y desactiva usuarios con planes vencidos.
+        
+        Returns:
+            Cantidad de usuarios desactivados
+        """
         db = get_db()
         try:
             repo = UserRepository(db)
             count = repo.deactivate_expired_plans()
             if count > 0:
                 print(f"Se desactivaron {count} usuario(s) con plan vencido.")
+            return count
         finally:
             db.close()
     
@@ -104,45 +163,86 @@ class MainWindow(QMainWindow):
         
         # Sidebar
         self.sidebar = Sidebar()
+        self.sidebar.panel_clicked.connect(lambda: self.show_view(VIEW_PANEL))
         self.sidebar.usuarios_clicked.connect(lambda: self.show_view(VIEW_USUARIOS))
         self.sidebar.tarjetas_clicked.connect(lambda: self.show_view(VIEW_TARJETAS))
         self.sidebar.accesos_clicked.connect(lambda: self.show_view(VIEW_ACCESOS))
+        self.sidebar.analitica_clicked.connect(lambda: self.show_view(VIEW_ANALITICA))
         self.sidebar.backup_clicked.connect(self._on_backup_clicked)
         self.sidebar.salir_clicked.connect(self.close)
         main_layout.addWidget(self.sidebar)
         
-        # Stack de vistas
+        # Stack de vistas (se agregan a medida que se crean)
         self.view_stack = QStackedWidget()
-        
-        # Crear vistas
-        self.users_view = UsersView()
-        self.rfid_view = RFIDView(self.rfid_listener)
-        self.access_log_view = AccessLogView()
-        
-        # Agregar vistas al stack
-        self.view_stack.addWidget(self.users_view)
-        self.view_stack.addWidget(self.rfid_view)
-        self.view_stack.addWidget(self.access_log_view)
-        
         main_layout.addWidget(self.view_stack)
         
         # Mostrar vista inicial
         self.show_view(VIEW_USUARIOS)
     
+    @property
+    def users_view(self) -> Optional[UsersView]:
+        """Vista de usuarios (None si todavía no se abrió)."""
+        return self._views.get(VIEW_USUARIOS)
+    
+    @property
+    def rfid_view(self) -> Optional[RFIDView]:
+        """Vista de tarjetas RFID (None si todavía no se abrió)."""
+        return self._views.get(VIEW_TARJETAS)
+    
+    @property
+    def access_log_view(self) -> Optional[AccessLogView]:
+        """Vista de registro de accesos (None si todavía no se abrió)."""
+        return self._views.get(VIEW_ACCESOS)
+    
+    def _get_view(self, index: int) -> QWidget:
+        """
+        Obtiene una vista, creándola la primera vez que se necesita.
+        
+        Args:
+            index: Índice de la vista (VIEW_USUARIOS, VIEW_TARJETAS, VIEW_ACCESOS, VIEW_PANEL, VIEW_ANALITICA)
+        """
+        view = self._views.get(index)
+        if view is not None:
+            return view
+        
+        if index == VIEW_USUARIOS:
+            view = UsersView()
+        elif index == VIEW_TARJETAS:
+            view = RFIDView(self.rfid_listener)
+            # Mostrar las lecturas recibidas antes de abrir la vista
+            while self._pending_reads:
+                view.on_uid_received(*self._pending_reads.popleft())
+        elif index == VIEW_ACCESOS:
+            view = AccessLogView()
+        elif index == VIEW_PANEL:
+            view = DashboardView(self.dashboard_stats)
+        elif index == VIEW_ANALITICA:
+            view = AnalyticsView()
+        else:
+            raise ValueError(f"Vista desconocida: {index}")
+        
+        self._views[index] = view
+        self.view_stack.addWidget(view)
+        return view
+    
     @Slot(int)
     def show_view(self, index: int):
         """
         Muestra una vista específica.
-
+        
+        La vista se crea la primera vez. Si declara que necesita datos al
+        mostrarse (LOAD_ON_SHOW), se recarga solo si cambiaron desde la
+        última carga.
+        
         Args:
-            index: Índice de la vista (VIEW_USUARIOS, VIEW_TARJETAS, VIEW_ACCESOS)
+            index: Índice de la vista (VIEW_USUARIOS, VIEW_TARJETAS, VIEW_ACCESOS, VIEW_PANEL, VIEW_ANALITICA)
         """
-        self.view_stack.setCurrentIndex(index)
+        view = self._get_view(index)
+        self.view_stack.setCurrentWidget(view)
         self.sidebar.set_active_view(index)
-
-        current_widget = self.view_stack.currentWidget()
-        if hasattr(current_widget, 'refresh'):
-            current_widget.refresh()
+        
+        if getattr(view, "LOAD_ON_SHOW", False):
+            view.refresh_if_stale()
     
     @Slot(str)
     def _on_rfid_received(self, uid: str):
@@ -152,15 +252,27 @@ class MainWindow(QMainWindow):
         Args:
             uid: UID de la tarjeta RFID
         """
-        # Procesar acceso
-        result = self.access_control.process_access(uid)
+        # Ceder la base al control de acceso si hay mantenimiento en curso
+        self.db_maintenance.notify_activity()
         
-        # Actualizar vista de accesos si está visible
-        if self.view_stack.currentIndex() == VIEW_ACCESOS:
-            self.access_log_view.refresh()
+        # Procesar acceso (las vistas reciben el registro por el bus de cambios)
+        result = self.access_control.process_access(uid)
         
         # Actualizar vista RFID
-        self.rfid_view.on_uid_received(uid, result)
+        if self.rfid_view is not None:
+            self.rfid_view.on_uid_received(uid, result)
+        else:
+            self._pending_reads.append((uid, result))
+    
+    @Slot()
+    def _on_quick_search(self):
+        """Abre la búsqueda rápida y, al elegir un socio, lo abre en la vista de usuarios."""
+        dialog = QuickSearchDialog(self.member_index, parent=self)
+        if dialog.exec() != QuickSearchDialog.Accepted or dialog.selected_user_id is None:
+            return
+        
+        self.show_view(VIEW_USUARIOS)
+        self.users_view.open_member(dialog.selected_user_id)
     
     @Slot()
     def _on_backup_clicked(self):
@@ -170,7 +282,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Backup Exitoso", result.message, QMessageBox.Ok)
         else:
             QMessageBox.critical(self, "Error de Backup", result.message, QMessageBox.Ok)
-
+    
     def closeEvent(self, event: QCloseEvent):
         """Maneja el evento de cierre de la ventana."""
         reply = QMessageBox.question(
@@ -186,6 +298,14 @@ class MainWindow(QMainWindow):
             self.rfid_listener.stop()
             self.rfid_listener.wait()
             
+            # Cancelar mantenimiento y esperar una publicación de snapshot en curso
+            self.db_maintenance.stop()
+            self.reporting_publisher.stop()
+            QThreadPool.globalInstance().waitForDone()
+            if self.access_log_view is not None:
+                self.access_log_view.cancel_export()
+            wait_for_loaders()
+            
             # Cerrar conexión a base de datos
             close_db()
             
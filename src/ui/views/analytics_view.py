@@ -0,0 +1,182 @@
+"""
+Vista de analítica: gráficos de accesos y socios.
+"""
+from datetime import datetime
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QGroupBox,
+    QPushButton, QDateEdit, QScrollArea
+)
+from PySide6.QtCore import QDate, Slot
+from PySide6.QtGui import QFont
+
+from src.services.analytics_service import AnalyticsCache, AnalyticsReport
+from src.services.async_loader import AsyncLoader
+from src.ui.widgets.bar_chart import BarChart, CHART_COLOR_ACCENT, CHART_COLOR_OK, CHART_COLOR_DANGER
+
+
+# Días de la semana (date.weekday(): 0 = lunes)
+WEEKDAYS = ("Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom")
+
+# Período inicial: últimos 90 días
+DEFAULT_PERIOD_DAYS = 90
+
+
+class AnalyticsView(QWidget):
+    """
+    Gráficos de las consultas de docs/ANALITICA_DATOS.md dentro de la app.
+    
+    Todo se consulta en un hilo de carga sobre el snapshot de reportes (no
+    sobre la base que usa la puerta) y se guarda en una caché por período
+    y versión del snapshot: volver a un período ya visto, o a la vista,
+    no consulta la base mientras no se publique un snapshot nuevo.
+    """
+    
+    # Los datos se cargan al mostrarse (ver MainWindow.show_view)
+    LOAD_ON_SHOW = True
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cache = AnalyticsCache()
+        self._report: Optional[AnalyticsReport] = None
+        self.loader = AsyncLoader(self)
+        self.loader.loading_changed.connect(self._on_loading_changed)
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        """Configura la interfaz de usuario."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+        
+        # Título
+        title = QLabel("Analítica")
+        title.setObjectName("titleLabel")
+        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        layout.addWidget(title)
+        
+        # Período
+        period_group = QGroupBox("Período")
+        period_layout = QHBoxLayout(period_group)
+        
+        period_layout.addWidget(QLabel("Desde:"))
+        self.date_desde = QDateEdit()
+        self.date_desde.setCalendarPopup(True)
+        self.date_desde.setDate(QDate.currentDate().addDays(-(DEFAULT_PERIOD_DAYS - 1)))
+        self.date_desde.setDisplayFormat("yyyy-MM-dd")
+        period_layout.addWidget(self.date_desde)
+        
+        period_layout.addWidget(QLabel("Hasta:"))
+        self.date_hasta = QDateEdit()
+        self.date_hasta.setCalendarPopup(True)
+        self.date_hasta.setDate(QDate.currentDate())
+        self.date_hasta.setDisplayFormat("yyyy-MM-dd")
+        period_layout.addWidget(self.date_hasta)
+        
+        self.btn_apply = QPushButton("Aplicar")
+        self.btn_apply.clicked.connect(self.refresh)
+        period_layout.addWidget(self.btn_apply)
+        
+        period_layout.addStretch()
+        
+        self.lbl_snapshot = QLabel("")
+        self.lbl_snapshot.setObjectName("subtitleLabel")
+        period_layout.addWidget(self.lbl_snapshot)
+        
+        layout.addWidget(period_group)
+        
+        # Gráficos
+        self.chart_per_day = BarChart("Accesos por día")
+        self.chart_per_hour = BarChart("Ingresos por hora del día")
+        self.chart_per_weekday = BarChart("Ingresos por día de la semana")
+        self.chart_new_members = BarChart("Nuevos socios por mes")
+        self.chart_plan_mix = BarChart("Socios activos por plan")
+        self.chart_payment_mix = BarChart("Socios activos por método de pago")
+        
+        charts = QWidget()
+        grid = QGridLayout(charts)
+        grid.setSpacing(15)
+        grid.addWidget(self.chart_per_day, 0, 0, 1, 2)
+        grid.addWidget(self.chart_per_hour, 1, 0)
+        grid.addWidget(self.chart_per_weekday, 1, 1)
+        grid.addWidget(self.chart_new_members, 2, 0)
+        grid.addWidget(self.chart_plan_mix, 2, 1)
+        grid.addWidget(self.chart_payment_mix, 3, 0)
+        
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QScrollArea.NoFrame)
+        scroll.setWidget(charts)
+        layout.addWidget(scroll, 1)
+    
+    @property
+    def _charts(self) -> tuple:
+        return (
+            self.chart_per_day, self.chart_per_hour, self.chart_per_weekday,
+            self.chart_new_members, self.chart_plan_mix, self.chart_payment_mix
+        )
+    
+    def refresh(self):
+        """Muestra el período elegido: desde la caché o consultándolo en segundo plano."""
+        desde = self.date_desde.date().toPython()
+        hasta = self.date_hasta.date().toPython()
+        if desde > hasta:
+            desde, hasta = hasta, desde
+        
+        report = self.cache.peek(desde, hasta)
+        if report is not None:
+            self.loader.cancel()
+            self._apply_report(report)
+            return
+        
+        cache = self.cache
+        self.loader.load(lambda: cache.get(desde, hasta), self._apply_report)
+    
+    def refresh_if_stale(self):
+        """Vuelve a mostrar el período si se publicó otro snapshot (sin consultar si no)."""
+        self.refresh()
+    
+    @Slot(bool)
+    def _on_loading_changed(self, loading: bool):
+        """Indica la carga en los gráficos que todavía no tienen datos."""
+        self.btn_apply.setEnabled(not loading)
+        if loading and self._report is None:
+            for chart in self._charts:
+                chart.set_message("Cargando...")
+    
+    def _apply_report(self, report: AnalyticsReport):
+        """Dibuja los gráficos de un informe."""
+        if report is self._report:
+            return
+        self._report = report
+        
+        published = datetime.fromtimestamp(report.snapshot_time)
+        self.lbl_snapshot.setText(f"Datos al {published:%d/%m/%Y %H:%M}")
+        
+        self.chart_per_day.set_data(
+            [f"{day:%d/%m}" for day, _, _ in report.per_day],
+            [
+                ("Permitidos", CHART_COLOR_OK, [permitidos for _, permitidos, _ in report.per_day]),
+                ("Denegados", CHART_COLOR_DANGER, [denegados for _, _, denegados in report.per_day]),
+            ]
+        )
+        self.chart_per_hour.set_data(
+            [f"{hour:02d}" for hour in range(24)],
+            [("Ingresos", CHART_COLOR_ACCENT, report.per_hour)]
+        )
+        self.chart_per_weekday.set_data(
+            WEEKDAYS, [("Ingresos", CHART_COLOR_ACCENT, report.per_weekday)]
+        )
+        self.chart_new_members.set_data(
+            [mes for mes, _ in report.new_members],
+            [("Altas", CHART_COLOR_ACCENT, [cantidad for _, cantidad in report.new_members])]
+        )
+        self.chart_plan_mix.set_data(
+            [plan.display_name for plan, _ in report.plan_mix],
+            [("Socios", CHART_COLOR_ACCENT, [cantidad for _, cantidad in report.plan_mix])]
+        )
+        self.chart_payment_mix.set_data(
+            [metodo.display_name if metodo else "Sin dato" for metodo, _ in report.payment_mix],
+            [("Socios", CHART_COLOR_ACCENT, [cantidad for _, cantidad in report.payment_mix])]
+        )
@@ -0,0 +1,161 @@
+"""
+Vista del panel de recepción.
+"""
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QFont
+
+from src.config import DASHBOARD_STAY_MINUTES, DASHBOARD_EXPIRING_DAYS
+from src.services.dashboard_stats import DashboardStats
+from src.ui.models.access_log_table_model import AccessLogTableModel
+from src.ui.models.roles import STATUS_ROLE, STATUS_OK, STATUS_DANGER
+from src.ui.widgets.status_delegate import StatusDelegate
+from src.utils.enums import AccessResult, AccessReason
+
+
+# Motivos de denegación que se desglosan, con su texto
+DENIAL_REASONS = (
+    (AccessReason.NO_EXISTE, "Tarjeta no registrada"),
+    (AccessReason.VENCIDO, "Plan vencido"),
+    (AccessReason.INACTIVO, "Usuario inactivo"),
+)
+
+
+class DashboardView(QWidget):
+    """
+    Panel de recepción con los indicadores del día.
+    
+    Muestra lo que mantiene DashboardStats en memoria y se actualiza con
+    su señal changed: tenerlo abierto no agrega consultas a la base.
+    """
+    
+    def __init__(self, stats: DashboardStats, parent=None):
+        super().__init__(parent)
+        self.stats = stats
+        
+        self._setup_ui()
+        self.stats.changed.connect(self._update)
+        self._update()
+    
+    def _setup_ui(self):
+        """Configura la interfaz de usuario."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+        
+        # Título
+        title = QLabel("Panel de Recepción")
+        title.setObjectName("titleLabel")
+        title.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        layout.addWidget(title)
+        
+        # Indicadores
+        kpi_layout = QHBoxLayout()
+        kpi_layout.setSpacing(15)
+        
+        group, self.lbl_entries, _ = self._create_kpi("Ingresos Hoy", "Accesos permitidos")
+        self.lbl_entries.setStyleSheet("color: #00cc00;")
+        kpi_layout.addWidget(group)
+        
+        group, self.lbl_denials, details = self._create_kpi("Denegados Hoy")
+        self.lbl_denials.setStyleSheet("color: #ff4444;")
+        self.lbl_denial_reasons = {}
+        for reason, text in DENIAL_REASONS:
+            label = QLabel()
+            details.addWidget(label)
+            self.lbl_denial_reasons[reason] = (label, text)
+        kpi_layout.addWidget(group)
+        
+        group, self.lbl_occupancy, _ = self._create_kpi(
+            "Ocupación Estimada", f"Ingresos de los últimos {DASHBOARD_STAY_MINUTES} min"
+        )
+        kpi_layout.addWidget(group)
+        
+        group, self.lbl_expiring, _ = self._create_kpi(
+            "Vencen esta Semana", f"Socios activos, próximos {DASHBOARD_EXPIRING_DAYS} días"
+        )
+        self.lbl_expiring.setStyleSheet("color: #ffaa00;")
+        kpi_layout.addWidget(group)
+        
+        layout.addLayout(kpi_layout)
+        
+        # Últimos accesos
+        recent_group = QGroupBox("Últimos Accesos")
+        recent_layout = QVBoxLayout(recent_group)
+        
+        self.tbl_recent = QTableWidget(0, len(AccessLogTableModel.HEADERS))
+        self.tbl_recent.setHorizontalHeaderLabels(AccessLogTableModel.HEADERS)
+        self.tbl_recent.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tbl_recent.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tbl_recent.setAlternatingRowColors(True)
+        self.tbl_recent.verticalHeader().setVisible(False)
+        self.tbl_recent.setItemDelegateForColumn(3, StatusDelegate(bold=True, parent=self.tbl_recent))
+        header = self.tbl_recent.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.resizeSection(0, 150)
+        recent_layout.addWidget(self.tbl_recent)
+        
+        self.lbl_status = QLabel("Cargando indicadores...")
+        self.lbl_status.setObjectName("emptyStateLabel")
+        self.lbl_status.setAlignment(Qt.AlignCenter)
+        recent_layout.addWidget(self.lbl_status)
+        
+        layout.addWidget(recent_group, 1)
+    
+    @staticmethod
+    def _create_kpi(title: str, caption: str = "") -> tuple:
+        """
+        Crea el recuadro de un indicador.
+        
+        Returns:
+            (recuadro, etiqueta del valor, layout para detalles)
+        """
+        group = QGroupBox(title)
+        group_layout = QVBoxLayout(group)
+        
+        value = QLabel("-")
+        value.setFont(QFont("Segoe UI", 28, QFont.Bold))
+        group_layout.addWidget(value)
+        
+        details = QVBoxLayout()
+        group_layout.addLayout(details)
+        if caption:
+            lbl_caption = QLabel(caption)
+            lbl_caption.setObjectName("subtitleLabel")
+            details.addWidget(lbl_caption)
+        group_layout.addStretch()
+        return group, value, details
+    
+    @Slot()
+    def _update(self):
+        """Muestra los indicadores actuales (desde memoria)."""
+        stats = self.stats
+        if not stats.is_ready:
+            return
+        
+        denials = stats.denials_today
+        self.lbl_entries.setText(str(stats.entries_today))
+        self.lbl_denials.setText(str(sum(denials.values())))
+        for reason, (label, text) in self.lbl_denial_reasons.items():
+            label.setText(f"{text}: {denials.get(reason, 0)}")
+        self.lbl_occupancy.setText(str(stats.occupancy))
+        self.lbl_expiring.setText(str(stats.expiring_this_week))
+        
+        rows = stats.recent_accesses
+        self.tbl_recent.setRowCount(len(rows))
+        for position, row in enumerate(rows):
+            for column, text in enumerate(AccessLogTableModel.display_values(row)):
+                item = QTableWidgetItem(text)
+                if column == 3:
+                    item.setData(
+                        STATUS_ROLE,
+                        STATUS_OK if row.resultado == AccessResult.PERMITIDO else STATUS_DANGER
+                    )
+                self.tbl_recent.setItem(position, column, item)
+        
+        self.lbl_status.setText("" if rows else "Sin accesos registrados.")
+        self.lbl_status.setVisible(not rows)
@@ -1,38 +1,66 @@
 """
 Vista de gestión de tarjetas RFID.
 """
-from typing import Optional
-from datetime import datetime
+from typing import Dict, Optional
+from datetime import date, datetime
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
-    QGroupBox, QComboBox, QTextEdit, QMessageBox, QDialog, QDialogButtonBox,
+    QTableView, QListView, QHeaderView, QAbstractItemView,
+    QGroupBox, QComboBox, QMessageBox, QDialog,
     QStackedWidget
 )
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont
 
-from src.db.database import get_db
+from src.config import (
+    RFID_EVENT_LOG_CAPACITY, RFID_EVENT_LOG_PATH,
+    RFID_EVENT_LOG_MAX_BYTES, RFID_EVENT_LOG_BACKUPS
+)
+from src.db.database import get_db, get_data_version
 from src.db.repository import UserRepository
 from src.db.models import User
+from src.db.rows import MemberChange
 from src.services.rfid_listener import RFIDListener
 from src.services.access_control import AccessControlService, AccessCheckResult
+from src.services.async_loader import AsyncLoader
+from src.services.change_notifier import get_change_notifier
 from src.utils.enums import AccessResult
+from src.ui.dialogs.member_picker_dialog import MemberPickerDialog
 from src.ui.dialogs.rfid_assign_dialog import RFIDAssignDialog
+from src.ui.models.cards_table_model import CardsTableModel
+from src.ui.models.event_log_model import EventLogModel
+from src.ui.widgets.status_delegate import StatusDelegate
 
 
 class RFIDView(QWidget):
     """Vista para gestión de tarjetas RFID."""
     
+    # Los datos se cargan al mostrarse (ver MainWindow.show_view)
+    LOAD_ON_SHOW = True
+    
+    # Tablas de las que depende la lista de tarjetas
+    DATA_TABLES = (User.__tablename__,)
+    
     def __init__(self, rfid_listener: RFIDListener, parent=None):
         super().__init__(parent)
         self.rfid_listener = rfid_listener
         self.last_result: Optional[AccessCheckResult] = None
+        # Socios modificados por actualizar en la tabla
+        self._pending_members: Dict[int, Optional[MemberChange]] = {}
+        # Versión de los datos mostrados y de la carga en curso
+        self._rendered_version: Optional[tuple] = None
+        self._loading_version: Optional[tuple] = None
+        self.loader = AsyncLoader(self)
+        self.loader.loading_changed.connect(self._on_loading_changed)
         
         self._setup_ui()
         self._connect_signals()
-        self.refresh()
+        
+        notifier = get_change_notifier()
+        notifier.members_changed.connect(self._on_members_changed)
+        notifier.members_bulk_changed.connect(self._on_members_bulk_changed)
+        notifier.flushed.connect(self._on_changes_flushed)
     
     def _setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -123,15 +151,29 @@ class RFIDView(QWidget):
         log_group = QGroupBox("Log de Lecturas (Tiempo Real)")
         log_layout = QVBoxLayout(log_group)
         
-        self.txt_log = QTextEdit()
-        self.txt_log.setReadOnly(True)
-        self.txt_log.setMaximumHeight(150)
-        self.txt_log.setStyleSheet("font-family: 'Consolas', monospace; font-size: 11px;")
-        log_layout.addWidget(self.txt_log)
+        # Buffer circular: conserva solo los últimos RFID_EVENT_LOG_CAPACITY mensajes
+        self.log_model = EventLogModel(
+            RFID_EVENT_LOG_CAPACITY,
+            spill_path=RFID_EVENT_LOG_PATH,
+            spill_max_bytes=RFID_EVENT_LOG_MAX_BYTES,
+            spill_backups=RFID_EVENT_LOG_BACKUPS,
+            parent=self
+        )
+        self.lst_log = QListView()
+        self.lst_log.setModel(self.log_model)
+        self.lst_log.setUniformItemSizes(True)
+        self.lst_log.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.lst_log.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.lst_log.setMaximumHeight(150)
+        self.lst_log.setStyleSheet("font-family: 'Consolas', monospace; font-size: 11px;")
+        self.log_model.rowsAboutToBeInserted.connect(self._on_log_rows_about_to_be_inserted)
+        self.log_model.rowsInserted.connect(self._on_log_rows_inserted)
+        self._log_follow = True
+        log_layout.addWidget(self.lst_log)
         
         btn_clear_log = QPushButton("Limpiar Log")
         btn_clear_log.setObjectName("secondaryButton")
-        btn_clear_log.clicked.connect(self.txt_log.clear)
+        btn_clear_log.clicked.connect(self.log_model.clear)
         log_layout.addWidget(btn_clear_log, alignment=Qt.AlignRight)
         
         layout.addWidget(log_group)
@@ -140,29 +182,38 @@ class RFIDView(QWidget):
         cards_group = QGroupBox("Tarjetas Asignadas")
         cards_layout = QVBoxLayout(cards_group)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Usuario", "RFID UID", "Plan", "Estado"])
+        self.model = CardsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setItemDelegateForColumn(3, StatusDelegate(parent=self.table))
         
+        # Columnas de ancho fijo: ResizeToContents mediría todas las filas
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        for column, width in ((1, 140), (2, 120), (3, 90)):
+            header.setSectionResizeMode(column, QHeaderView.Interactive)
+            header.resizeSection(column, width)
         
         self.cards_stack = QStackedWidget()
         self.cards_stack.addWidget(self.table)             # índice 0
-
+        
         self.lbl_empty_cards = QLabel("No hay tarjetas RFID asignadas.\nAsigne una tarjeta a un usuario activo.")
         self.lbl_empty_cards.setObjectName("emptyStateLabel")
         self.lbl_empty_cards.setAlignment(Qt.AlignCenter)
         self.cards_stack.addWidget(self.lbl_empty_cards)   # índice 1
-
+        
+        self.lbl_loading_cards = QLabel("Cargando tarjetas...")
+        self.lbl_loading_cards.setObjectName("emptyStateLabel")
+        self.lbl_loading_cards.setAlignment(Qt.AlignCenter)
+        self.cards_stack.addWidget(self.lbl_loading_cards) # índice 2
+        
         cards_layout.addWidget(self.cards_stack)
-
+        
         # Botones de tarjetas
         cards_buttons = QHBoxLayout()
         cards_buttons.addStretch()
@@ -202,7 +253,7 @@ class RFIDView(QWidget):
             index = self.cmb_port.findData(current_port)
             if index >= 0:
                 self.cmb_port.setCurrentIndex(index)
-
+    
     @Slot()
     def _on_refresh_ports(self):
         """Actualiza puertos y fuerza un intento de reconexión."""
@@ -299,51 +350,106 @@ class RFIDView(QWidget):
         self._log(f"[{timestamp}] {uid} - {user_name} - {status}")
     
     def _log(self, message: str):
-        """Agrega un mensaje al log."""
-        self.txt_log.append(message)
+        """Agrega un mensaje al log (se muestra en el próximo lote)."""
+        self.log_model.append(message)
+    
+    @Slot()
+    def _on_log_rows_about_to_be_inserted(self):
+        """Recuerda si el log estaba al final para seguir los mensajes nuevos."""
+        scroll = self.lst_log.verticalScrollBar()
+        self._log_follow = scroll.value() >= scroll.maximum()
+    
+    @Slot()
+    def _on_log_rows_inserted(self):
+        if self._log_follow:
+            self.lst_log.scrollToBottom()
     
     def refresh(self):
-        """Recarga la tabla de tarjetas asignadas."""
-        db = get_db()
-        try:
-            repo = UserRepository(db)
-            users = repo.search(solo_activos=False)
-            users_with_rfid = [u for u in users if u.rfid_uid]
-
-            self.table.setRowCount(0)
-
-            for user in users_with_rfid:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-
-                name_item = QTableWidgetItem(user.nombre_completo)
-                name_item.setData(Qt.UserRole, user.id)
-                self.table.setItem(row, 0, name_item)
-
-                rfid_item = QTableWidgetItem(user.rfid_uid)
-                self.table.setItem(row, 1, rfid_item)
-
-                plan_item = QTableWidgetItem(user.plan.display_name)
-                self.table.setItem(row, 2, plan_item)
-
-                if not user.activo:
-                    estado = "Inactivo"
-                    color = "#ff4444"
-                elif not user.plan_vigente:
-                    estado = "Vencido"
-                    color = "#ffaa00"
-                else:
-                    estado = "Activo"
-                    color = "#00cc00"
-
-                estado_item = QTableWidgetItem(estado)
-                estado_item.setForeground(QColor(color))
-                self.table.setItem(row, 3, estado_item)
-
-            self.cards_stack.setCurrentIndex(0 if self.table.rowCount() > 0 else 1)
-
-        finally:
-            db.close()
+        """Recarga la tabla de tarjetas asignadas (en segundo plano)."""
+        self._loading_version = self._data_version()
+        self._pending_members.clear()
+        
+        def query():
+            db = get_db()
+            try:
+                # Tuplas simples: los objetos ORM no deben cruzar de hilo
+                return UserRepository(db).card_rows()
+            finally:
+                db.close()
+        
+        self.loader.load(query, self._apply_cards)
+    
+    def refresh_if_stale(self):
+        """Recarga solo si los datos cambiaron desde la última carga."""
+        version = self._data_version()
+        if version == self._rendered_version:
+            return
+        if self.loader.is_loading and version == self._loading_version:
+            return
+        self.refresh()
+    
+    def _data_version(self) -> tuple:
+        """Versión de los datos (incluye la fecha: el estado del plan depende del día)."""
+        return (date.today(),) + get_data_version(*self.DATA_TABLES)
+    
+    def _apply_cards(self, cards: list):
+        """Muestra las tarjetas cargadas y las modificadas mientras se consultaba."""
+        self.model.set_rows(cards)
+        self._patch_members()
+        self._update_cards_stack()
+        self._rendered_version = (date.today(),) + get_change_notifier().delivered_version(*self.DATA_TABLES)
+    
+    def _update_cards_stack(self):
+        """Muestra la tabla o el aviso de que no hay tarjetas."""
+        self.cards_stack.setCurrentIndex(0 if self.model.rowCount() > 0 else 1)
+    
+    @Slot(object)
+    def _on_members_changed(self, changes: Dict[int, Optional[MemberChange]]):
+        """Anota los socios modificados; su fila se actualiza al final del lote."""
+        self._pending_members.update(changes)
+    
+    @Slot()
+    def _on_members_bulk_changed(self):
+        """
+        Ante un cambio masivo se recarga: ya mismo si la vista está visible
+        o cargando (la carga en curso puede ser anterior al cambio), si no
+        al mostrarse.
+        """
+        self._pending_members.clear()
+        self._rendered_version = None
+        if self.isVisible() or self.loader.is_loading:
+            self.refresh()
+    
+    @Slot()
+    def _on_changes_flushed(self):
+        """Aplica los cambios del lote y, si estaba al día, da la vista por vigente."""
+        if self.loader.is_loading:
+            return
+        
+        self._patch_members()
+        before, after = get_change_notifier().batch_versions(*self.DATA_TABLES)
+        today = date.today()
+        if self._rendered_version == (today,) + before:
+            self._rendered_version = (today,) + after
+    
+    def _patch_members(self):
+        """Reemplaza, agrega o quita las filas de los socios modificados."""
+        changes, self._pending_members = self._pending_members, {}
+        if not changes:
+            return
+        
+        # Los que ya no tienen tarjeta (o se eliminaron) salen de la tabla
+        cards = [change.card for change in changes.values() if change is not None and change.card is not None]
+        self.model.remove_ids(changes.keys() - {card[0] for card in cards})
+        for card in cards:
+            self.model.upsert_row(card)
+        self._update_cards_stack()
+    
+    @Slot(bool)
+    def _on_loading_changed(self, loading: bool):
+        """Muestra el estado de carga si la tabla está vacía."""
+        if loading and self.model.rowCount() == 0:
+            self.cards_stack.setCurrentIndex(2)
     
     @Slot()
     def _on_assign_card(self):
@@ -351,10 +457,8 @@ class RFIDView(QWidget):
         db = get_db()
         try:
             repo = UserRepository(db)
-            users = repo.get_all()
-            users_without_rfid = [u for u in users if not u.rfid_uid and u.activo]
-
-            if not users_without_rfid:
+            
+            if not repo.without_card_rows(limit=1):
                 QMessageBox.information(
                     self,
                     "Sin Usuarios Disponibles",
@@ -362,52 +466,26 @@ class RFIDView(QWidget):
                     QMessageBox.Ok
                 )
                 return
-
-            user = self._pick_user(users_without_rfid)
-            if user is None:
+            
+            picker = MemberPickerDialog(parent=self)
+            if picker.exec() != QDialog.Accepted:
                 return
-
+            user = repo.get_by_id(picker.selected_user_id)
+            if user is None or user.rfid_uid:
+                return
+            
             dialog = RFIDAssignDialog(user, parent=self)
             self.rfid_listener.uid_received.connect(dialog.on_uid_received)
-            dialog.rfid_assigned.connect(self.refresh)
             dialog.exec()
             self.rfid_listener.uid_received.disconnect(dialog.on_uid_received)
-
+        
         finally:
             db.close()
-
-    def _pick_user(self, users: list) -> "User | None":
-        """Muestra un diálogo para que el operador seleccione el usuario al que asignar la tarjeta."""
-        picker = QDialog(self)
-        picker.setWindowTitle("Seleccionar Usuario")
-        picker.setMinimumWidth(380)
-        picker_layout = QVBoxLayout(picker)
-        picker_layout.setSpacing(15)
-
-        lbl = QLabel("Seleccione el usuario al que desea asignar la tarjeta RFID:")
-        lbl.setWordWrap(True)
-        picker_layout.addWidget(lbl)
-
-        combo = QComboBox()
-        for u in users:
-            combo.addItem(f"{u.apellido}, {u.nombre}", u.id)
-        picker_layout.addWidget(combo)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(picker.accept)
-        buttons.rejected.connect(picker.reject)
-        picker_layout.addWidget(buttons)
-
-        if picker.exec() != QDialog.Accepted:
-            return None
-
-        selected_id = combo.currentData()
-        return next((u for u in users if u.id == selected_id), None)
     
     @Slot()
     def _on_remove_card(self):
         """Quita la tarjeta del usuario seleccionado."""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             QMessageBox.warning(
                 self,
@@ -418,8 +496,8 @@ class RFIDView(QWidget):
             return
         
         row = selected[0].row()
-        user_id = self.table.item(row, 0).data(Qt.UserRole)
-        user_name = self.table.item(row, 0).text()
+        user_id = self.model.user_id_at(row)
+        user_name = self.model.index(row, 0).data()
         
         reply = QMessageBox.question(
             self,
@@ -434,7 +512,6 @@ class RFIDView(QWidget):
             try:
                 repo = UserRepository(db)
                 repo.remove_rfid(user_id)
-                self.refresh()
             finally:
                 db.close()
     
@@ -447,7 +524,7 @@ class RFIDView(QWidget):
         if success:
             # Registrar el acceso manual
             access_service = AccessControlService()
-            result = access_service.register_manual_access("Visitante")
+            access_service.register_manual_access("Visitante")
             
             # Mostrar feedback visual
             timestamp = datetime.now().strftime("%H:%M:%S")
@@ -464,7 +541,7 @@ class RFIDView(QWidget):
             self.btn_open_door.setProperty("doorOpen", True)
             self.btn_open_door.style().unpolish(self.btn_open_door)
             self.btn_open_door.style().polish(self.btn_open_door)
-
+            
             from PySide6.QtCore import QTimer
             QTimer.singleShot(2000, self._reset_open_button)
         else:
@@ -1,38 +1,71 @@
 """
 Vista de gestión de usuarios.
 """
-from typing import List, Optional
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QMessageBox, QHeaderView, QAbstractItemView, QLabel,
     QStackedWidget
 )
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QFont, QColor
 
-from src.db.database import get_db
-from src.db.repository import UserRepository
-from src.db.models import User
+from src.db.database import get_db, get_data_version
+from src.db.repository import UserRepository, user_filters_refine, user_row_filter
+from src.db.models import User, AccessLog
+from src.db.rows import MemberRow, MemberChange
+from src.services.async_loader import AsyncLoader
+from src.services.change_notifier import get_change_notifier
 from src.ui.widgets.search_bar import SearchBar
+from src.ui.widgets.status_delegate import StatusDelegate
 from src.ui.dialogs.user_dialog import UserDialog
+from src.ui.dialogs.renew_dialog import RenewDialog
+from src.ui.models.users_table_model import (
+    UsersTableModel, UsersFilterProxyModel, COL_ID, COL_FECHA_FIN, COL_ESTADO
+)
 from src.utils.dates import formato_fecha
-from src.services.plan_calculator import PlanCalculator
 
 
 class UsersView(QWidget):
     """Vista principal para gestión de usuarios."""
     
     # Columnas de la tabla
-    COLUMNS = ["ID", "Apellido", "Nombre", "Email", "Celular", "Membresía", "Observaciones", "Fecha Fin", "Estado"]
+    COLUMNS = UsersTableModel.HEADERS
+    
+    # Los datos se cargan al mostrarse (ver MainWindow.show_view)
+    LOAD_ON_SHOW = True
+    
+    # Tablas de las que dependen las filas (las visitas salen de los accesos)
+    DATA_TABLES = (User.__tablename__, AccessLog.__tablename__)
+    
+    # Columnas con ancho según contenido: Celular, Membresía, Fecha Fin,
+    # Último Acceso, Visitas y Estado
+    CONTENT_COLUMNS = (4, 5, 7, 8, 9, 10)
+    
+    # Resultados de búsquedas recientes que se reutilizan al refinar
+    SEARCH_CACHE_SIZE = 8
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._users: List[User] = []
+        # Búsquedas recientes: (filtros, filas) de la más nueva a la más vieja
+        self._search_cache: List[Tuple[dict, List[MemberRow]]] = []
+        # Filtros de las filas mostradas y socios modificados por actualizar
+        self._filters: dict = {}
+        self._pending_members: Dict[int, Optional[MemberChange]] = {}
+        # Versión de los datos del modelo y del caché, y de la carga en curso
+        self._rendered_version: Optional[tuple] = None
+        self._loading_version: Optional[tuple] = None
         self._show_inactive = True  # Por defecto mostrar inactivos
         self._show_active = True    # Por defecto mostrar activos
+        self.loader = AsyncLoader(self)
+        self.loader.loading_changed.connect(self._on_loading_changed)
         self._setup_ui()
-        self.refresh()
+        
+        notifier = get_change_notifier()
+        notifier.members_changed.connect(self._on_members_changed)
+        notifier.members_bulk_changed.connect(self._on_members_bulk_changed)
+        notifier.flushed.connect(self._on_changes_flushed)
     
     def _setup_ui(self):
         """Configura la interfaz de usuario."""
@@ -46,14 +79,18 @@ class UsersView(QWidget):
         self.search_bar.clear_triggered.connect(self.refresh)
         layout.addWidget(self.search_bar)
         
-        # Tabla de usuarios
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.COLUMNS))
-        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        # Tabla de usuarios (modelo virtual: solo se formatean las filas visibles)
+        self.model = UsersTableModel(self)
+        self.proxy = UsersFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.doubleClicked.connect(self._on_view_user)
         
@@ -62,32 +99,44 @@ class UsersView(QWidget):
         vertical_header.setDefaultSectionSize(35)  # Altura de filas
         vertical_header.setMinimumWidth(50)  # Ancho mínimo para números de fila
         
-        # Configurar columnas
+        # Configurar columnas. Las de ancho según contenido se ajustan una
+        # vez por carga (_resize_columns) y no en cada cambio de una fila:
+        # con ResizeToContents el encabezado vuelve a medir todas las
+        # columnas ante cada dataChanged.
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # ID
         header.setSectionResizeMode(1, QHeaderView.Stretch)  # Apellido
         header.setSectionResizeMode(2, QHeaderView.Stretch)  # Nombre
         header.setSectionResizeMode(3, QHeaderView.Stretch)  # Email
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Celular
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Membresía
         header.setSectionResizeMode(6, QHeaderView.Stretch)  # Observaciones
-        header.setSectionResizeMode(7, QHeaderView.ResizeToContents)  # Fecha Fin
-        header.setSectionResizeMode(8, QHeaderView.ResizeToContents)  # Estado
+        for column in self.CONTENT_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.Interactive)
+        # Medir solo una muestra de filas al ajustar columnas al contenido
+        header.setResizeContentsPrecision(100)
         
         # Ocultar columna ID
         self.table.setColumnHidden(0, True)
         
+        # Vencimiento y estado: el color lo pone el delegado según el estado de la celda
+        status_delegate = StatusDelegate(parent=self.table)
+        for column in (COL_FECHA_FIN, COL_ESTADO):
+            self.table.setItemDelegateForColumn(column, status_delegate)
+        
         # Stack para alternar entre tabla y estado vacío sin perder espacio
         self.content_stack = QStackedWidget()
         self.content_stack.addWidget(self.table)          # índice 0
-
+        
         self.lbl_empty = QLabel("No hay usuarios para mostrar.\nAgregue un usuario o limpie los filtros.")
         self.lbl_empty.setObjectName("emptyStateLabel")
         self.lbl_empty.setAlignment(Qt.AlignCenter)
         self.content_stack.addWidget(self.lbl_empty)      # índice 1
-
+        
+        self.lbl_loading = QLabel("Cargando usuarios...")
+        self.lbl_loading.setObjectName("emptyStateLabel")
+        self.lbl_loading.setAlignment(Qt.AlignCenter)
+        self.content_stack.addWidget(self.lbl_loading)    # índice 2
+        
         layout.addWidget(self.content_stack)
-
+        
         # Botones de acción
         buttons_layout = QHBoxLayout()
         
@@ -116,56 +165,198 @@ class UsersView(QWidget):
         self.btn_add.setToolTip("Registrar un nuevo socio (Ctrl+N)")
         self.btn_add.clicked.connect(self._on_add_user)
         buttons_layout.addWidget(self.btn_add)
-
+        
         self.btn_edit = QPushButton("Editar Usuario")
         self.btn_edit.setEnabled(False)
         self.btn_edit.setToolTip("Seleccione un usuario para editar")
         self.btn_edit.clicked.connect(self._on_edit_user)
         buttons_layout.addWidget(self.btn_edit)
-
+        
+        self.btn_renew = QPushButton("Renovar")
+        self.btn_renew.setEnabled(False)
+        self.btn_renew.setToolTip("Seleccione los usuarios a renovar")
+        self.btn_renew.clicked.connect(self._on_renew_users)
+        buttons_layout.addWidget(self.btn_renew)
+        
         self.btn_delete = QPushButton("Eliminar Seleccionado")
         self.btn_delete.setObjectName("dangerButton")
         self.btn_delete.setToolTip("Eliminar los usuarios seleccionados")
         self.btn_delete.clicked.connect(self._on_delete_users)
         buttons_layout.addWidget(self.btn_delete)
-
-        self.table.itemSelectionChanged.connect(self._update_action_buttons)
-
+        
+        self.table.selectionModel().selectionChanged.connect(self._update_action_buttons)
+        
         layout.addLayout(buttons_layout)
     
     def refresh(self):
         """Recarga los datos de la tabla."""
-        db = get_db()
-        try:
-            repo = UserRepository(db)
-            all_users = repo.get_all(include_inactive=True)
+        self._search_cache.clear()
+        self._load_rows({})
+    
+    def refresh_if_stale(self):
+        """Recarga solo si los datos cambiaron desde la última carga."""
+        version = self._data_version()
+        if version == self._rendered_version:
+            return
+        if self.loader.is_loading and version == self._loading_version:
+            return
+        self.refresh()
+    
+    def _data_version(self) -> tuple:
+        """Versión de los datos (incluye la fecha: el estado del plan depende del día)."""
+        return (date.today(),) + get_data_version(*self.DATA_TABLES)
+    
+    def _load_rows(self, filters: dict):
+        """
+        Consulta en segundo plano las filas livianas de usuarios.
+        
+        Si los filtros refinan una búsqueda reciente (por ejemplo, se agregó
+        una letra al apellido) se filtra en memoria el resultado anterior en
+        lugar de consultar la base. El ordenamiento también se hace en el
+        hilo de carga; en la UI solo se reemplazan las filas del modelo. Los
+        toggles de activos/inactivos los aplica el proxy sobre lo cargado.
+        
+        Args:
+            filters: Filtros de búsqueda (ver UserRepository.search_rows)
+        """
+        filters = {key: value for key, value in filters.items() if value}
+        # Lo guardado solo sirve si los datos no cambiaron desde que se cargó
+        version = self._data_version()
+        if version != self._rendered_version:
+            self._search_cache.clear()
+        self._loading_version = version
+        self._pending_members.clear()
+        cached = self._find_cached_rows(filters)
+        # Mantener el orden elegido por el usuario entre recargas
+        header = self.table.horizontalHeader()
+        sort_column, sort_order = header.sortIndicatorSection(), header.sortIndicatorOrder()
+        
+        def query():
+            if cached is not None:
+                matches = user_row_filter(filters)
+                rows = [row for row in cached if matches(row)]
+            else:
+                db = get_db()
+                try:
+                    rows = UserRepository(db).search_rows(**filters)
+                finally:
+                    db.close()
             
-            # Aplicar filtros de activos/inactivos
-            self._users = self._filter_users(all_users)
-            self._populate_table(self._users)
-            self._update_counter()
-        finally:
-            db.close()
+            if sort_column >= 0:
+                return rows, UsersTableModel.sorted_rows(rows, sort_column, sort_order)
+            return rows, rows
+        
+        self.loader.load(query, lambda result: self._apply_rows(filters, *result))
+    
+    def _find_cached_rows(self, filters: dict) -> Optional[List[MemberRow]]:
+        """Devuelve el resultado reciente más chico que contiene al pedido, si hay."""
+        candidates = [
+            rows for cached_filters, rows in self._search_cache
+            if user_filters_refine(cached_filters, filters)
+        ]
+        return min(candidates, key=len) if candidates else None
     
-    def _filter_users(self, users: List[User]) -> List[User]:
-        """Filtra usuarios según los toggles de activos/inactivos."""
-        filtered = []
-        for user in users:
-            if user.activo and not self._show_active:
-                continue
-            if not user.activo and not self._show_inactive:
-                continue
-            filtered.append(user)
-        return filtered
+    def _apply_rows(self, filters: dict, rows: List[MemberRow], sorted_rows: List[MemberRow]):
+        """Carga en el modelo las filas consultadas y guarda el resultado."""
+        self._filters = filters
+        self._search_cache = [entry for entry in self._search_cache if entry[0] != filters]
+        self._search_cache.insert(0, (filters, rows))
+        del self._search_cache[self.SEARCH_CACHE_SIZE:]
+        
+        self.model.set_rows(sorted_rows)
+        for column in self.CONTENT_COLUMNS:
+            self.table.resizeColumnToContents(column)
+        # Socios modificados mientras se consultaba: con eso la tabla queda
+        # al día con todo lo entregado por el bus
+        self._patch_members()
+        self._rendered_version = (date.today(),) + get_change_notifier().delivered_version(*self.DATA_TABLES)
+        self._update_counter()
+        self._update_empty_state()
+    
+    @Slot(object)
+    def _on_members_changed(self, changes: Dict[int, Optional[MemberChange]]):
+        """
+        Anota los socios modificados (incluye a los de accesos permitidos,
+        que cambian sus visitas); se actualizan al final del lote.
+        """
+        self._pending_members.update(changes)
+    
+    @Slot()
+    def _on_members_bulk_changed(self):
+        """
+        Ante un cambio masivo se recarga: ya mismo si la vista está visible
+        o cargando (la carga en curso puede ser anterior al cambio), si no
+        al mostrarse.
+        """
+        self._pending_members.clear()
+        self._rendered_version = None
+        if self.isVisible() or self.loader.is_loading:
+            self._search_cache.clear()
+            self._load_rows(self._filters)
+    
+    @Slot()
+    def _on_changes_flushed(self):
+        """Aplica los cambios del lote y, si estaba al día, da la vista por vigente."""
+        if self.loader.is_loading:
+            return
+        
+        self._patch_members()
+        before, after = get_change_notifier().batch_versions(*self.DATA_TABLES)
+        today = date.today()
+        if self._rendered_version == (today,) + before:
+            self._rendered_version = (today,) + after
+    
+    def _patch_members(self):
+        """
+        Actualiza en el lugar las filas de los socios modificados.
+        
+        Las filas ya llegan releídas por el notificador de cambios; cada
+        una se agrega, reemplaza o quita según cumpla los filtros de la
+        búsqueda actual (el proxy decide además si queda visible según los
+        toggles).
+        """
+        changes, self._pending_members = self._pending_members, {}
+        if not changes:
+            return
+        
+        user_ids = list(changes)
+        rows = [change.member for change in changes.values() if change is not None]
+        self._search_cache.clear()
+        matches = user_row_filter(self._filters)
+        for row in rows:
+            if matches(row):
+                self.model.upsert_row(row)
+        kept = {row.id for row in rows if matches(row)}
+        self.model.remove_ids([user_id for user_id in user_ids if user_id not in kept])
+        
+        self._update_counter()
+        self._update_empty_state()
+    
+    @Slot(bool)
+    def _on_loading_changed(self, loading: bool):
+        """Muestra el estado de carga mientras se consulta."""
+        if loading:
+            self.lbl_counter.setText("Cargando...")
+            if self.proxy.rowCount() == 0:
+                self.content_stack.setCurrentIndex(2)
     
     def _update_counter(self):
         """Actualiza el contador de usuarios mostrados."""
-        count = len(self._users)
+        count = self.proxy.rowCount()
         self.lbl_counter.setText(f"Total: {count}")
-
+    
     def _update_action_buttons(self):
         """Actualiza el estado y texto de los botones según la selección."""
         count = len(self._get_selected_user_ids())
+        self.btn_renew.setEnabled(count > 0)
+        if count > 1:
+            self.btn_renew.setText(f"Renovar {count} Seleccionados")
+            self.btn_renew.setToolTip("Renovar el plan de los usuarios seleccionados")
+        else:
+            self.btn_renew.setText("Renovar")
+            self.btn_renew.setToolTip(
+                "Renovar el plan del usuario seleccionado" if count else "Seleccione los usuarios a renovar"
+            )
         if count > 1:
             self.btn_delete.setText(f"Eliminar {count} Seleccionados")
             self.btn_edit.setEnabled(False)
@@ -189,7 +380,7 @@ class UsersView(QWidget):
         else:
             self.btn_toggle_inactive.setText("Mostrar Inactivos")
         
-        self.refresh()
+        self._apply_estado_filter()
     
     @Slot()
     def _on_toggle_active(self):
@@ -201,104 +392,31 @@ class UsersView(QWidget):
         else:
             self.btn_toggle_active.setText("Mostrar Activos")
         
-        self.refresh()
+        self._apply_estado_filter()
+    
+    def _apply_estado_filter(self):
+        """Filtra activos/inactivos en el proxy, sin consultar la base."""
+        self.proxy.set_estado_filter(self._show_active, self._show_inactive)
+        self._update_counter()
+        self._update_empty_state()
     
     @Slot(dict)
     def _on_search(self, filters: dict):
         """Realiza búsqueda con los filtros proporcionados."""
-        db = get_db()
-        try:
-            repo = UserRepository(db)
-            all_users = repo.search(**filters)
-            self._users = self._filter_users(all_users)
-            self._populate_table(self._users)
-            self._update_counter()
-        finally:
-            db.close()
+        self._load_rows(filters)
     
-    def _populate_table(self, users: List[User]):
-        """
-        Llena la tabla con los usuarios proporcionados.
-        
-        Args:
-            users: Lista de usuarios a mostrar
-        """
-        # Deshabilitar sorting mientras se insertan filas para evitar que Qt
-        # reorganice las filas durante la inserción y mezcle datos entre usuarios
-        self.table.setSortingEnabled(False)
-
-        self.table.setRowCount(0)
-        
-        for user in users:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # ID (oculto)
-            id_item = QTableWidgetItem(str(user.id))
-            self.table.setItem(row, 0, id_item)
-            
-            # Apellido
-            apellido_item = QTableWidgetItem(user.apellido)
-            self.table.setItem(row, 1, apellido_item)
-            
-            # Nombre
-            nombre_item = QTableWidgetItem(user.nombre)
-            self.table.setItem(row, 2, nombre_item)
-            
-            # Email
-            email_item = QTableWidgetItem(user.email or "")
-            self.table.setItem(row, 3, email_item)
-            
-            # Celular
-            celular_item = QTableWidgetItem(user.celular or "")
-            self.table.setItem(row, 4, celular_item)
-            
-            # Membresía
-            plan_item = QTableWidgetItem(user.plan.display_name)
-            self.table.setItem(row, 5, plan_item)
-            
-            # Observaciones
-            obs_item = QTableWidgetItem(user.observaciones or "")
-            self.table.setItem(row, 6, obs_item)
-            
-            # Fecha Fin
-            fecha_item = QTableWidgetItem(formato_fecha(user.fecha_fin_plan))
-            
-            # Colorear según vigencia
-            if not user.plan_vigente:
-                fecha_item.setForeground(QColor("#ff4444"))
-            elif user.dias_restantes <= 7:
-                fecha_item.setForeground(QColor("#ffaa00"))
-            else:
-                fecha_item.setForeground(QColor("#00cc00"))
-            
-            self.table.setItem(row, 7, fecha_item)
-            
-            # Estado
-            estado_text = "Activo" if user.activo else "Inactivo"
-            estado_item = QTableWidgetItem(estado_text)
-            if user.activo:
-                estado_item.setForeground(QColor("#00cc00"))
-            else:
-                estado_item.setForeground(QColor("#ff4444"))
-            self.table.setItem(row, 8, estado_item)
-        
-        # Rehabilitar sorting después de insertar todas las filas
-        self.table.setSortingEnabled(True)
-
-        self.content_stack.setCurrentIndex(0 if self.table.rowCount() > 0 else 1)
+    def _update_empty_state(self):
+        """Muestra la tabla o el mensaje de estado vacío."""
+        self.content_stack.setCurrentIndex(0 if self.proxy.rowCount() > 0 else 1)
     
     def _get_selected_user_ids(self) -> List[int]:
         """Obtiene los IDs de los usuarios seleccionados."""
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
-        
         user_ids = []
-        for row in selected_rows:
-            id_item = self.table.item(row, 0)
-            if id_item:
-                user_ids.append(int(id_item.text()))
+        for proxy_index in self.table.selectionModel().selectedRows(COL_ID):
+            source_index = self.proxy.mapToSource(proxy_index)
+            user_id = self.model.user_id_at(source_index.row())
+            if user_id is not None:
+                user_ids.append(user_id)
         
         return user_ids
     
@@ -319,7 +437,6 @@ class UsersView(QWidget):
     def _on_add_user(self):
         """Abre el diálogo para agregar un nuevo usuario."""
         dialog = UserDialog(parent=self)
-        dialog.user_saved.connect(self.refresh)
         dialog.exec()
     
     @Slot()
@@ -346,9 +463,70 @@ class UsersView(QWidget):
             return
         
         dialog = UserDialog(user=user, parent=self)
-        dialog.user_saved.connect(self.refresh)
         dialog.exec()
     
+    def open_member(self, user_id: int):
+        """
+        Selecciona un socio en la tabla (si está entre las filas mostradas)
+        y abre su edición.
+        
+        Args:
+            user_id: ID del socio
+        """
+        position = self.model.position_of(user_id)
+        if position is not None:
+            proxy_index = self.proxy.mapFromSource(self.model.index(position, 1))
+            if proxy_index.isValid():
+                self.table.selectRow(proxy_index.row())
+                self.table.scrollTo(proxy_index, QAbstractItemView.PositionAtCenter)
+        
+        db = get_db()
+        try:
+            user = UserRepository(db).get_by_id(user_id)
+        finally:
+            db.close()
+        if user is None:
+            return
+        
+        dialog = UserDialog(user=user, parent=self)
+        dialog.exec()
+    
+    @Slot()
+    def _on_renew_users(self):
+        """Renueva el plan de los usuarios seleccionados en una sola operación."""
+        user_ids = self._get_selected_user_ids()
+        if not user_ids:
+            QMessageBox.warning(
+                self,
+                "Selección Requerida",
+                "Seleccione al menos un usuario para renovar.",
+                QMessageBox.Ok
+            )
+            return
+        
+        dialog = RenewDialog(len(user_ids), parent=self)
+        if not dialog.exec():
+            return
+        
+        db = get_db()
+        try:
+            summary = UserRepository(db).renew_plans(user_ids, dialog.plan, dialog.fecha_inicio)
+        finally:
+            db.close()
+        
+        # Las filas se actualizan al recibir los avisos del bus
+        renewed = sum(summary.values())
+        msg = f"Se renovaron {renewed} usuario(s) con el plan {dialog.plan.display_name}."
+        if summary:
+            first, last = min(summary), max(summary)
+            if first == last:
+                msg += f"\n\nNuevo vencimiento: {formato_fecha(first)}"
+            else:
+                msg += f"\n\nNuevos vencimientos: del {formato_fecha(first)} al {formato_fecha(last)}"
+        if renewed < len(user_ids):
+            msg += f"\n\n{len(user_ids) - renewed} usuario(s) ya no existían y no se renovaron."
+        QMessageBox.information(self, "Renovación Completada", msg, QMessageBox.Ok)
+    
     @Slot()
     def _on_delete_users(self):
         """Elimina los usuarios seleccionados."""
@@ -381,13 +559,13 @@ class UsersView(QWidget):
                 for user_id in user_ids:
                     if repo.delete(user_id):
                         deleted += 1
-                
-                QMessageBox.information(
-                    self,
-                    "Eliminación Completada",
-                    f"Se eliminaron {deleted} usuario(s).",
-                    QMessageBox.Ok
-                )
-                self.refresh()
             finally:
                 db.close()
+            
+            # Las filas se quitan al recibir los avisos del bus
+            QMessageBox.information(
+                self,
+                "Eliminación Completada",
+                f"Se eliminaron {deleted} usuario(s).",
+                QMessageBox.Ok
+            )
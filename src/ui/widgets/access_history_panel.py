@@ -0,0 +1,121 @@
+"""
+Panel con el historial de accesos de un usuario.
+"""
+from PySide6.QtWidgets import (
+    QGroupBox, QHBoxLayout, QVBoxLayout, QLabel, QTableView, QTableWidget,
+    QTableWidgetItem, QHeaderView, QAbstractItemView, QStackedWidget
+)
+from PySide6.QtCore import Qt
+
+from src.db.database import get_db
+from src.db.repository import AccessLogRepository
+from src.services.async_loader import AsyncLoader
+from src.ui.models.access_log_table_model import AccessLogTableModel
+from src.ui.widgets.status_delegate import StatusDelegate
+
+
+# Meses del resumen de visitas (incluido el actual)
+HISTORY_MONTHS = 12
+
+
+class AccessHistoryPanel(QGroupBox):
+    """
+    Historial de accesos de un usuario y resumen de visitas por mes.
+    
+    Los registros se cargan por páginas con el mismo modelo del registro
+    de accesos (paginación por clave sobre el índice (user_id, timestamp)):
+    la primera página y el resumen mensual se consultan en segundo plano
+    al crear el panel, y las siguientes se precargan mientras se recorre
+    la tabla. El resumen sale de una consulta de agregación, no de las
+    filas cargadas.
+    """
+    
+    def __init__(self, user_id: int, parent=None):
+        super().__init__("Historial de Accesos", parent)
+        self.user_id = user_id
+        self.loader = AsyncLoader(self)
+        
+        self._setup_ui()
+        self._load()
+    
+    def _setup_ui(self):
+        """Configura la interfaz del panel."""
+        layout = QHBoxLayout(self)
+        
+        # Resumen mensual
+        self.tbl_months = QTableWidget(0, 3)
+        self.tbl_months.setHorizontalHeaderLabels(["Mes", "Visitas", "Denegados"])
+        self.tbl_months.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tbl_months.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tbl_months.verticalHeader().setVisible(False)
+        self.tbl_months.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tbl_months.setFixedWidth(230)
+        layout.addWidget(self.tbl_months)
+        
+        # Registros, paginados
+        self.model = AccessLogTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setColumnHidden(1, True)   # Usuario: siempre el mismo
+        self.table.setItemDelegateForColumn(3, StatusDelegate(bold=True, parent=self.table))
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        header.resizeSection(0, 150)
+        
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.table)             # índice 0
+        
+        self.lbl_status = QLabel("Cargando historial...")
+        self.lbl_status.setObjectName("emptyStateLabel")
+        self.lbl_status.setAlignment(Qt.AlignCenter)
+        self.stack.addWidget(self.lbl_status)        # índice 1
+        self.stack.setCurrentIndex(1)
+        
+        records_layout = QVBoxLayout()
+        records_layout.addWidget(self.stack)
+        layout.addLayout(records_layout, 1)
+        
+        self.setMinimumHeight(240)
+    
+    def _load(self):
+        """Consulta la primera página y el resumen mensual en segundo plano."""
+        filters = {"user_id": self.user_id}
+        model = self.model
+        
+        def query():
+            rows = model.load_page(filters)
+            db = get_db()
+            try:
+                months = AccessLogRepository(db).monthly_visits(self.user_id, HISTORY_MONTHS)
+            finally:
+                db.close()
+            return filters, rows, months
+        
+        self.loader.load(query, self._apply)
+    
+    def _apply(self, result: tuple):
+        """Muestra la primera página y el resumen."""
+        filters, rows, months = result
+        
+        self.tbl_months.setRowCount(len(months))
+        for row, (mes, permitidos, denegados) in enumerate(months):
+            self.tbl_months.setItem(row, 0, QTableWidgetItem(mes))
+            for column, value in ((1, permitidos), (2, denegados)):
+                item = QTableWidgetItem(str(value))
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.tbl_months.setItem(row, column, item)
+        
+        self.model.set_filters(filters, rows)
+        if rows:
+            self.stack.setCurrentIndex(0)
+        else:
+            self.lbl_status.setText("Sin accesos registrados.")
+    
+    def cancel(self):
+        """Descarta la carga en curso (al cerrar el diálogo)."""
+        self.loader.cancel()
@@ -0,0 +1,160 @@
+"""
+Gráfico de barras simple para la vista de analítica.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from PySide6.QtWidgets import QWidget, QToolTip
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QFontMetrics
+
+
+# Colores de las series (los del tema)
+CHART_COLOR_ACCENT = QColor("#f0c020")
+CHART_COLOR_OK = QColor("#00cc00")
+CHART_COLOR_DANGER = QColor("#ff4444")
+
+_TEXT_COLOR = QColor("#aaaaaa")
+_AXIS_COLOR = QColor("#333333")
+
+
+class BarChart(QWidget):
+    """
+    Gráfico de barras, apiladas si hay más de una serie.
+    
+    Se dibuja con QPainter sobre los valores ya agregados, sin depender de
+    QtCharts. Las etiquetas del eje X se espacian para que no se pisen y
+    el valor de cada barra se ve en el tooltip al pasar el mouse.
+    """
+    
+    MARGIN = 8
+    LEGEND_HEIGHT = 18
+    
+    def __init__(self, title: str, parent=None):
+        super().__init__(parent)
+        self._title = title
+        self._labels: List[str] = []
+        self._series: List[Tuple[str, QBrush, List[int]]] = []
+        self._totals: List[int] = []
+        self._message = "Cargando..."
+        
+        self._title_font = QFont("Segoe UI", 11, QFont.Bold)
+        self._text_font = QFont("Segoe UI", 8)
+        self._text_pen = QPen(_TEXT_COLOR)
+        self._axis_pen = QPen(_AXIS_COLOR)
+        
+        self.setMinimumSize(360, 220)
+        self.setMouseTracking(True)
+    
+    def set_data(self, labels: Sequence[str], series: Sequence[Tuple[str, QColor, Sequence[int]]]):
+        """
+        Muestra nuevos valores.
+        
+        Args:
+            labels: Etiqueta de cada barra
+            series: (nombre, color, valores) de cada serie, de abajo hacia arriba
+        """
+        self._labels = list(labels)
+        self._series = [(name, QBrush(color), list(values)) for name, color, values in series]
+        self._totals = [sum(values) for values in zip(*(values for _, _, values in self._series))]
+        self._message = "" if any(self._totals) else "Sin datos para el período."
+        self.update()
+    
+    def set_message(self, message: str):
+        """Reemplaza el gráfico por un mensaje (carga, error)."""
+        self._labels, self._series, self._totals = [], [], []
+        self._message = message
+        self.update()
+    
+    # --- Dibujo ---
+    
+    def _plot_rect(self) -> QRectF:
+        """Área de las barras (sin título, leyenda ni etiquetas)."""
+        text_height = QFontMetrics(self._text_font).height()
+        title_height = QFontMetrics(self._title_font).height()
+        top = self.MARGIN + title_height + self.LEGEND_HEIGHT
+        bottom = self.height() - self.MARGIN - text_height - 4
+        left = self.MARGIN + QFontMetrics(self._text_font).horizontalAdvance(f"{max(self._totals, default=0)}") + 6
+        return QRectF(left, top, max(self.width() - left - self.MARGIN, 1), max(bottom - top, 1))
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        
+        painter.setFont(self._title_font)
+        painter.setPen(CHART_COLOR_ACCENT)
+        painter.drawText(self.MARGIN, self.MARGIN + QFontMetrics(self._title_font).ascent(), self._title)
+        
+        painter.setFont(self._text_font)
+        painter.setPen(self._text_pen)
+        if self._message:
+            painter.drawText(self.rect(), Qt.AlignCenter, self._message)
+            return
+        
+        self._paint_legend(painter)
+        
+        plot = self._plot_rect()
+        peak = max(self._totals) or 1
+        count = len(self._labels)
+        slot = plot.width() / count
+        gap = min(slot * 0.2, 4) if slot > 3 else 0
+        
+        # Eje y valor máximo
+        painter.setPen(self._axis_pen)
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+        painter.setPen(self._text_pen)
+        painter.drawText(
+            QRectF(self.MARGIN, plot.top() - 6, plot.left() - self.MARGIN - 4, 12),
+            Qt.AlignRight | Qt.AlignVCenter, str(max(self._totals))
+        )
+        
+        # Barras
+        painter.setPen(Qt.NoPen)
+        for i in range(count):
+            x = plot.left() + i * slot + gap / 2
+            y = plot.bottom()
+            for _, brush, values in self._series:
+                height = plot.height() * values[i] / peak
+                if height > 0:
+                    painter.fillRect(QRectF(x, y - height, max(slot - gap, 1), height), brush)
+                    y -= height
+        
+        # Etiquetas del eje X, espaciadas para que no se pisen
+        metrics = QFontMetrics(self._text_font)
+        widest = max(metrics.horizontalAdvance(label) for label in self._labels) + 6
+        step = max(1, int(widest / slot) + 1) if slot < widest else 1
+        painter.setPen(self._text_pen)
+        for i in range(0, count, step):
+            x = min(plot.left() + i * slot + slot / 2 - widest / 2, self.width() - widest)
+            rect = QRectF(x, plot.bottom() + 2, widest, metrics.height())
+            painter.drawText(rect, Qt.AlignHCenter | Qt.AlignTop, self._labels[i])
+    
+    def _paint_legend(self, painter: QPainter):
+        """Nombres de las series (solo si hay más de una)."""
+        if len(self._series) < 2:
+            return
+        metrics = QFontMetrics(self._text_font)
+        x = self.MARGIN
+        y = self.MARGIN + QFontMetrics(self._title_font).height() + 2
+        for name, brush, _ in self._series:
+            painter.fillRect(QRectF(x, y + 3, 10, 10), brush)
+            painter.drawText(int(x + 14), int(y + metrics.ascent()), name)
+            x += 14 + metrics.horizontalAdvance(name) + 16
+    
+    # --- Tooltip ---
+    
+    def _bar_at(self, x: float) -> Optional[int]:
+        """Índice de la barra bajo la posición horizontal."""
+        if not self._labels:
+            return None
+        plot = self._plot_rect()
+        if not plot.left() <= x < plot.right():
+            return None
+        return min(int((x - plot.left()) / (plot.width() / len(self._labels))), len(self._labels) - 1)
+    
+    def mouseMoveEvent(self, event):
+        index = self._bar_at(event.position().x())
+        if index is None:
+            QToolTip.hideText()
+            return
+        lines = [self._labels[index]] + [f"{name}: {values[index]}" for name, _, values in self._series]
+        QToolTip.showText(event.globalPosition().toPoint(), "\n".join(lines), self)
@@ -5,12 +5,16 @@ from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QComboBox,
     QPushButton, QLabel
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QFont
 
 from src.utils.enums import PlanType
 
 
+# Espera tras la última tecla antes de buscar (búsqueda mientras se escribe)
+SEARCH_DEBOUNCE_MS = 200
+
+
 class SearchBar(QWidget):
     """Barra de búsqueda con filtros para usuarios."""
     
@@ -21,6 +25,12 @@ class SearchBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("searchContainer")
+        
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(SEARCH_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._on_typing_search)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -44,6 +54,7 @@ class SearchBar(QWidget):
         self.txt_apellido.setPlaceholderText("Apellido")
         self.txt_apellido.setMinimumWidth(100)
         self.txt_apellido.returnPressed.connect(self._on_search)
+        self.txt_apellido.textEdited.connect(self._debounce.start)
         filters_layout.addWidget(self.txt_apellido)
         
         # Nombre
@@ -51,6 +62,7 @@ class SearchBar(QWidget):
         self.txt_nombre.setPlaceholderText("Nombre")
         self.txt_nombre.setMinimumWidth(100)
         self.txt_nombre.returnPressed.connect(self._on_search)
+        self.txt_nombre.textEdited.connect(self._debounce.start)
         filters_layout.addWidget(self.txt_nombre)
         
         # Email
@@ -58,6 +70,7 @@ class SearchBar(QWidget):
         self.txt_email.setPlaceholderText("Email")
         self.txt_email.setMinimumWidth(120)
         self.txt_email.returnPressed.connect(self._on_search)
+        self.txt_email.textEdited.connect(self._debounce.start)
         filters_layout.addWidget(self.txt_email)
         
         # Celular
@@ -65,6 +78,7 @@ class SearchBar(QWidget):
         self.txt_celular.setPlaceholderText("Celular")
         self.txt_celular.setMinimumWidth(100)
         self.txt_celular.returnPressed.connect(self._on_search)
+        self.txt_celular.textEdited.connect(self._debounce.start)
         filters_layout.addWidget(self.txt_celular)
         
         # Membresía (Plan)
@@ -73,6 +87,7 @@ class SearchBar(QWidget):
         for plan in PlanType:
             self.cmb_plan.addItem(plan.display_name, plan)
         self.cmb_plan.setMinimumWidth(100)
+        self.cmb_plan.activated.connect(self._on_search)
         filters_layout.addWidget(self.cmb_plan)
         
         # Observaciones
@@ -80,8 +95,9 @@ class SearchBar(QWidget):
         self.txt_observaciones.setPlaceholderText("Observaciones")
         self.txt_observaciones.setMinimumWidth(120)
         self.txt_observaciones.returnPressed.connect(self._on_search)
+        self.txt_observaciones.textEdited.connect(self._debounce.start)
         filters_layout.addWidget(self.txt_observaciones)
-
+        
         # Botón buscar
         self.btn_buscar = QPushButton("Buscar")
         self.btn_buscar.setMinimumWidth(80)
@@ -99,11 +115,22 @@ class SearchBar(QWidget):
     
     def _on_search(self):
         """Emite señal de búsqueda con los filtros actuales."""
+        self._debounce.stop()
+        filters = self.get_filters()
+        self.search_triggered.emit(filters)
+    
+    def _on_typing_search(self):
+        """
+        Búsqueda mientras se escribe: nombre y apellido por comienzo, con
+        los índices de la base (Enter o Buscar buscan por contenido).
+        """
         filters = self.get_filters()
+        filters["prefijo"] = True
         self.search_triggered.emit(filters)
     
     def _on_clear(self):
         """Limpia todos los filtros."""
+        self._debounce.stop()
         self.txt_nombre.clear()
         self.txt_apellido.clear()
         self.txt_email.clear()
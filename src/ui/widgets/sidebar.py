@@ -16,9 +16,11 @@ class Sidebar(QWidget):
     """Barra lateral con botones de navegación."""
     
     # Señales para navegación
+    panel_clicked = Signal()
     usuarios_clicked = Signal()
     tarjetas_clicked = Signal()
     accesos_clicked = Signal()
+    analitica_clicked = Signal()
     backup_clicked = Signal()
     salir_clicked = Signal()
     
@@ -91,6 +93,11 @@ class Sidebar(QWidget):
         layout.addSpacing(20)
         
         # Botones de navegación
+        self.btn_panel = self._create_nav_button("Panel", "📊")
+        self.btn_panel.setToolTip("Indicadores del día: ingresos, ocupación y vencimientos")
+        self.btn_panel.clicked.connect(self._on_panel_clicked)
+        layout.addWidget(self.btn_panel)
+        
         self.btn_usuarios = self._create_nav_button("Usuarios", "👥")
         self.btn_usuarios.setChecked(True)
         self.btn_usuarios.setToolTip("Ver y gestionar socios del gimnasio")
@@ -106,6 +113,11 @@ class Sidebar(QWidget):
         self.btn_accesos.setToolTip("Historial de entradas y salidas")
         self.btn_accesos.clicked.connect(self._on_accesos_clicked)
         layout.addWidget(self.btn_accesos)
+        
+        self.btn_analitica = self._create_nav_button("Analítica", "📈")
+        self.btn_analitica.setToolTip("Gráficos de accesos, horarios, altas y planes")
+        self.btn_analitica.clicked.connect(self._on_analitica_clicked)
+        layout.addWidget(self.btn_analitica)
 
         # Botón de backup
         self.btn_backup = QPushButton("  💾  Backup DB")
@@ -138,9 +150,17 @@ class Sidebar(QWidget):
     
     def _uncheck_all(self):
         """Desmarca todos los botones."""
+        self.btn_panel.setChecked(False)
         self.btn_usuarios.setChecked(False)
         self.btn_tarjetas.setChecked(False)
         self.btn_accesos.setChecked(False)
+        self.btn_analitica.setChecked(False)
+    
+    def _on_panel_clicked(self):
+        """Maneja clic en botón Panel."""
+        self._uncheck_all()
+        self.btn_panel.setChecked(True)
+        self.panel_clicked.emit()
     
     def _on_usuarios_clicked(self):
         """Maneja clic en botón Usuarios."""
@@ -160,6 +180,12 @@ class Sidebar(QWidget):
         self.btn_accesos.setChecked(True)
         self.accesos_clicked.emit()
     
+    def _on_analitica_clicked(self):
+        """Maneja clic en botón Analítica."""
+        self._uncheck_all()
+        self.btn_analitica.setChecked(True)
+        self.analitica_clicked.emit()
+    
     def select_usuarios(self):
         """Selecciona programáticamente la vista de usuarios."""
         self._on_usuarios_clicked()
@@ -181,3 +207,7 @@ class Sidebar(QWidget):
             self.btn_tarjetas.setChecked(True)
         elif index == 2:
             self.btn_accesos.setChecked(True)
+        elif index == 3:
+            self.btn_panel.setChecked(True)
+        elif index == 4:
+            self.btn_analitica.setChecked(True)
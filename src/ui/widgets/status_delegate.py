@@ -0,0 +1,43 @@
+"""
+Delegado que colorea las celdas de estado de las tablas.
+"""
+from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtGui import QBrush, QColor, QFont, QPalette
+
+from src.ui.models.roles import STATUS_ROLE, STATUS_OK, STATUS_WARNING, STATUS_DANGER
+
+
+# Color del texto de cada estado (compartido por todas las tablas)
+STATUS_BRUSHES = {
+    STATUS_OK: QBrush(QColor("#00cc00")),
+    STATUS_WARNING: QBrush(QColor("#ffaa00")),
+    STATUS_DANGER: QBrush(QColor("#ff4444")),
+}
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """
+    Pinta el texto de una columna con el color de su estado.
+    
+    El modelo solo informa el estado de la celda (STATUS_ROLE, un entero)
+    y el delegado lo traduce a un pincel ya creado: no se construyen
+    colores por celda ni por fila, y el costo de pintar depende de las
+    celdas visibles, no del tamaño de la tabla. Se asigna por columna con
+    setItemDelegateForColumn.
+    """
+    
+    def __init__(self, bold: bool = False, parent=None):
+        super().__init__(parent)
+        self._bold = bold
+        self._font = None   # Fuente en negrita, derivada de la de la tabla
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        brush = STATUS_BRUSHES.get(index.data(STATUS_ROLE))
+        if brush is not None:
+            option.palette.setBrush(QPalette.Text, brush)
+        if self._bold:
+            if self._font is None:
+                self._font = QFont(option.font)
+                self._font.setBold(True)
+            option.font = self._font
@@ -3,7 +3,7 @@ Utilidades para exportación de datos.
 """
 import csv
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Sequence
 from datetime import datetime
 
 
@@ -36,6 +36,35 @@ def export_to_csv(data: List[Dict[str, Any]], filepath: Path, headers: List[str]
         return False
 
 
+def export_rows_to_csv(rows: Iterable[Sequence], filepath: Path, headers: List[str]) -> Optional[int]:
+    """
+    Exporta filas a un archivo CSV a medida que se recorren.
+    
+    A diferencia de export_to_csv no arma la lista completa en memoria:
+    sirve para exportar muchos registros leídos por páginas.
+    
+    Args:
+        rows: Filas con los valores de cada columna, en el orden de headers
+        filepath: Ruta del archivo de salida
+        headers: Lista de cabeceras
+    
+    Returns:
+        Cantidad de filas escritas, o None si hubo un error
+    """
+    try:
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            count = 0
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return count
+    except Exception as e:
+        print(f"Error exportando CSV: {e}")
+        return None
+
+
 def generate_export_filename(prefix: str = "export") -> str:
     """
     Genera un nombre de archivo único para exportación.
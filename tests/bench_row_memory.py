@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria de las filas de socios: objetos ORM contra filas livianas.
+
+No es un test (pytest no lo recolecta): se ejecuta a mano y crea su propia
+base temporal con socios de prueba, sin tocar data/.
+
+Uso:
+    python tests/bench_row_memory.py [--members 50000]
+"""
+import argparse
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Permitir importar src/ al ejecutar el script directamente
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import insert
+
+import src.db.database as database
+from src.db.models import User
+from src.db.repository import UserRepository, USER_ROW_COLUMNS
+from src.utils.enums import PlanType, PaymentMethod
+
+
+APELLIDOS = ("Pérez", "Gómez", "Rodríguez", "Fernández", "López", "Martínez", "García", "Sánchez")
+NOMBRES = ("Ana", "Juan", "María", "Lucas", "Sofía", "Martín", "Julia", "Diego")
+
+
+def seed_members(count: int):
+    """Inserta socios de prueba en la base temporal."""
+    rng = random.Random(1)
+    today = date.today()
+    now = datetime.now()
+    rows = []
+    for i in range(1, count + 1):
+        inicio = today - timedelta(days=rng.randint(0, 400))
+        rows.append({
+            "nombre": rng.choice(NOMBRES),
+            "apellido": f"{rng.choice(APELLIDOS)} {i % 97}",
+            "email": f"socio{i}@mail.com",
+            "celular": f"11{i:08d}",
+            "plan": rng.choice(list(PlanType)),
+            "fecha_inicio_plan": inicio,
+            "fecha_fin_plan": inicio + timedelta(days=rng.choice((30, 91, 182))),
+            "metodo_pago": PaymentMethod.EFECTIVO,
+            "rfid_uid": f"{i:08X}" if i % 3 else None,
+            "activo": True,
+            "created_at": now,
+            "updated_at": now,
+        })
+    db = database.get_db()
+    try:
+        db.execute(insert(User), rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+def measure(name: str, load):
+    """Carga las filas con una sesión propia y muestra la memoria que retienen."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    db = database.get_db()
+    try:
+        rows = load(db)
+        db.expunge_all()   # Los objetos ORM quedan desvinculados, como en una vista
+    finally:
+        db.close()
+    elapsed = (time.perf_counter() - start) * 1000
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(
+        f"{name:28} {len(rows):>7} filas  {retained / 2**20:6.1f} MiB  "
+        f"{retained / len(rows):5.0f} B/fila  carga {elapsed:5.0f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--members", type=int, default=50_000, help="Socios de prueba (default 50000)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_URL = f"sqlite:///{Path(tmp) / 'gym_access.db'}"
+        database.REPORTING_DB_PATH = Path(tmp) / "gym_access_reporting.db"
+        database.init_db()
+        seed_members(args.members)
+        
+        measure("ORM User (get_all)", lambda db: UserRepository(db).get_all())
+        measure("Row de SQLAlchemy", lambda db: db.query(*USER_ROW_COLUMNS).all())
+        measure("tuple", lambda db: [tuple(row) for row in db.query(*USER_ROW_COLUMNS)])
+        measure("MemberRow (search_rows)", lambda db: UserRepository(db).search_rows())
+        
+        database.close_db()
+
+
+if __name__ == "__main__":
+    main()
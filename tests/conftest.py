@@ -0,0 +1,56 @@
+"""
+Fixtures compartidas de los tests.
+"""
+import os
+from collections import Counter
+
+import pytest
+from sqlalchemy import event
+
+import src.db.database as database
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Base de datos vacía en un directorio temporal (y su snapshot de reportes)."""
+    database.close_db()
+    path = tmp_path / "gym_access.db"
+    monkeypatch.setattr(database, "DATABASE_URL", f"sqlite:///{path}")
+    monkeypatch.setattr(database, "REPORTING_DB_PATH", tmp_path / "gym_access_reporting.db")
+    database.init_db()
+    yield path
+    database.close_db()
+
+
+@pytest.fixture
+def db(db_path):
+    """Sesión sobre la base temporal."""
+    session = database.get_db()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(db_path):
+    """
+    Cuenta las sentencias SQL ejecutadas sobre la base, por tipo.
+    
+    El contador se puede vaciar con clear() antes de la operación a medir.
+    """
+    counts = Counter()
+    
+    def count(conn, cursor, statement, parameters, context, executemany):
+        counts[statement.lstrip().split(None, 1)[0].upper()] += 1
+    
+    engine = database.get_engine()
+    event.listen(engine, "before_cursor_execute", count)
+    yield counts
+    event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Aplicación Qt sin ventanas visibles, para probar modelos y vistas."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,90 @@
+"""
+Paginación del registro de accesos (AccessLogTableModel).
+
+Las páginas siguiente y anterior se consultan en segundo plano: pedirlas
+nunca consulta la base en el hilo de la UI.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from PySide6.QtCore import QThreadPool
+from sqlalchemy import event, insert
+
+import src.db.database as database
+from src.db.models import AccessLog
+from src.ui.models.access_log_table_model import AccessLogTableModel
+from src.utils.enums import AccessResult, AccessReason
+
+
+LOGS = 100
+
+
+@pytest.fixture
+def model(qapp, db):
+    start = datetime(2026, 1, 1, 8)
+    db.execute(insert(AccessLog), [
+        {
+            "rfid_uid": f"{i:08X}", "resultado": AccessResult.DENEGADO,
+            "motivo": AccessReason.NO_EXISTE, "timestamp": start + timedelta(minutes=i)
+        }
+        for i in range(LOGS)
+    ])
+    db.commit()
+    
+    model = AccessLogTableModel()
+    model.PAGE_SIZE = 10
+    model.MAX_RESIDENT_ROWS = 30
+    model.set_filters({})
+    yield model
+    QThreadPool.globalInstance().waitForDone()
+
+
+@pytest.fixture
+def gui_queries(db_path):
+    """Sentencias ejecutadas en el hilo de la UI (el de los tests)."""
+    gui, queries = threading.get_ident(), []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == gui:
+            queries.append(statement)
+    
+    engine = database.get_engine()
+    event.listen(engine, "before_cursor_execute", record)
+    yield queries
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _wait(qapp, condition):
+    deadline = time.time() + 5
+    while not condition() and time.time() < deadline:
+        qapp.processEvents()
+    assert condition()
+
+
+def _ids(model) -> list:
+    return [row.id for row in model._rows]
+
+
+def test_paging_never_queries_on_gui_thread(qapp, model, gui_queries):
+    # Hasta el final, pidiendo cada página apenas se agregó la anterior
+    while model.canFetchMore():
+        model.fetchMore()
+        _wait(qapp, lambda: "next" not in model._waiting)
+    ids = _ids(model)
+    assert len(ids) == model.MAX_RESIDENT_ROWS
+    assert ids[-1] == 1 and model.has_previous
+    
+    # Y de vuelta al principio
+    loaded = []
+    model.head_loaded.connect(loaded.append)
+    while model.has_previous:
+        model.fetch_previous()
+        _wait(qapp, lambda: "previous" not in model._waiting)
+    ids = _ids(model)
+    assert ids[0] == LOGS
+    assert ids == sorted(ids, reverse=True) and len(set(ids)) == len(ids)
+    assert sum(loaded) >= LOGS - model.MAX_RESIDENT_ROWS
+    
+    assert gui_queries == []
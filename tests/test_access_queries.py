@@ -0,0 +1,66 @@
+"""
+Consultas del registro de una tarjeta en la puerta (AccessControlService.process_access).
+
+Cada lectura debe resolverse con una búsqueda del socio, el INSERT del
+acceso y, si se permite, un único UPDATE de la asistencia del socio (sin
+relecturas tras el commit).
+"""
+from datetime import date, timedelta
+
+from src.db.repository import UserRepository
+from src.services.access_control import AccessControlService
+from src.utils.enums import AccessResult, AccessReason, PlanType
+
+
+CARD = "AA-BB-CC-DD"
+
+
+def _create_member(db, fecha_inicio_plan: date, activo: bool = True):
+    return UserRepository(db).create(
+        nombre="Ana",
+        apellido="Gómez",
+        plan=PlanType.MENSUAL,
+        fecha_inicio_plan=fecha_inicio_plan,
+        rfid_uid=CARD,
+        activo=activo
+    )
+
+
+def test_permitted_tap_is_select_insert_update(db, statements):
+    _create_member(db, date.today())
+    statements.clear()
+    
+    result = AccessControlService().process_access(CARD)
+    
+    assert result.resultado == AccessResult.PERMITIDO
+    assert statements == {"SELECT": 1, "INSERT": 1, "UPDATE": 1}
+
+
+def test_denied_tap_is_select_insert(db, statements):
+    # Plan vencido: se busca el socio y se registra el acceso, sin tocar al socio
+    _create_member(db, date.today() - timedelta(days=90))
+    statements.clear()
+    
+    result = AccessControlService().process_access(CARD)
+    
+    assert result.motivo == AccessReason.VENCIDO
+    assert statements == {"SELECT": 1, "INSERT": 1}
+
+
+def test_unknown_card_is_select_insert(db, statements):
+    result = AccessControlService().process_access("11-22-33-44")
+    
+    assert result.motivo == AccessReason.NO_EXISTE
+    assert statements == {"SELECT": 1, "INSERT": 1}
+
+
+def test_repeated_taps_keep_the_same_count(db, statements):
+    # Las sesiones y conexiones reutilizadas no agregan consultas
+    _create_member(db, date.today())
+    AccessControlService().process_access(CARD)
+    statements.clear()
+    
+    for _ in range(5):
+        AccessControlService().process_access(CARD)
+    
+    assert statements == {"SELECT": 5, "INSERT": 5, "UPDATE": 5}
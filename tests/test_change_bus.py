@@ -0,0 +1,89 @@
+"""
+Bus de cambios de la base (src/db/change_bus.py) y relectura de socios modificados.
+
+El bus no depende de Qt: sin oyente solo incrementa las versiones de
+datos y con oyente agrupa las publicaciones en lotes.
+"""
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+from src.db.change_bus import ChangeBus, MEMBER_EVENTS_MAX
+from src.db.database import get_data_version
+from src.db.models import User
+from src.db.repository import UserRepository
+from src.utils.enums import PlanType
+
+
+def test_without_listener_only_bumps_versions():
+    bus = ChangeBus()
+    before = get_data_version(User.__tablename__)
+    
+    bus.publish_member_changed(1)
+    
+    assert get_data_version(User.__tablename__) != before
+    assert bus.take_batch() is None
+
+
+def test_listener_is_called_once_per_batch():
+    bus = ChangeBus()
+    calls = []
+    bus.set_listener(lambda: calls.append(1))
+    
+    bus.publish_member_changed(1)
+    bus.publish_member_changed(2)
+    bus.publish_member_changed(1)
+    batch = bus.take_batch()
+    
+    assert calls == [1]
+    assert batch.member_ids == [1, 2]
+    assert not batch.bulk
+    assert bus.take_batch() is None
+    
+    bus.publish_member_changed(3)
+    assert calls == [1, 1]
+
+
+def test_many_members_become_bulk():
+    bus = ChangeBus()
+    bus.set_listener(lambda: None)
+    
+    for user_id in range(MEMBER_EVENTS_MAX + 1):
+        bus.publish_member_changed(user_id)
+    batch = bus.take_batch()
+    
+    assert batch.bulk
+    assert batch.member_ids == []
+
+
+def test_member_changes_is_one_query(db, statements):
+    repo = UserRepository(db)
+    with_card = repo.create(
+        nombre="Ana", apellido="Gómez", plan=PlanType.MENSUAL,
+        fecha_inicio_plan=date.today(), rfid_uid="AA-BB-CC-DD"
+    ).id
+    without_card = repo.create(
+        nombre="Juan", apellido="Pérez", plan=PlanType.MENSUAL,
+        fecha_inicio_plan=date.today()
+    ).id
+    statements.clear()
+    
+    changes = repo.member_changes([with_card, without_card, 999])
+    
+    assert statements == {"SELECT": 1}
+    assert set(changes) == {with_card, without_card}
+    assert changes[with_card].member.apellido == "Gómez"
+    assert changes[with_card].quick.rfid_uid == "AA-BB-CC-DD"
+    assert changes[with_card].card.rfid_uid == "AA-BB-CC-DD"
+    assert changes[without_card].card is None
+
+
+def test_repository_imports_without_qt():
+    # Con PySide6 bloqueado, la capa de datos (y el ETL) se importa igual
+    code = "import sys; sys.modules['PySide6'] = None; import src.db.repository, etl.extract_to_csv"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,160 @@
+"""
+Renovación masiva de planes (UserRepository.renew_plans).
+"""
+from datetime import date, timedelta
+
+import pytest
+
+import src.db.database as database
+import src.db.repository as repository
+from src.db.models import User
+from src.db.repository import UserRepository
+from src.utils.dates import calcular_fecha_fin
+from src.utils.enums import PlanType
+
+
+class _RecordingBus:
+    """Registra los socios publicados en lugar de avisar a la UI."""
+    
+    def __init__(self):
+        self.member_ids = []
+    
+    def publish_member_changed(self, user_id: int, logs_changed: bool = False):
+        self.member_ids.append(user_id)
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    recorder = _RecordingBus()
+    monkeypatch.setattr(repository, "get_change_bus", lambda: recorder)
+    return recorder
+
+
+def _create_member(db, fecha_inicio_plan: date, activo: bool = True) -> int:
+    return UserRepository(db).create(
+        nombre="Socio",
+        apellido=f"Inicio {fecha_inicio_plan}",
+        plan=PlanType.MENSUAL,
+        fecha_inicio_plan=fecha_inicio_plan,
+        activo=activo
+    ).id
+
+
+def _reload(db, user_id: int):
+    db.expire_all()
+    return UserRepository(db).get_by_id(user_id)
+
+
+def test_extend_expired_member_starts_today(db, bus):
+    # Venció hace meses y el control de vencidos ya lo desactivó
+    user_id = _create_member(db, date.today() - timedelta(days=200), activo=False)
+    today = date.today()
+    
+    summary = UserRepository(db).renew_plans([user_id], PlanType.X3)
+    
+    user = _reload(db, user_id)
+    assert user.fecha_inicio_plan == today
+    assert user.fecha_fin_plan == calcular_fecha_fin(today, PlanType.X3)
+    assert user.plan == PlanType.X3
+    assert user.activo
+    assert user.plan_vigente
+    assert summary == {user.fecha_fin_plan: 1}
+
+
+def test_extend_current_member_starts_at_current_end(db, bus):
+    user_id = _create_member(db, date.today() - timedelta(days=10))
+    current_end = _reload(db, user_id).fecha_fin_plan
+    
+    UserRepository(db).renew_plans([user_id], PlanType.MENSUAL)
+    
+    user = _reload(db, user_id)
+    assert user.fecha_inicio_plan == current_end
+    assert user.fecha_fin_plan == calcular_fecha_fin(current_end, PlanType.MENSUAL)
+    assert user.activo
+
+
+def test_extend_mixed_members_in_one_call(db, bus):
+    expired = _create_member(db, date.today() - timedelta(days=400), activo=False)
+    current = _create_member(db, date.today())
+    current_end = _reload(db, current).fecha_fin_plan
+    
+    summary = UserRepository(db).renew_plans([expired, current], PlanType.X6)
+    
+    assert _reload(db, expired).fecha_fin_plan == calcular_fecha_fin(date.today(), PlanType.X6)
+    assert _reload(db, current).fecha_fin_plan == calcular_fecha_fin(current_end, PlanType.X6)
+    assert sum(summary.values()) == 2
+
+
+def test_fixed_start_in_the_past_does_not_reactivate(db, bus):
+    user_id = _create_member(db, date.today() - timedelta(days=200), activo=False)
+    start = date.today() - timedelta(days=100)
+    
+    UserRepository(db).renew_plans([user_id], PlanType.MENSUAL, start)
+    
+    user = _reload(db, user_id)
+    assert user.fecha_fin_plan == calcular_fecha_fin(start, PlanType.MENSUAL)
+    assert not user.activo
+
+
+def test_fixed_start_reactivates(db, bus):
+    user_id = _create_member(db, date.today() - timedelta(days=200), activo=False)
+    
+    UserRepository(db).renew_plans([user_id], PlanType.MENSUAL, date.today())
+    
+    assert _reload(db, user_id).activo
+
+
+def test_publishes_only_renewed_members(db, bus):
+    user_id = _create_member(db, date.today())
+    missing_id = user_id + 1000
+    bus.member_ids.clear()
+    
+    summary = UserRepository(db).renew_plans([user_id, missing_id], PlanType.MENSUAL)
+    
+    assert bus.member_ids == [user_id]
+    assert sum(summary.values()) == 1
+
+
+def test_end_date_computed_once_per_distinct_start(db, bus, monkeypatch):
+    calls = []
+    
+    def counting(fecha_inicio, plan_type):
+        calls.append(fecha_inicio)
+        return calcular_fecha_fin(fecha_inicio, plan_type)
+    
+    monkeypatch.setattr(repository, "calcular_fecha_fin", counting)
+    # Tres vencidos (todos arrancan hoy) y dos con el mismo vencimiento futuro
+    user_ids = [_create_member(db, date.today() - timedelta(days=100 + i)) for i in range(3)]
+    user_ids += [_create_member(db, date.today()) for _ in range(2)]
+    calls.clear()
+    
+    UserRepository(db).renew_plans(user_ids, PlanType.X3)
+    
+    assert len(calls) == 2
+
+
+def test_member_changed_meanwhile_is_not_counted(db, bus, monkeypatch):
+    kept = _create_member(db, date.today())
+    changed = _create_member(db, date.today() + timedelta(days=3))
+    changed_end = date.today() + timedelta(days=90)
+    bus.member_ids.clear()
+    
+    def change_then_calculate(fecha_inicio, plan_type):
+        # Otro puesto cambia el vencimiento entre la lectura y el UPDATE
+        if not hasattr(change_then_calculate, "done"):
+            change_then_calculate.done = True
+            other = database.get_db()
+            try:
+                other.get(User, changed).fecha_fin_plan = changed_end
+                other.commit()
+            finally:
+                other.close()
+        return calcular_fecha_fin(fecha_inicio, plan_type)
+    
+    monkeypatch.setattr(repository, "calcular_fecha_fin", change_then_calculate)
+    
+    summary = UserRepository(db).renew_plans([kept, changed], PlanType.MENSUAL)
+    
+    assert bus.member_ids == [kept]
+    assert summary == {_reload(db, kept).fecha_fin_plan: 1}
+    assert _reload(db, changed).fecha_fin_plan == changed_end
@@ -0,0 +1,58 @@
+"""
+Búsqueda de usuarios por nombre y apellido (UserRepository.search / search_rows).
+
+Por defecto buscan por contenido; con prefijo=True (búsqueda mientras se
+escribe) por comienzo. El filtro en memoria de la vista debe coincidir
+con el de la base.
+"""
+from datetime import date
+
+import pytest
+
+from src.db.repository import UserRepository, user_filters_refine, user_row_filter
+from src.utils.enums import PlanType
+
+
+@pytest.fixture
+def repo(db):
+    repo = UserRepository(db)
+    for nombre, apellido in (("Ana", "Rodríguez González"), ("Juan", "González"), ("Lucía", "Pérez")):
+        repo.create(nombre=nombre, apellido=apellido, plan=PlanType.MENSUAL, fecha_inicio_plan=date.today())
+    return repo
+
+
+def _apellidos(rows) -> list:
+    return sorted(row.apellido for row in rows)
+
+
+def test_search_matches_substring_by_default(repo):
+    assert _apellidos(repo.search(apellido="gonz")) == ["González", "Rodríguez González"]
+    assert _apellidos(repo.search_rows(apellido="GONZ")) == ["González", "Rodríguez González"]
+    assert _apellidos(repo.search_rows(nombre="uc")) == ["Pérez"]
+
+
+def test_prefix_search_matches_start_only(repo):
+    assert _apellidos(repo.search_rows(apellido="gonz", prefijo=True)) == ["González"]
+    assert _apellidos(repo.search_rows(apellido="rod", prefijo=True)) == ["Rodríguez González"]
+    assert repo.search_rows(nombre="uc", prefijo=True) == []
+
+
+@pytest.mark.parametrize("filters", [
+    {"apellido": "gonz"},
+    {"apellido": "gonz", "prefijo": True},
+    {"nombre": "a"},
+    {"nombre": "a", "prefijo": True},
+])
+def test_row_filter_matches_database(repo, filters):
+    everyone = repo.search_rows()
+    matches = user_row_filter(filters)
+    assert [row for row in everyone if matches(row)] == repo.search_rows(**filters)
+
+
+def test_prefix_results_do_not_refine_into_substring_search():
+    assert user_filters_refine({"apellido": "gon", "prefijo": True}, {"apellido": "gonz", "prefijo": True})
+    assert user_filters_refine({"apellido": "gon"}, {"apellido": "gonz", "prefijo": True})
+    assert user_filters_refine({"apellido": "gon"}, {"apellido": "gonz"})
+    # Lo encontrado por comienzo no alcanza para buscar por contenido
+    assert not user_filters_refine({"apellido": "gon", "prefijo": True}, {"apellido": "gon"})
+    assert not user_filters_refine({"apellido": "gon", "prefijo": True}, {"apellido": "gonz"})
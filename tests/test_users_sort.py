@@ -0,0 +1,45 @@
+"""
+Ordenamiento de la tabla de usuarios: la selección sigue al usuario.
+"""
+from datetime import date, timedelta
+
+import pytest
+from PySide6.QtCore import Qt
+
+from src.db.rows import MemberRow
+from src.ui.models.users_table_model import COL_APELLIDO, COL_ID
+from src.ui.views.users_view import UsersView
+from src.utils.enums import PlanType
+
+
+APELLIDOS = ("Díaz", "Acosta", "Benítez", "Castro", "Álvarez")
+
+
+@pytest.fixture
+def view(qapp, db_path):
+    view = UsersView()
+    fecha_fin = date.today() + timedelta(days=30)
+    rows = [
+        MemberRow(user_id, apellido, "Socio", None, None, PlanType.MENSUAL, None, fecha_fin, None, 0, True)
+        for user_id, apellido in enumerate(APELLIDOS, start=1)
+    ]
+    view._apply_rows({}, rows, rows)
+    yield view
+    view.deleteLater()
+
+
+def _select(view, user_id: int):
+    source_row = view.model.position_of(user_id)
+    proxy_row = view.proxy.mapFromSource(view.model.index(source_row, COL_ID)).row()
+    view.table.selectRow(proxy_row)
+
+
+@pytest.mark.parametrize("order", [Qt.AscendingOrder, Qt.DescendingOrder])
+def test_selection_follows_member_when_sorting(view, order):
+    _select(view, 4)
+    assert view._get_selected_user_ids() == [4]
+    
+    view.table.sortByColumn(COL_APELLIDO, order)
+    
+    assert view.model.user_id_at(0) == (2 if order == Qt.AscendingOrder else 5)
+    assert view._get_selected_user_ids() == [4]